@@ -27,84 +27,149 @@ THE SOFTWARE.
 
 __version__ = "1.3.0"
 
-from typing import Callable, Dict, List, Optional, Tuple
+import builtins
+from datetime import datetime
+from decimal import Decimal
+from typing import List, Optional, Tuple, Union
 
-from http_sf.dictionary import parse_dictionary, ser_dictionary
+from http_sf.aio import aparse_lines
+from http_sf.batch import parse_many
+from http_sf.cache import ParseCache, SerCache, SerializedField, ser_cached
 from http_sf.errors import StructuredFieldError
-from http_sf.item import parse_item, ser_item
-from http_sf.list import parse_list, ser_list
+from http_sf.field import parse_field, parse_field_lines, ser_field
+from http_sf.headers import StructuredHeaders
+from http_sf.incremental import IncrementalParser
+from http_sf.lazy import LazyDictionary, LazyList, parse_lazy
+from http_sf.query import contains_token, get_member
 from http_sf.retrofit import retrofit
+from http_sf.schema import FieldSchema, MemberSchema, compile_schema
 from http_sf.state import ParserState
+from http_sf.token import register_tokens
 from http_sf.types import (
+    BufferType,
+    BytesTypeType,
+    DateTypeType,
+    DecimalTypeType,
     DictionaryType,
     DisplayString,
+    EpochDate,
+    InnerList,
     InnerListType,
+    Item,
     ItemType,
+    LazyBytes,
+    LazyDate,
     ListType,
+    Milli,
     OnDuplicateKeyType,
+    Params,
     StructuredType,
     Token,
 )
-from http_sf.util import discard_ows, from_json, to_json
+from http_sf.util import from_json, register_keys, to_json
+from http_sf.writer import ser_bytes, ser_into
 
 __all__ = [
     "parse",
+    "parse_many",
+    "aparse_lines",
+    "parse_lazy",
+    "IncrementalParser",
+    "get_member",
+    "contains_token",
+    "FieldSchema",
+    "MemberSchema",
+    "compile_schema",
     "ser",
+    "ser_into",
+    "ser_bytes",
+    "ser_cached",
+    "register_keys",
+    "register_tokens",
     "to_json",
     "from_json",
     "StructuredFieldError",
     "StructuredType",
+    "BufferType",
     "DictionaryType",
     "ListType",
     "ItemType",
     "InnerListType",
     "Token",
     "DisplayString",
+    "Item",
+    "InnerList",
+    "Params",
+    "Milli",
+    "EpochDate",
+    "LazyDate",
+    "LazyBytes",
     "OnDuplicateKeyType",
+    "ParseCache",
+    "SerCache",
+    "SerializedField",
+    "LazyDictionary",
+    "LazyList",
+    "StructuredHeaders",
 ]
 
 
-def parse(
-    value: bytes,
+# the decoding options stay separate keywords, matching ParserState and existing calls
+def parse(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    value: Union[BufferType, List[BufferType], Tuple[BufferType, ...]],
     name: Optional[str] = None,
     tltype: Optional[str] = None,
     on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+    cache: Optional[ParseCache] = None,
+    start: int = 0,
+    end: Optional[int] = None,
+    compact: bool = False,
+    decimal_type: DecimalTypeType = Decimal,
+    date_type: DateTypeType = datetime,
+    bytes_type: BytesTypeType = bytes,
 ) -> StructuredType:
-    structure: StructuredType
     if name is not None:
         tltype = retrofit.get(name.lower(), tltype)
-    state = ParserState(value)
-    discard_ows(state)
-    try:
-        if tltype in ["dict", "dictionary"]:
-            structure = parse_dictionary(state, on_duplicate_key)
-        elif tltype == "list":
-            structure = parse_list(state, on_duplicate_key)
-        elif tltype == "item":
-            structure = parse_item(state, on_duplicate_key)
-        else:
-            raise KeyError("unrecognised top-level type")
-        discard_ows(state)
-        if state.has_data():
-            raise StructuredFieldError(
-                "Trailing characters after value (missing comma?)",
-                position=state.cursor,
-                offending_char=state.data[state.cursor],
-            )
-        return structure
-    except StructuredFieldError as why:
-        if why.position is None:
-            why.position = state.cursor
-            try:
-                why.offending_char = state.data[state.cursor]
-            except IndexError:
-                why.offending_char = None
-        raise why
+    if isinstance(value, (builtins.list, tuple)):  # list is http_sf.list here
+        if start or end is not None:
+            raise ValueError("start and end can't be used with several field lines")
+        states = [
+            ParserState(line, 0, None, compact, decimal_type, date_type, bytes_type)
+            for line in value
+        ]
+        if not states:
+            raise ValueError("No field lines")
+        return parse_field_lines(states, tltype, on_duplicate_key)
+    state = ParserState(value, start, end, compact, decimal_type, date_type, bytes_type)
+    if cache is None or not cache.admits(state.data):
+        return parse_field(state, tltype, on_duplicate_key)
+    # parse the copy, so that cached LazyBytes don't refer to the caller's buffer
+    state.data = bytes(state.data)
+    key = (
+        state.data,
+        tltype,
+        on_duplicate_key,
+        compact,
+        decimal_type,
+        date_type,
+        bytes_type,
+    )
+    cached = cache.get(key, on_duplicate_key)
+    if cached is not None:
+        return cached
+    duplicates: List[Tuple[str, str]] = []
 
+    def record_duplicate(dup_key: str, context: str) -> None:
+        duplicates.append((dup_key, context))
+        if on_duplicate_key is not None:
+            on_duplicate_key(dup_key, context)
 
-def ser(structure: StructuredType) -> str:
-    if isinstance(structure, Dict):
-        return ser_dictionary(structure)
-    if isinstance(structure, List):
-        return ser_list(structure)
-    return ser_item(structure)
+    structure = parse_field(
+        state, tltype, record_duplicate if on_duplicate_key else None
+    )
+    cache.put(key, structure, duplicates)
+    return structure
+
+
+def ser(structure: StructuredType, validate: bool = True) -> str:
+    return ser_field(structure, validate)
@@ -2,73 +2,136 @@
 
 import argparse
 import sys
+from typing import Any, Dict, List, Optional
 
-from . import parse, to_json
+from . import StructuredFieldError, parse, to_json
+from .batch import parse_lines
+from .bulk import main as bulk_main
 
-parser = argparse.ArgumentParser(
-    description="Validate and show data model of a Structured Field Value."
-)
-structure = parser.add_mutually_exclusive_group(required=True)
-structure.add_argument(
-    "-d",
-    "--dictionary",
-    dest="field_type",
-    action="store_const",
-    const="dictionary",
-    help="Dictionary field",
-)
-structure.add_argument(
-    "-l",
-    "--list",
-    dest="field_type",
-    action="store_const",
-    const="list",
-    help="List field",
-)
-structure.add_argument(
-    "-i",
-    "--item",
-    dest="field_type",
-    action="store_const",
-    const="item",
-    help="Item field",
-)
-structure.add_argument(
-    "-n",
-    "--name",
-    dest="field_name",
-    action="store",
-    help="Field name",
-)
 
-input_source = parser.add_mutually_exclusive_group(required=True)
-input_source.add_argument(
-    "input_string",
-    nargs="?",
-    help="The (textual) structured field value. Do not include the field name.",
-)
-input_source.add_argument(
-    "--stdin",
-    dest="stdin",
-    action="store_true",
-    help="Read the structured field value from STDIN.",
-)
+def main(argv: Optional[List[str]] = None) -> int:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["bulk"]:
+        return bulk_main(argv[1:])
 
-args = parser.parse_args()
+    parser = argparse.ArgumentParser(
+        description="Validate and show data model of a Structured Field Value.",
+        epilog="Use 'bulk' as the first argument to process HAR and NDJSON files.",
+    )
+    structure = parser.add_mutually_exclusive_group()
+    structure.add_argument(
+        "-d",
+        "--dictionary",
+        dest="field_type",
+        action="store_const",
+        const="dictionary",
+        help="Dictionary field",
+    )
+    structure.add_argument(
+        "-l",
+        "--list",
+        dest="field_type",
+        action="store_const",
+        const="list",
+        help="List field",
+    )
+    structure.add_argument(
+        "-i",
+        "--item",
+        dest="field_type",
+        action="store_const",
+        const="item",
+        help="Item field",
+    )
+    structure.add_argument(
+        "-n",
+        "--name",
+        dest="field_name",
+        action="store",
+        help="Field name",
+    )
 
-if args.stdin:
-    input_string = sys.stdin.read()
-else:
-    input_string = args.input_string
+    parser.add_argument(
+        "--named",
+        dest="named",
+        action="store_true",
+        help="Each input line is 'name: value' (with --lines); -d, -l or -i "
+        "gives the type of fields with unknown names",
+    )
 
-try:
-    input_bytes = input_string.encode("utf-8")
-    if args.field_type:
-        field = parse(input_bytes, tltype=args.field_type)
+    input_source = parser.add_mutually_exclusive_group(required=True)
+    input_source.add_argument(
+        "input_string",
+        nargs="?",
+        help="The (textual) structured field value. Do not include the field name.",
+    )
+    input_source.add_argument(
+        "--stdin",
+        dest="stdin",
+        action="store_true",
+        help="Read the structured field value from STDIN.",
+    )
+    input_source.add_argument(
+        "--lines",
+        dest="lines",
+        action="store_true",
+        help="Read one value per line from STDIN, and write one JSON object per line.",
+    )
+
+    args = parser.parse_args(argv)
+    if args.named:
+        if not args.lines:
+            parser.error("--named requires --lines")
+        if args.field_name:
+            parser.error("--named can't be used with -n/--name")
+    elif not (args.field_type or args.field_name):
+        parser.error(
+            "one of -d/--dictionary, -l/--list, -i/--item or -n/--name is required"
+        )
+
+    if args.lines:
+        return stream_lines(args.field_name, args.field_type, args.named)
+
+    if args.stdin:
+        input_string = sys.stdin.read()
     else:
-        field = parse(input_bytes, name=args.field_name)
-    print(to_json(field, sort_keys=True, indent=4))
-except ValueError as why:
-    sys.stderr.write(f"VALUE: {input_string.strip()}\n")
-    sys.stderr.write(f"FAIL: {why}\n")
-    sys.exit(1)
+        input_string = args.input_string
+
+    try:
+        input_bytes = input_string.encode("utf-8")
+        if args.field_type:
+            field = parse(input_bytes, tltype=args.field_type)
+        else:
+            field = parse(input_bytes, name=args.field_name)
+        print(to_json(field, sort_keys=True, indent=4))
+    except ValueError as why:
+        sys.stderr.write(f"VALUE: {input_string.strip()}\n")
+        sys.stderr.write(f"FAIL: {why}\n")
+        return 1
+    return 0
+
+
+def stream_lines(
+    field_name: Optional[str], field_type: Optional[str], named: bool
+) -> int:
+    batch_size = 1 if sys.stdin.isatty() else 1000
+    for name, value, result in parse_lines(
+        sys.stdin.buffer, field_name, field_type, named, batch_size
+    ):
+        record: Dict[str, Any] = {"value": value.decode("utf-8", "replace")}
+        if named:
+            record["name"] = name
+        if isinstance(result, StructuredFieldError):
+            record["error"] = str(result)
+            record["position"] = result.position
+        elif isinstance(result, Exception):
+            record["error"] = f"Unknown field type for {name}"
+        else:
+            record["result"] = result
+        sys.stdout.write(f"{to_json(record, sort_keys=True)}\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
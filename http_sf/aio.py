@@ -0,0 +1,83 @@
+"""
+Parsing lines from an asyncio stream.
+"""
+
+from typing import TYPE_CHECKING, Any, AsyncIterator, List, Optional, Tuple
+
+from .batch import BatchResultType, parse_lines
+
+if TYPE_CHECKING:
+    import asyncio
+    from concurrent.futures import Executor
+
+LineResultType = Tuple[Optional[str], bytes, BatchResultType]
+END = object()
+
+
+def _parse_batch(
+    batch: List[bytes], name: Optional[str], tltype: Optional[str], named: bool
+) -> List[LineResultType]:
+    return list(parse_lines(batch, name, tltype, named, len(batch)))
+
+
+async def aparse_lines(
+    reader: "asyncio.StreamReader",
+    name: Optional[str] = None,
+    tltype: Optional[str] = None,
+    named: bool = False,
+    batch_size: int = 1000,
+    offload_size: int = 100,
+    queue_size: int = 4,
+    executor: Optional["Executor"] = None,
+) -> AsyncIterator[LineResultType]:
+    """
+    Parse the lines read from reader as parse_lines() does, yielding
+    (name, value, result) tuples.
+
+    Lines are read and parsed in batches of batch_size (or fewer, at the end
+    of the stream); batches with at least offload_size lines are parsed in
+    executor (by default, the event loop's), so that the loop isn't blocked.
+    At most queue_size parsed batches are held for the consumer; after that,
+    reading stops until it catches up.
+    """
+    # asyncio is slow to import, so only do so when it's used
+    import asyncio  # pylint: disable=import-outside-toplevel,redefined-outer-name
+
+    loop = asyncio.get_running_loop()
+    queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size)
+
+    async def produce() -> None:
+        try:
+            while True:
+                batch: List[bytes] = []
+                while len(batch) < batch_size:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    batch.append(line)
+                if len(batch) >= offload_size:
+                    await queue.put(
+                        await loop.run_in_executor(
+                            executor, _parse_batch, batch, name, tltype, named
+                        )
+                    )
+                elif batch:
+                    await queue.put(_parse_batch(batch, name, tltype, named))
+                if len(batch) < batch_size:
+                    await queue.put(END)
+                    return
+        except Exception as why:  # pylint: disable=broad-except
+            await queue.put(why)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            results = await queue.get()
+            if results is END:
+                return
+            if isinstance(results, Exception):
+                raise results
+            for result in results:
+                yield result
+    finally:
+        producer.cancel()
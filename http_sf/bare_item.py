@@ -10,7 +10,15 @@ from http_sf.display_string import parse_display_string, ser_display_string
 from http_sf.integer import NUMBER_START_CHARS, parse_number, ser_integer
 from http_sf.string import DQUOTE, parse_string, ser_string
 from http_sf.token import TOKEN_START_CHARS, parse_token, ser_token
-from http_sf.types import BareItemType, DisplayString, Token
+from http_sf.types import (
+    BareItemType,
+    DisplayString,
+    EpochDate,
+    LazyBytes,
+    LazyDate,
+    Milli,
+    Token,
+)
 
 from .errors import StructuredFieldError
 from .state import ParserState
@@ -66,16 +74,28 @@ _ser_map: Dict[Type[Any], Callable[[Any], str]] = {
     str: ser_string,
     bool: ser_boolean,
     bytes: ser_byteseq,
+    Token: ser_token,
+    DisplayString: ser_display_string,
+    Milli: ser_decimal,
+    EpochDate: ser_date,
+    LazyDate: ser_date,
+    LazyBytes: ser_byteseq,
+}
+_trusted_ser_map: Dict[Type[Any], Callable[[Any, bool], str]] = {
+    str: ser_string,
+    Token: ser_token,
 }
 
 
-def ser_bare_item(item: BareItemType) -> str:
+def ser_bare_item(item: BareItemType, validate: bool = True) -> str:
+    if not validate and type(item) in _trusted_ser_map:
+        return _trusted_ser_map[type(item)](item, validate)
     try:
         return _ser_map[type(item)](item)
     except KeyError:
         pass
     if isinstance(item, Token):
-        return ser_token(item)
+        return ser_token(item, validate)
     if isinstance(item, Decimal):
         return ser_decimal(item)
     if isinstance(item, datetime):
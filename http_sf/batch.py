@@ -0,0 +1,114 @@
+from itertools import islice, repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .cache import copy_structure
+from .errors import StructuredFieldError
+from .field import parse_field
+from .retrofit import retrofit
+from .state import ParserState
+from .types import StructuredType
+
+BatchResultType = Union[StructuredType, StructuredFieldError, KeyError]
+
+
+def parse_many(
+    values: Iterable[Union[bytes, Tuple[Optional[str], bytes]]],
+    name: Optional[str] = None,
+    tltype: Optional[str] = None,
+    dedupe: bool = False,
+) -> List[BatchResultType]:
+    """
+    Parse a batch of field values, returning a list with either the parsed
+    structure or the exception for each one, in order.
+
+    Each member of values can be a field value, or a (name, value) tuple to
+    give its field name; name and tltype are used otherwise. If dedupe is
+    true, identical values that parse successfully are only parsed once per
+    batch; this helps when values repeat often.
+    """
+    results: List[BatchResultType] = []
+    default_type = tltype if name is None else retrofit.get(name.lower(), tltype)
+    types: Dict[Optional[str], Optional[str]] = {}
+    seen: Dict[Tuple[Optional[str], bytes], StructuredType] = {}
+    shared = ParserState(b"")
+    for value in values:
+        field_type = default_type
+        if isinstance(value, tuple):
+            field_name, value = value
+            try:
+                field_type = types[field_name]
+            except KeyError:
+                field_type = tltype
+                if field_name is not None:
+                    field_type = retrofit.get(field_name.lower(), tltype)
+                types[field_name] = field_type
+        if dedupe:
+            key = (field_type, value if isinstance(value, bytes) else bytes(value))
+            if key in seen:
+                results.append(copy_structure(seen[key]))
+                continue
+        if isinstance(value, bytes):
+            state = shared
+            state.data = value
+            state.cursor = 0
+        else:
+            state = ParserState(value)
+        try:
+            result = parse_field(state, field_type)
+        except (StructuredFieldError, KeyError) as why:
+            results.append(why)
+            continue
+        if dedupe:
+            seen[key] = result
+        results.append(result)
+    return results
+
+
+def split_field_line(line: bytes) -> Tuple[str, bytes]:
+    "Split a 'name: value' line into its name and value."
+    name, colon, value = line.partition(b":")
+    if not colon:
+        raise StructuredFieldError(
+            "Field line has no ':'", position=len(line), offending_char=None
+        )
+    return name.strip(b" \t").decode("ascii", "replace"), value.strip(b" \t")
+
+
+def parse_lines(
+    lines: Iterable[bytes],
+    name: Optional[str] = None,
+    tltype: Optional[str] = None,
+    named: bool = False,
+    batch_size: int = 1000,
+) -> Iterator[Tuple[Optional[str], bytes, BatchResultType]]:
+    """
+    Parse each line as a field value (or, if named is true, as a 'name: value'
+    field line), yielding (name, value, result) tuples as they are processed.
+    The result is either the parsed structure or the exception raised.
+
+    Lines are handled in batches of batch_size, so memory use does not depend
+    upon the amount of input.
+    """
+    lines = iter(lines)
+    while True:
+        batch = [line.rstrip(b"\r\n") for line in islice(lines, batch_size)]
+        if not batch:
+            return
+        if not named:
+            yield from zip(repeat(name), batch, parse_many(batch, name, tltype))
+            continue
+        fields: List[Tuple[Optional[str], bytes]] = []
+        errors: Dict[int, StructuredFieldError] = {}
+        for line in batch:
+            try:
+                fields.append(split_field_line(line))
+            except StructuredFieldError as why:
+                errors[len(fields)] = why
+                fields.append((None, line))
+        results = parse_many(
+            [field for i, field in enumerate(fields) if i not in errors], name, tltype
+        )
+        for i, error in sorted(errors.items()):
+            results.insert(i, error)
+        for (field_name, value), result in zip(fields, results):
+            yield field_name, value, result
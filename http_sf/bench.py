@@ -0,0 +1,356 @@
+"""
+Benchmarks for parsing and serialisation.
+
+Run with `python -m http_sf.bench`. Each case reports operations per second,
+the peak memory allocated during one call, and the memory still held by its
+result (both as seen by tracemalloc).
+Results can be written as JSON, and compared with a previous run's.
+"""
+
+import argparse
+import json
+import platform
+import re
+import sys
+import timeit
+import tracemalloc
+from cProfile import Profile
+from pstats import Stats
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+
+from . import (
+    IncrementalParser,
+    LazyList,
+    __version__,
+    parse,
+    parse_lazy,
+    parse_many,
+    ser,
+    to_json,
+)
+from .batch import parse_lines
+from .compat import structures as compat_structures
+from .types import StructuredType
+
+ResultsType = Dict[str, Dict[str, Any]]
+
+
+class Case(NamedTuple):
+    name: str
+    group: str
+    func: Callable[[], Any]
+
+
+def _list_value(members: int) -> bytes:
+    return b", ".join(b"tok%d;q=0.%d" % (n, n % 10) for n in range(members))
+
+
+def _dictionary_value(members: int) -> bytes:
+    return b", ".join(b'key%d="value %d";p' % (n, n) for n in range(members))
+
+
+FIELDS: List[Tuple[str, str, bytes]] = [
+    ("String (short)", "item", b'"abcd"'),
+    ("String (simple)", "item", b'"abcdefghijklmnopqrstuvwxyz"'),
+    ("String (long)", "item", b'"' + b"abcdefghijklmnopqrstuvwxyz" * 40 + b'"'),
+    ("String (escaped)", "item", b'"abc\\"def\\\\ghi"'),
+    ("Token (short)", "item", b"abcd"),
+    ("Token (simple)", "item", b"abcdefghijklmnopqrstuvwxyz"),
+    ("Integer", "item", b"123456789012345"),
+    ("Decimal", "item", b"123456789012.345"),
+    ("Boolean", "item", b"?1"),
+    ("Byte Sequence", "item", b":YWJjZGVmZ2hpamtsbW5vcHFyc3R1dnd4eXo=:"),
+    ("Date", "item", b"@1659578233"),
+    ("Display String", "item", b'%"f%c3%bc%c3%bc, bar"'),
+    ("Item (parameters)", "item", b"abcd;a=1;b=?0;c=efg"),
+    ("Inner List", "list", b"(abcd efg hijk lmnop), (qrs tuv w x y z)"),
+    ("List (1)", "list", _list_value(1)),
+    ("List (10)", "list", _list_value(10)),
+    ("List (100)", "list", _list_value(100)),
+    ("List (simple)", "list", b"abcd, efg, hi, jk, lmno, p, qrs, tuv, w, x, y, z"),
+    ("Dictionary (1)", "dictionary", _dictionary_value(1)),
+    ("Dictionary (10)", "dictionary", _dictionary_value(10)),
+    ("Dictionary (100)", "dictionary", _dictionary_value(100)),
+    ("Dictionary (simple)", "dictionary", b"abcd=efg, hi, jk=lmno, p, qrs=1, w=?0"),
+]
+BATCH_SIZE = 1000
+
+
+def cases() -> List[Case]:
+    "Return all of the benchmark cases."
+    found = []
+    for name, tltype, value in FIELDS:
+        structure = parse(value, tltype=tltype)
+        found.extend(_field_cases(name, tltype, value, structure))
+    values = [_list_value(n % 20 + 1) for n in range(BATCH_SIZE)]
+    lines = [b"Accept-Encoding: " + value + b"\n" for value in values]
+    lazy = _list_value(100)
+    large = _list_value(2000)
+    found.extend(
+        [
+            Case(
+                f"parse_many ({BATCH_SIZE} values)",
+                "batch",
+                lambda: parse_many(values, tltype="list"),
+            ),
+            Case(
+                f"parse_lines ({BATCH_SIZE} lines)",
+                "batch",
+                lambda: list(parse_lines(lines, named=True)),
+            ),
+            Case(
+                "parse_lazy List (100), one member",
+                "lazy",
+                lambda: cast(LazyList, parse_lazy(lazy, tltype="list"))[50],
+            ),
+            Case(
+                f"IncrementalParser List ({len(large) // 1024}KB, 4KB chunks)",
+                "incremental",
+                lambda: _feed(large, 4096),
+            ),
+        ]
+    )
+    return found
+
+
+def _field_cases(
+    name: str, tltype: str, value: bytes, structure: StructuredType
+) -> List[Case]:
+    found = [
+        Case(f"parse {name}", "parse", lambda: parse(value, tltype=tltype)),
+        Case(f"ser {name}", "ser", lambda: ser(structure)),
+        Case(f"ser {name} (trusted)", "ser", lambda: ser(structure, validate=False)),
+        Case(f"to_json {name}", "json", lambda: to_json(structure)),
+    ]
+    if tltype != "item":
+        found.insert(
+            1,
+            Case(
+                f"parse {name} (compact)",
+                "parse",
+                lambda: parse(value, tltype=tltype, compact=True),
+            ),
+        )
+    compat = compat_structures[tltype]()
+    compat.parse(value)
+    found.extend(
+        [
+            Case(f"compat parse {name}", "compat", lambda: compat.parse(value)),
+            Case(f"compat ser {name}", "compat", lambda: str(compat)),
+        ]
+    )
+    return found
+
+
+def _feed(value: bytes, chunk_size: int) -> List[Any]:
+    parser = IncrementalParser("list")
+    members = []
+    for start in range(0, len(value), chunk_size):
+        members.extend(parser.feed(value[start : start + chunk_size]))
+    members.extend(parser.close())
+    return members
+
+
+def measure(func: Callable[[], Any], seconds: float, repeat: int) -> Dict[str, Any]:
+    """
+    Time func, returning its best rate over repeat runs of about seconds /
+    repeat each, and the memory allocated by a call: the peak, and what its
+    result retains.
+    """
+    func()  # warm up
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= seconds / repeat / 4 or number >= 1_000_000:
+            break
+        number *= 4
+    number = max(1, int(number * (seconds / repeat) / max(elapsed, 1e-9)))
+    best = min(timer.repeat(repeat, number))
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        start = tracemalloc.get_traced_memory()[0]
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {
+        "ops_per_sec": number / best,
+        "alloc_bytes": peak - start,
+        "retained_bytes": current - start,
+    }
+
+
+def run(
+    selected: Sequence[Case],
+    seconds: float,
+    repeat: int,
+    report: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> ResultsType:
+    "Measure each case, passing each name and result to report (if given)."
+    results: ResultsType = {}
+    for case in selected:
+        result = measure(case.func, seconds, repeat)
+        result["group"] = case.group
+        results[case.name] = result
+        if report is not None:
+            report(case.name, result)
+    return results
+
+
+def compare(results: ResultsType, baseline: ResultsType) -> Dict[str, float]:
+    """
+    Return the change in rate from baseline for each case in both results and
+    baseline; for example, -0.1 is 10% slower.
+    """
+    return {
+        name: result["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1
+        for name, result in results.items()
+        if name in baseline
+    }
+
+
+def profile(selected: Sequence[Case], calls: int) -> None:
+    "Print a profile of calls calls to each case."
+    for case in selected:
+        profiler = Profile()
+        for _ in range(calls):
+            profiler.runcall(case.func)
+        stats = Stats(profiler)
+        stats.strip_dirs()
+        stats.sort_stats("cumulative")
+        print(f"* {case.name}")
+        stats.print_stats(20)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m http_sf.bench",
+        description="Benchmark parsing and serialisation of Structured Fields.",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        dest="filter",
+        help="Only run cases whose group or name matches this regular expression.",
+    )
+    parser.add_argument(
+        "-t",
+        "--time",
+        dest="seconds",
+        type=float,
+        default=0.3,
+        help="Approximate seconds to time each case for (default: 0.3).",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        dest="repeat",
+        type=int,
+        default=3,
+        help="Timing runs per case; the best is reported (default: 3).",
+    )
+    parser.add_argument(
+        "-o", "--output", dest="output", help="Write results to this JSON file."
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        dest="baseline",
+        help="Compare with the results in this JSON file.",
+    )
+    parser.add_argument(
+        "--threshold",
+        dest="threshold",
+        type=float,
+        default=0.1,
+        help="Slowdown against the baseline that is a regression (default: 0.1).",
+    )
+    parser.add_argument(
+        "--list", dest="list", action="store_true", help="List the cases and exit."
+    )
+    parser.add_argument(
+        "--profile",
+        dest="profile",
+        type=int,
+        metavar="CALLS",
+        help="Profile this many calls to each case, rather than timing them.",
+    )
+    args = parser.parse_args(argv)
+
+    selected = cases()
+    if args.filter:
+        pattern = re.compile(args.filter)
+        selected = [
+            case
+            for case in selected
+            if pattern.search(case.name) or pattern.search(case.group)
+        ]
+    if args.list:
+        for case in selected:
+            print(f"{case.group:12s} {case.name}")
+        return 0
+    if args.profile:
+        profile(selected, args.profile)
+        return 0
+
+    baseline: ResultsType = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+    def report(name: str, result: Dict[str, Any]) -> None:
+        line = (
+            f"{name:44.44s} {result['ops_per_sec']:12,.0f} ops/s"
+            f" {result['alloc_bytes']:10,d} B peak"
+            f" {result['retained_bytes']:10,d} B kept"
+        )
+        if name in baseline:
+            change = compare({name: result}, baseline)[name]
+            line += f" {change:+7.1%}"
+            if change < -args.threshold:
+                line += " REGRESSION"
+        print(line, flush=True)
+
+    results = run(selected, args.seconds, args.repeat, report)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(
+                {
+                    "http_sf": __version__,
+                    "python": platform.python_version(),
+                    "implementation": platform.python_implementation(),
+                    "results": results,
+                },
+                output,
+                indent=2,
+            )
+            output.write("\n")
+    regressions = [
+        name
+        for name, change in compare(results, baseline).items()
+        if change < -args.threshold
+    ]
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) slower than the baseline by more than"
+            f" {args.threshold:.0%}."
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ from .state import ParserState
 QUESTION = ord(b"?")
 ONE = ord(b"1")
 ZERO = ord(b"0")
+BOOLEAN_PATTERN = rb"\?[01]"
 
 _boolean_map = {ONE: (2, True), ZERO: (2, False)}
 
@@ -0,0 +1,237 @@
+"""
+Parse every structured field found in a directory of captured headers.
+
+Input files can be HAR files (*.har), or newline-delimited JSON (*.ndjson,
+*.jsonl) where each line is either an object mapping field names to values,
+or an array of [name, value] pairs. Only fields whose type is known from
+http_sf.retrofit are parsed.
+
+Records (HAR entries or NDJSON lines) that can't be read are counted as
+failures of "(invalid records)", and files that can't be read as failures of
+"(invalid files)"; processing continues with the next one.
+"""
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .batch import parse_many
+from .retrofit import retrofit
+from .util import to_json
+
+INPUT_SUFFIXES = {".har", ".ndjson", ".jsonl"}
+StatsType = Dict[str, Dict[str, int]]
+HeadersType = List[Tuple[str, str]]
+INVALID_RECORDS = "(invalid records)"
+INVALID_FILES = "(invalid files)"
+# what reading a malformed record can raise
+RECORD_ERRORS = (ValueError, TypeError, KeyError, AttributeError)
+
+
+def find_files(paths: Iterable[Path]) -> List[Path]:
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(
+                sorted(p for p in path.rglob("*") if p.suffix in INPUT_SUFFIXES)
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def read_headers(path: Path) -> Iterator[Optional[HeadersType]]:
+    """
+    Yield the header list of each message in path, or None for each record
+    that can't be read. Errors that affect the whole file are raised.
+    """
+    with open(path, encoding="utf-8", errors="replace") as fh:
+        if path.suffix == ".har":
+            har = json.load(fh)
+            for entry in har["log"]["entries"]:
+                try:
+                    messages = [
+                        _check_headers(
+                            [(h["name"], h["value"]) for h in message["headers"]]
+                        )
+                        for message in (entry["request"], entry["response"])
+                    ]
+                except RECORD_ERRORS:
+                    yield None
+                    continue
+                yield from messages
+        else:
+            for line in fh:
+                if not line.strip():
+                    continue
+                try:
+                    headers = _record_headers(json.loads(line))
+                except RECORD_ERRORS:
+                    yield None
+                    continue
+                yield headers
+
+
+def _record_headers(record: Any) -> HeadersType:
+    if isinstance(record, dict):
+        return _check_headers(
+            [
+                (name, value)
+                for name, values in record.items()
+                for value in (values if isinstance(values, list) else [values])
+            ]
+        )
+    return _check_headers(list(record))
+
+
+def _check_headers(headers: HeadersType) -> HeadersType:
+    for name, value in headers:
+        if not isinstance(name, str) or not isinstance(value, str):
+            raise TypeError(f"Header {name!r} isn't a string name and value")
+    return headers
+
+
+def combine_fields(headers: HeadersType) -> Dict[str, str]:
+    "Combine the structured field lines in headers, by lowercase name."
+    fields: Dict[str, str] = {}
+    for name, value in headers:
+        name = name.lower()
+        if name not in retrofit:
+            continue
+        if name in fields:
+            fields[name] = f"{fields[name]}, {value}"
+        else:
+            fields[name] = value
+    return fields
+
+
+def process_file(path: Path, with_output: bool = True) -> Tuple[StatsType, List[str]]:
+    "Parse the structured fields in path, returning statistics and output lines."
+    stats: StatsType = {}
+    fields: List[Tuple[str, str]] = []
+    for headers in read_headers(path):
+        if headers is None:
+            stats.setdefault(INVALID_RECORDS, {"ok": 0, "fail": 0})["fail"] += 1
+            continue
+        fields.extend(combine_fields(headers).items())
+    results = parse_many(
+        ((name, value.encode("latin-1", "replace")) for name, value in fields),
+        dedupe=True,  # archived field values repeat often
+    )
+    output = []
+    for (name, value), result in zip(fields, results):
+        field_stats = stats.setdefault(name, {"ok": 0, "fail": 0})
+        record: Dict[str, Any] = {"file": str(path), "name": name, "value": value}
+        if isinstance(result, Exception):
+            field_stats["fail"] += 1
+            record["error"] = str(result)
+        else:
+            field_stats["ok"] += 1
+            record["result"] = result
+        if with_output:
+            output.append(to_json(record, sort_keys=True))
+    return stats, output
+
+
+def merge_stats(total: StatsType, stats: StatsType) -> None:
+    for name, field_stats in stats.items():
+        total_field = total.setdefault(name, {"ok": 0, "fail": 0})
+        for key, count in field_stats.items():
+            total_field[key] += count
+
+
+def run(
+    paths: Sequence[Path],
+    jobs: Optional[int] = None,
+    output: Optional[Any] = None,
+    on_error: Optional[Callable[[Path, Exception], None]] = None,
+) -> StatsType:
+    """
+    Parse the files found in paths using a pool of jobs processes, writing
+    parsed output to the output stream (if given). Returns per-field counts.
+
+    Files that can't be read are skipped, and passed to on_error (if given)
+    with the exception raised.
+    """
+    files = find_files(paths)
+    total: StatsType = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = [
+            executor.submit(process_file, path, output is not None) for path in files
+        ]
+        for path, future in zip(files, futures):
+            try:
+                stats, lines = future.result()
+            except (OSError, *RECORD_ERRORS) as why:
+                merge_stats(total, {INVALID_FILES: {"ok": 0, "fail": 1}})
+                if on_error is not None:
+                    on_error(path, why)
+                continue
+            merge_stats(total, stats)
+            if output is not None:
+                for line in lines:
+                    output.write(f"{line}\n")
+    return total
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m http_sf bulk",
+        description="Parse the structured fields in HAR and NDJSON header dumps.",
+    )
+    parser.add_argument(
+        "paths", nargs="+", type=Path, help="Files or directories to process."
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs).",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        help="Write parsed fields to this file as NDJSON ('-' for STDOUT).",
+    )
+    parser.add_argument(
+        "-s",
+        "--stats",
+        dest="stats",
+        help="Write per-field statistics to this file (default: STDERR).",
+    )
+    args = parser.parse_args(argv)
+
+    def report_error(path: Path, why: Exception) -> None:
+        sys.stderr.write(f"{path}: skipped ({why})\n")
+
+    if args.output == "-":
+        stats = run(args.paths, args.jobs, sys.stdout, report_error)
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            stats = run(args.paths, args.jobs, output, report_error)
+    else:
+        stats = run(args.paths, args.jobs, on_error=report_error)
+
+    report = json.dumps(stats, sort_keys=True, indent=4)
+    if args.stats:
+        with open(args.stats, "w", encoding="utf-8") as stats_file:
+            stats_file.write(f"{report}\n")
+    else:
+        sys.stderr.write(f"{report}\n")
+    return 0
@@ -1,42 +1,70 @@
 import base64
 import binascii
-from string import ascii_letters, digits
+import re
+from typing import Union
 
 from .errors import StructuredFieldError
 from .state import ParserState
+from .types import BufferType, LazyBytes
 
 BYTE_DELIMIT = ord(b":")
-B64CONTENT = set((ascii_letters + digits + "+/=").encode("ascii"))
+BYTE_DELIMIT_RE = re.compile(rb":")
+B64CONTENT_RE = re.compile(rb"[A-Za-z0-9+/=]*")
+B64_ALPHABET_RE = re.compile(rb"[A-Za-z0-9+/]*")
+# the characters that can come before padding when the unused bits are zero
+PADDED_LAST_CHARS = [set(), set(b"AEIMQUYcgkosw048"), set(b"AQgw")]
 
 
-def parse_byteseq(state: ParserState) -> bytes:
+def is_canonical(b64_content: BufferType) -> bool:
+    """
+    Return whether b64_content is padded base64 that decodes, and that
+    encoding the result would give back.
+    """
+    end = B64_ALPHABET_RE.match(b64_content).end()  # type: ignore[union-attr]
+    padding = len(b64_content) - end
+    if padding > 2 or len(b64_content) % 4 or b64_content[end:] != b"=" * padding:
+        return False
+    return padding == 0 or b64_content[end - 1] in PADDED_LAST_CHARS[padding]
+
+
+def parse_byteseq(state: ParserState) -> Union[bytes, LazyBytes]:
     state.cursor += 1
-    try:
-        end_delimit = state.data[state.cursor :].index(BYTE_DELIMIT)
-    except ValueError as why:
+    match = BYTE_DELIMIT_RE.search(state.data, state.cursor)
+    if match is None:
         raise StructuredFieldError(
             "Binary Sequence didn't contain ending ':'",
             position=len(state.data),
             offending_char=None,
-        ) from why
-    b64_content = state.data[state.cursor : state.cursor + end_delimit]
-    state.cursor += end_delimit + 1
-    if not all(c in B64CONTENT for c in b64_content):
-        raise StructuredFieldError(
-            "Binary Sequence contained disallowed character",
-            position=state.cursor - 1,
-            offending_char=None,
         )
+    end_delimit = match.start()
+    data = state.data
+    if state.bytes_type == "lazy":
+        data = memoryview(data)  # so that slicing doesn't copy
+    b64_content = data[state.cursor : end_delimit]
+    state.cursor = end_delimit + 1
+    if state.bytes_type == "lazy" and is_canonical(b64_content):
+        # always decodes, so it's safe to wait until the value is used
+        return LazyBytes(b64_content)
     try:
         binary_content = base64.b64decode(b64_content, validate=True)
     except binascii.Error as why:
+        if B64CONTENT_RE.fullmatch(b64_content) is None:
+            raise StructuredFieldError(
+                "Binary Sequence contained disallowed character",
+                position=state.cursor - 1,
+                offending_char=None,
+            ) from why
         raise StructuredFieldError(
             "Binary Sequence failed to decode",
             position=state.cursor - 1,
             offending_char=None,
         ) from why
+    if state.bytes_type == "lazy":
+        return LazyBytes(base64.b64encode(binary_content), binary_content)
     return binary_content
 
 
-def ser_byteseq(byteseq: bytes) -> str:
+def ser_byteseq(byteseq: Union[bytes, LazyBytes]) -> str:
+    if isinstance(byteseq, LazyBytes):
+        return f":{str(byteseq.encoded, 'ascii')}:"
     return f":{base64.standard_b64encode(byteseq).decode('ascii')}:"
@@ -0,0 +1,253 @@
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union, cast
+
+from typing_extensions import TypeAlias
+
+from .field import ser_field
+from .types import (
+    BufferType,
+    InnerList,
+    Item,
+    ItemType,
+    OnDuplicateKeyType,
+    StructuredType,
+)
+
+CacheKeyType: TypeAlias = Tuple[Any, ...]
+DuplicatesType: TypeAlias = List[Tuple[str, str]]
+
+
+class ParseCache:
+    """
+    A bounded LRU cache of parse() results.
+
+    The cache is limited both by the number of entries and by the total size
+    of the cached field values; values longer than max_value_size are never
+    admitted. Results are copied on the way in and on the way out, so callers
+    can modify what they get back without affecting later hits.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 256 * 1024,
+        max_value_size: int = 1024,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_value_size = max_value_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[
+            CacheKeyType, Tuple[StructuredType, DuplicatesType]
+        ] = OrderedDict()
+
+    def admits(self, value: BufferType) -> bool:
+        return len(value) <= self.max_value_size
+
+    def get(
+        self,
+        key: CacheKeyType,
+        on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+    ) -> Optional[StructuredType]:
+        """
+        Return a copy of the cached structure for key, or None. Duplicate keys
+        seen when the value was first parsed are reported to on_duplicate_key.
+        """
+        try:
+            structure, duplicates = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        if on_duplicate_key is not None:
+            for dup_key, context in duplicates:
+                on_duplicate_key(dup_key, context)
+        return copy_structure(structure)
+
+    def put(
+        self,
+        key: CacheKeyType,
+        structure: StructuredType,
+        duplicates: Optional[DuplicatesType] = None,
+    ) -> None:
+        "Store a copy of structure under key, evicting as necessary."
+        if key in self._entries:
+            return
+        value_size = len(key[0])
+        if value_size > self.max_value_size or value_size > self.max_bytes:
+            return
+        self._entries[key] = (copy_structure(structure), duplicates or [])
+        self.size += value_size
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            old_key, _ = self._entries.popitem(last=False)
+            self.size -= len(old_key[0])
+            self.evictions += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def copy_structure(structure: StructuredType) -> StructuredType:
+    """
+    Copy the containers in a parsed structure. Bare items and compact Items
+    and Inner Lists are immutable, so they are shared.
+    """
+    if isinstance(structure, dict):
+        return {key: _copy_member(member) for key, member in structure.items()}
+    if isinstance(structure, list):
+        return [_copy_member(member) for member in structure]
+    return cast(ItemType, _copy_member(structure))
+
+
+def _copy_member(member: Any) -> Any:
+    if not isinstance(member, tuple) or isinstance(member, (Item, InnerList)):
+        return member
+    value, params = member
+    if isinstance(value, list):
+        value = [_copy_member(item) for item in value]
+    return (value, dict(params))
+
+
+class SerializedField:
+    """
+    A structure that is serialised once, when it is created. Use this for
+    field values that never change.
+    """
+
+    __slots__ = ("structure", "text", "data")
+
+    def __init__(self, structure: StructuredType) -> None:
+        self.structure = structure
+        self.text = ser_field(structure)
+        self.data = self.text.encode("ascii")
+
+    def __repr__(self) -> str:
+        return f"SerializedField({self.text!r})"
+
+
+class SerCache:
+    """
+    A bounded LRU cache of ser() results, keyed on a frozen copy of the
+    structure. The cache is limited both by the number of entries and by the
+    total length of the cached output.
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 256 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[str]:
+        try:
+            text = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return text
+
+    def put(self, key: Hashable, text: str) -> None:
+        "Store text under key, evicting as necessary."
+        if key in self._entries or len(text) > self.max_bytes:
+            return
+        self._entries[key] = text
+        self.size += len(text)
+        while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+            _, old_text = self._entries.popitem(last=False)
+            self.size -= len(old_text)
+            self.evictions += 1
+
+    def invalidate(self, structure: StructuredType) -> bool:
+        "Remove the entry for structure, returning whether there was one."
+        try:
+            text = self._entries.pop(freeze_structure(structure))
+        except (KeyError, TypeError):
+            return False
+        self.size -= len(text)
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def ser_cached(
+    structure: Union[StructuredType, SerializedField], cache: SerCache
+) -> str:
+    """
+    Serialise structure, reusing the output for an equal structure if it is in
+    cache. SerializedFields are returned without consulting the cache.
+    """
+    if isinstance(structure, SerializedField):
+        return structure.text
+    try:
+        key = freeze_structure(structure)
+    except TypeError:  # unhashable; can't be cached
+        return ser_field(structure)
+    text = cache.get(key)
+    if text is None:
+        text = ser_field(structure)
+        cache.put(key, text)
+    return text
+
+
+def freeze_structure(structure: Any) -> Hashable:
+    """
+    Return a hashable form of structure. Bare items are tagged with their
+    type, so that (for example) a Token and a String with the same
+    characters, or True and 1, are distinct.
+    """
+    if isinstance(structure, dict):
+        return (
+            dict,
+            tuple((key, _freeze_member(member)) for key, member in structure.items()),
+        )
+    if isinstance(structure, list):
+        return (list, tuple(_freeze_member(member) for member in structure))
+    return _freeze_member(structure)
+
+
+def _freeze_member(member: Any) -> Hashable:
+    if isinstance(member, tuple):
+        value, params = member
+        frozen_params = tuple((key, type(v), v) for key, v in params.items())
+        if isinstance(value, (list, tuple)):
+            return (tuple, tuple(_freeze_member(i) for i in value), frozen_params)
+        return (type(value), value, frozen_params)
+    if isinstance(member, list):
+        return (tuple, tuple(_freeze_member(i) for i in member), ())
+    return (type(member), member)
@@ -1,17 +1,31 @@
 from datetime import datetime, timezone
+from typing import Union
 
 from .errors import StructuredFieldError
-from .integer import parse_integer
+from .integer import parse_integer, ser_integer
 from .state import ParserState
+from .types import EpochDate, LazyDate, Milli
 
+# the range that datetime.fromtimestamp() accepts
+MIN_DATE = -62135596800  # 0001-01-01T00:00:00Z
+MAX_DATE = 253402300799  # 9999-12-31T23:59:59Z
 
-def parse_date(state: ParserState) -> datetime:
+
+def parse_date(state: ParserState) -> Union[datetime, EpochDate, LazyDate]:
     state.cursor += 1  # consume "@"
     value = parse_integer(state)
-    if not isinstance(value, int):
+    if not isinstance(value, int) or isinstance(value, Milli):
         raise StructuredFieldError(
             "Non-integer Date", position=state.cursor, offending_char=None
         )
+    if not MIN_DATE <= value <= MAX_DATE:
+        raise StructuredFieldError(
+            "Date value out of range", position=state.cursor, offending_char=None
+        )
+    if state.date_type == "epoch":
+        return EpochDate(value)
+    if state.date_type == "lazy":
+        return LazyDate(value)
     try:
         return datetime.fromtimestamp(value, tz=timezone.utc)
     except (ValueError, OSError) as why:
@@ -20,5 +34,9 @@ def parse_date(state: ParserState) -> datetime:
         ) from why
 
 
-def ser_date(inval: datetime) -> str:
+def ser_date(inval: Union[datetime, EpochDate, LazyDate]) -> str:
+    if isinstance(inval, EpochDate):
+        return f"@{ser_integer(inval)}"
+    if isinstance(inval, LazyDate):
+        return f"@{ser_integer(inval.epoch)}"
     return f"@{int(inval.timestamp())}"
@@ -1,21 +1,34 @@
+import math
 from decimal import Decimal
 from typing import Union, cast
 
 from http_sf.integer import parse_number
 from http_sf.state import ParserState
+from http_sf.types import Milli
 
 INT_DIGITS = 12
 FRAC_DIGITS = 3
 PRECISION = Decimal(10) ** -FRAC_DIGITS
+DECIMAL_PATTERN = rb"-?[0-9]{1,12}\.[0-9]{1,3}"
 
 
 def parse_decimal(state: ParserState) -> Decimal:
     return cast(Decimal, parse_number(state))
 
 
-def ser_decimal(input_decimal: Union[Decimal, float]) -> str:
+def ser_decimal(input_decimal: Union[Decimal, float, Milli]) -> str:
+    if isinstance(input_decimal, Milli):
+        thousandths = abs(input_decimal)
+        return _ser_components(
+            input_decimal < 0, str(thousandths // 1000), f"{thousandths % 1000:03d}"
+        )
     if isinstance(input_decimal, float):
-        input_decimal = Decimal(input_decimal)
+        if not math.isfinite(input_decimal):
+            raise ValueError("decimal input is not finite")
+        integer_component_s, fractional_s = f"{abs(input_decimal):.3f}".split(".")
+        return _ser_components(
+            round(input_decimal, FRAC_DIGITS) < 0, integer_component_s, fractional_s
+        )
     if not isinstance(input_decimal, Decimal):
         raise ValueError("decimal input is not decimal")
     input_decimal = round(input_decimal, FRAC_DIGITS)
@@ -30,3 +43,15 @@ def ser_decimal(input_decimal: Union[Decimal, float]) -> str:
         f"{'-' if input_decimal < 0 else ''}{integer_component_s}."
         f"{str(fractional_component)[2:] if fractional_component else '0'}"
     )
+
+
+def _ser_components(negative: bool, integer_component_s: str, fractional_s: str) -> str:
+    "Serialise a Decimal from its sign and three fractional digits."
+    if len(integer_component_s) > INT_DIGITS:
+        raise ValueError(
+            f"decimal with oversize integer component {integer_component_s}"
+        )
+    return (
+        f"{'-' if negative else ''}{integer_component_s}."
+        f"{fractional_s.rstrip('0') or '0'}"
+    )
@@ -1,20 +1,49 @@
+import re
 from typing import Optional, cast
 
+from .boolean import BOOLEAN_PATTERN, ONE, QUESTION
 from .errors import StructuredFieldError
 from .innerlist import parse_item_or_inner_list, ser_item_or_inner_list
+from .integer import INTEGER_PATTERN, NUMBER_START_CHARS
+from .intern import intern_key, intern_token
 from .parameters import parse_params, ser_params
 from .state import ParserState
-from .types import DictionaryType, ItemType, OnDuplicateKeyType
-from .util import discard_http_ows, parse_key, ser_key
+from .token import TOKEN_PATTERN
+from .types import BareItemType, DictionaryType, Item, ItemType, OnDuplicateKeyType
+from .util import KEY_PATTERN, discard_http_ows, parse_key, ser_key
 
 EQUALS = ord(b"=")
 COMMA = ord(b",")
+SIMPLE_MEMBER = (
+    KEY_PATTERN
+    + rb"(?:=(?:"
+    + TOKEN_PATTERN
+    + rb"|"
+    + INTEGER_PATTERN
+    + rb"|"
+    + BOOLEAN_PATTERN
+    + rb"))?"
+)
+SIMPLE_DICTIONARY = re.compile(
+    SIMPLE_MEMBER + rb"(?:[ \t]*,[ \t]*" + SIMPLE_MEMBER + rb")*[ \t]*"
+)
+SIMPLE_DICTIONARY_MEMBER = re.compile(rb"(" + KEY_PATTERN + rb")(?:=([^ \t,]+))?")
 
 
 def parse_dictionary(
-    state: ParserState, on_duplicate_key: Optional[OnDuplicateKeyType] = None
+    state: ParserState,
+    on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+    dictionary: Optional[DictionaryType] = None,
 ) -> DictionaryType:
-    dictionary = {}
+    """
+    Parse a Dictionary. If dictionary is given, members are added to it, as if
+    its contents came earlier in the field value, and it is returned.
+    """
+    simple = parse_simple_dictionary(state, on_duplicate_key, dictionary)
+    if simple is not None:
+        return simple
+    if dictionary is None:
+        dictionary = {}
     data_len = len(state.data)
     while True:
         this_key = parse_key(state)
@@ -28,7 +57,10 @@ def parse_dictionary(
                 member = parse_item_or_inner_list(state, on_duplicate_key)
             else:
                 params = parse_params(state, on_duplicate_key)
-                member = (True, params)
+                if state.compact:
+                    member = Item(True, params)  # type: ignore[arg-type]
+                else:
+                    member = (True, params)
         except StructuredFieldError as why:
             why.context = this_key
             raise why
@@ -61,15 +93,48 @@ def parse_dictionary(
             )
 
 
-def ser_dictionary(dictionary: DictionaryType) -> str:
+def parse_simple_dictionary(
+    state: ParserState,
+    on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+    dictionary: Optional[DictionaryType] = None,
+) -> Optional[DictionaryType]:
+    """
+    Parse the rest of the input as a Dictionary whose members are bare keys or
+    keys with Token, Integer or Boolean values without parameters, if that is
+    all it contains. Otherwise, return None without consuming anything.
+    """
+    if SIMPLE_DICTIONARY.fullmatch(state.data, state.cursor) is None:
+        return None
+    if dictionary is None:
+        dictionary = {}
+    for raw_key, raw_value in SIMPLE_DICTIONARY_MEMBER.findall(
+        state.data, state.cursor
+    ):
+        this_key = intern_key(raw_key)
+        value: BareItemType
+        if not raw_value:
+            value = True
+        elif raw_value[0] == QUESTION:
+            value = raw_value[1] == ONE
+        elif raw_value[0] in NUMBER_START_CHARS:
+            value = int(raw_value)
+        else:
+            value = intern_token(raw_value)
+        if on_duplicate_key and this_key in dictionary:
+            on_duplicate_key(this_key, "dictionary")
+        dictionary[this_key] = Item(value) if state.compact else (value, {})
+    state.cursor = len(state.data)
+    return dictionary
+
+
+def ser_dictionary(dictionary: DictionaryType, validate: bool = True) -> str:
     if len(dictionary) == 0:
         raise ValueError("No contents; field should not be emitted")
     return ", ".join(
         [
-            f"{ser_key(m)}"
-            f"""{ser_params(n[1]) if
+            f"{ser_key(m, validate)}" f"""{ser_params(n[1], validate) if
                 (isinstance(n, tuple) and n[0] is True)
-                else f'={ser_item_or_inner_list(cast(ItemType, n))}'}"""
+                else f'={ser_item_or_inner_list(cast(ItemType, n), validate)}'}"""
             for m, n in dictionary.items()
         ]
     )
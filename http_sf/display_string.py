@@ -1,13 +1,21 @@
+import binascii
+import re
+
 from .errors import StructuredFieldError
 from .state import ParserState
 from .types import DisplayString
 
 PERCENT = ord("%")
 DQUOTE = ord('"')
+DISPLAY_STRING_RE = re.compile(rb'(?:[\x20\x21\x23\x24\x26-\x7e]|%[0-9a-f]{2})*"')
+SAFE_CHARS_RE = re.compile(r"[\x20\x21\x23\x24\x26-\x7e]*")
+ESCAPES = [
+    chr(octet) if SAFE_CHARS_RE.fullmatch(chr(octet)) else f"%{octet:02x}"
+    for octet in range(256)
+]
 
 
 def parse_display_string(state: ParserState) -> DisplayString:
-    output_array = bytearray([])
     if not state.has_data() or state.data[state.cursor : state.cursor + 2] != b'%"':
         try:
             char = state.data[state.cursor]
@@ -18,6 +26,29 @@ def parse_display_string(state: ParserState) -> DisplayString:
             position=state.cursor,
             offending_char=char,
         )
+    match = DISPLAY_STRING_RE.match(state.data, state.cursor + 2)
+    if match is None:
+        return _parse_display_string(state)
+    output_array = bytes(state.data[state.cursor + 2 : match.end() - 1])
+    state.cursor = match.end()
+    if PERCENT in output_array:
+        # as quoted-printable; there are no line breaks, and every "%" is
+        # followed by two hex digits
+        output_array = binascii.a2b_qp(
+            output_array.replace(b"=", b"=3d").replace(b"%", b"=")
+        )
+    try:
+        output_string = output_array.decode("utf-8")
+    except UnicodeDecodeError as why:
+        raise StructuredFieldError(
+            "Invalid UTF-8", position=state.cursor - 1, offending_char=None
+        ) from why
+    return DisplayString(output_string)
+
+
+def _parse_display_string(state: ParserState) -> DisplayString:
+    "Parse character by character; used to find the error in invalid input."
+    output_array = bytearray([])
     state.cursor += 2  # consume PERCENT DQUOTE
     while True:
         try:
@@ -31,7 +62,7 @@ def parse_display_string(state: ParserState) -> DisplayString:
         state.cursor += 1
         if char == PERCENT:
             try:
-                next_chars = state.data[state.cursor : state.cursor + 2]
+                next_chars = bytes(state.data[state.cursor : state.cursor + 2])
                 if len(next_chars) < 2:
                     raise IndexError
             except IndexError as why:
@@ -81,11 +112,6 @@ def parse_display_string(state: ParserState) -> DisplayString:
 
 
 def ser_display_string(inval: DisplayString) -> str:
-    byte_array = inval.encode("utf-8")
-    escaped = []
-    for byte in byte_array:
-        if byte in [PERCENT, DQUOTE] or not 31 <= byte <= 127:
-            escaped.append(f"%{byte:x}")
-        else:
-            escaped.append(chr(byte))
-    return f'%"{"".join(escaped)}"'
+    if SAFE_CHARS_RE.fullmatch(inval):
+        return f'%"{inval}"'
+    return f'%"{"".join([ESCAPES[octet] for octet in inval.encode("utf-8")])}"'
@@ -8,8 +8,10 @@ class StructuredFieldError(ValueError):
         position: Optional[int] = None,
         offending_char: Optional[int] = None,
         context: Optional[str] = None,
+        line: Optional[int] = None,
     ) -> None:
         self.position = position
         self.offending_char = offending_char
         self.context = context
+        self.line = line  # index of the field line position is in, if there are several
         super().__init__(*args)
@@ -0,0 +1,125 @@
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .dictionary import parse_dictionary, ser_dictionary
+from .errors import StructuredFieldError
+from .item import parse_item, ser_item
+from .list import parse_list, ser_list
+from .state import ParserState, fill_position
+from .types import DictionaryType, ListType, OnDuplicateKeyType, StructuredType
+from .util import discard_ows
+
+
+def parse_field(
+    state: ParserState,
+    tltype: Optional[str],
+    on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+) -> StructuredType:
+    "Parse a whole field value of the given top-level type."
+    structure: StructuredType
+    discard_ows(state)
+    try:
+        if tltype in ["dict", "dictionary"]:
+            structure = parse_dictionary(state, on_duplicate_key)
+        elif tltype == "list":
+            structure = parse_list(state, on_duplicate_key)
+        elif tltype == "item":
+            structure = parse_item(state, on_duplicate_key)
+        else:
+            raise KeyError("unrecognised top-level type")
+        discard_ows(state)
+        if state.has_data():
+            raise StructuredFieldError(
+                "Trailing characters after value (missing comma?)",
+                position=state.cursor,
+                offending_char=state.data[state.cursor],
+            )
+        return structure
+    except StructuredFieldError as why:
+        fill_position(why, state)
+        raise why
+
+
+def parse_field_lines(
+    states: Sequence[ParserState],
+    tltype: Optional[str],
+    on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+) -> StructuredType:
+    """
+    Parse several field lines as one field value, as if they had been
+    combined with ", ".
+
+    Each line of a List or Dictionary is parsed in place, adding to the same
+    structure. Only when that isn't possible (for example, when a String
+    spans lines, or a line is invalid) are the lines copied together; errors
+    then have a line attribute, and their position is within that line.
+    """
+    if len(states) == 1:
+        return parse_field(states[0], tltype, on_duplicate_key)
+    if tltype in ["dict", "dictionary", "list"]:
+        duplicates: List[Tuple[str, str]] = []
+
+        def record_duplicate(dup_key: str, context: str) -> None:
+            duplicates.append((dup_key, context))
+
+        record = record_duplicate if on_duplicate_key else None
+        dictionary: DictionaryType = {}
+        _list: ListType = []
+        try:
+            for state in states:
+                discard_ows(state)
+                if not state.has_data():  # an empty line leaves an empty member
+                    break
+                if tltype == "list":
+                    _list.extend(parse_list(state, record))
+                else:
+                    parse_dictionary(state, record, dictionary)
+            else:
+                if on_duplicate_key is not None:
+                    for dup_key, context in duplicates:
+                        on_duplicate_key(dup_key, context)
+                return _list if tltype == "list" else dictionary
+        except StructuredFieldError:
+            pass
+    return _parse_combined(states, tltype, on_duplicate_key)
+
+
+def _parse_combined(
+    states: Sequence[ParserState],
+    tltype: Optional[str],
+    on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+) -> StructuredType:
+    lines = [bytes(state.data) for state in states]
+    first = states[0]
+    state = ParserState(
+        b", ".join(lines),
+        compact=first.compact,
+        decimal_type=first.decimal_type,
+        date_type=first.date_type,
+        bytes_type=first.bytes_type,
+    )
+    try:
+        return parse_field(state, tltype, on_duplicate_key)
+    except StructuredFieldError as why:
+        if why.position is not None:
+            starts = []
+            offset = 0
+            for line in lines:
+                starts.append(offset)
+                offset += len(line) + 2
+            why.line = bisect_right(starts, why.position) - 1
+            # a position in the ", " between lines is at the end of the line before
+            why.position = min(why.position - starts[why.line], len(lines[why.line]))
+        raise why
+
+
+def ser_field(structure: StructuredType, validate: bool = True) -> str:
+    """
+    Serialise a whole field value. If validate is false, Strings, Tokens and
+    keys are assumed to be valid, and aren't checked.
+    """
+    if isinstance(structure, Dict):
+        return ser_dictionary(structure, validate)
+    if isinstance(structure, List):
+        return ser_list(structure, validate)
+    return ser_item(structure, validate)
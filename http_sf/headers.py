@@ -0,0 +1,139 @@
+"""
+A view of a message's header fields that parses structured fields on demand.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .errors import StructuredFieldError
+from .field import parse_field_lines
+from .retrofit import retrofit
+from .state import ParserState
+from .types import OnDuplicateKeyType, StructuredType
+
+RawHeadersType = Union[
+    Iterable[Tuple[Union[str, bytes], Union[str, bytes]]],
+    Mapping[Union[str, bytes], Union[str, bytes]],
+]
+
+
+def _to_bytes(value: Union[str, bytes]) -> bytes:
+    if isinstance(value, str):
+        return value.encode("latin-1")
+    return bytes(value)
+
+
+def _to_str(name: Union[str, bytes]) -> str:
+    if isinstance(name, str):
+        return name
+    return name.decode("latin-1")
+
+
+class StructuredHeaders(Mapping[str, StructuredType]):
+    """
+    The structured fields in a collection of header fields, parsed the first
+    time each is accessed.
+
+    raw_headers is a sequence of (name, value) pairs, such as ASGI headers,
+    or a mapping of names to values; names and values can be str or bytes.
+    Field lines with the same name are parsed as one field value.
+
+    Only fields whose type is known are present: those in types (a mapping
+    of lowercase field names to top-level types), or else in
+    http_sf.retrofit. Other options (such as compact or decimal_type) are
+    as for parse().
+
+    Results, and StructuredFieldErrors, are kept, so each field is parsed at
+    most once; don't modify the results.
+    """
+
+    def __init__(
+        self,
+        raw_headers: RawHeadersType,
+        types: Optional[Mapping[str, str]] = None,
+        on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+        **options: Any,
+    ) -> None:
+        ParserState(b"", **options)  # check the options now
+        self._types = types or {}
+        self._on_duplicate_key = on_duplicate_key
+        self._options = options
+        self._results: Dict[str, Union[StructuredType, StructuredFieldError]] = {}
+        # names are lowercased, but otherwise kept as they are until they're used
+        self._raw: Dict[Union[str, bytes], List[Union[str, bytes]]] = {}
+        raw = self._raw
+        pairs = raw_headers.items() if isinstance(raw_headers, Mapping) else raw_headers
+        for name, value in pairs:
+            name = name.lower()
+            if name in raw:
+                raw[name].append(value)
+            else:
+                raw[name] = [value]
+
+    def field_type(self, name: str) -> Optional[str]:
+        "Return the top-level type of the field name, or None if it's unknown."
+        name = name.lower()
+        return self._types.get(name, retrofit.get(name))
+
+    def raw(self, name: str) -> Optional[bytes]:
+        "Return the combined field value for name, or None if it isn't present."
+        values = self._lines(name)
+        if values is None:
+            return None
+        if len(values) == 1:
+            return _to_bytes(values[0])
+        return b", ".join([_to_bytes(value) for value in values])
+
+    def _lines(self, name: str) -> Optional[List[Union[str, bytes]]]:
+        name = name.lower()
+        values = self._raw.get(name)
+        if values is None:
+            values = self._raw.get(name.encode("latin-1"))
+        return values
+
+    def __getitem__(self, name: str) -> StructuredType:
+        name = name.lower()
+        try:
+            result = self._results[name]
+        except KeyError:
+            tltype = self.field_type(name)
+            values = self._lines(name)
+            if tltype is None or values is None:
+                raise KeyError(name) from None
+            states = [
+                ParserState(_to_bytes(value), **self._options) for value in values
+            ]
+            try:
+                result = parse_field_lines(states, tltype, self._on_duplicate_key)
+            except StructuredFieldError as why:
+                result = why
+            self._results[name] = result
+        if isinstance(result, StructuredFieldError):
+            raise result
+        return result
+
+    def __contains__(self, name: object) -> bool:
+        return (
+            isinstance(name, str)
+            and self.field_type(name) is not None
+            and self._lines(name) is not None
+        )
+
+    def __iter__(self) -> Iterator[str]:
+        names = dict.fromkeys(_to_str(name) for name in self._raw)
+        return (name for name in names if self.field_type(name) is not None)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"<StructuredHeaders fields={list(self)!r} parsed={len(self._results)}>"
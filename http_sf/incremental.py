@@ -0,0 +1,186 @@
+"""
+A parser for List and Dictionary field values that arrive in chunks.
+"""
+
+from typing import Any, List, Optional, Set, Tuple, Union
+
+from .errors import StructuredFieldError
+from .lazy import parse_dictionary_member, parse_list_member, scan_member
+from .state import ParserState, fill_position
+from .types import BufferType, ItemOrInnerListType, OnDuplicateKeyType
+from .util import HTTP_OWS, TRAILING_DELIMS, parse_key
+
+MemberType = Union[ItemOrInnerListType, Tuple[str, ItemOrInnerListType]]
+LEADING_OWS = set(b" ")
+
+
+class IncrementalParser:
+    """
+    Parse a List or Dictionary field value that is fed in chunks, returning
+    each top-level member as soon as it's complete. Only the member currently
+    being received is buffered.
+
+    feed() and close() return the members completed so far: for a List, the
+    members themselves; for a Dictionary, (key, member) tuples, where a key
+    can repeat (the last one wins, as with parse()). Together, they return
+    the same members and raise the same errors as parse() would for the whole
+    value; error positions are relative to its start.
+
+    max_size limits the length of the whole field value, and max_member_size
+    that of each top-level member; a StructuredFieldError is raised as soon as
+    either is exceeded. Other options (such as compact or decimal_type) are
+    as for parse().
+    """
+
+    def __init__(
+        self,
+        tltype: str,
+        on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+        max_size: Optional[int] = None,
+        max_member_size: Optional[int] = None,
+        **options: Any,
+    ) -> None:
+        if tltype not in ["dict", "dictionary", "list"]:
+            raise ValueError(f"Can't parse a {tltype!r} incrementally")
+        ParserState(b"", **options)  # check the options now
+        self.tltype = "list" if tltype == "list" else "dictionary"
+        self.max_size = max_size
+        self.max_member_size = max_member_size
+        self._on_duplicate_key = on_duplicate_key
+        self._options = options
+        self._buffer = bytearray()
+        self._offset = 0  # the position of the start of _buffer in the field value
+        self._skip: Optional[Set[int]] = LEADING_OWS  # what to discard before a member
+        self._scan = 0  # where to resume looking for the end of the current member
+        self._within: Optional[int] = None  # what _scan is inside of, if anything
+        self._members = 0
+        self._keys: Set[str] = set()
+        self._closed = False
+
+    def feed(self, chunk: BufferType) -> List[MemberType]:
+        "Add chunk to the field value, returning the members it completes."
+        if self._closed:
+            raise ValueError("IncrementalParser is closed")
+        size = self._offset + len(self._buffer) + len(chunk)
+        if self.max_size is not None and size > self.max_size:
+            self._fail("Field value is longer than max_size", self.max_size)
+        self._buffer += chunk
+        return self._take_members(False)
+
+    def close(self) -> List[MemberType]:
+        "Finish the field value, returning the remaining members."
+        if self._closed:
+            raise ValueError("IncrementalParser is closed")
+        members = self._take_members(True)
+        self._closed = True
+        return members
+
+    def _take_members(self, final: bool) -> List[MemberType]:
+        """
+        Return the complete members in the buffer. Where the current member
+        ends is searched for from where the last call left off, and the buffer
+        is only copied once a member is complete.
+        """
+        members: List[MemberType] = []
+        buffer = self._buffer
+        data: Optional[bytes] = None
+        pos = 0
+        try:
+            while True:
+                if self._skip is not None:
+                    while pos < len(buffer) and buffer[pos] in self._skip:
+                        pos += 1
+                    if pos == len(buffer):
+                        if final:
+                            self._finish(bytes(buffer), pos)
+                        return members
+                    self._skip = None
+                    self._scan = pos
+                    self._within = None
+                self._scan, self._within = scan_member(
+                    buffer, pos, self._scan, self._within
+                )
+                end = self._scan if self._within is None else len(buffer)
+                if self.max_member_size is not None:
+                    if end - pos > self.max_member_size:
+                        self._fail(
+                            "Member is longer than max_member_size",
+                            pos + self.max_member_size,
+                        )
+                if end == len(buffer) and not final:
+                    return members
+                if data is None:
+                    data = bytes(buffer)
+                try:
+                    members.append(self._parse_member(data, pos, end))
+                except StructuredFieldError as why:
+                    # some errors depend on what follows, so wait for more if needed
+                    assert why.position is not None
+                    if not final and TRAILING_DELIMS.fullmatch(data, why.position):
+                        return members
+                    raise why
+                self._members += 1
+                if end == len(buffer):
+                    pos = end
+                    return members
+                pos = end + 1
+                self._skip = HTTP_OWS
+        except StructuredFieldError as why:
+            assert why.position is not None
+            why.position += self._offset
+            self._closed = True
+            raise why
+        finally:
+            del self._buffer[:pos]
+            self._offset += pos
+            self._scan = max(self._scan - pos, 0)
+
+    def _parse_member(self, data: bytes, start: int, end: int) -> MemberType:
+        """
+        Parse the member in data between start and end. Duplicate keys are
+        only reported once it has parsed, because it may be parsed again.
+        """
+        state = ParserState(data, **self._options)
+        state.cursor = start
+        duplicates: List[Tuple[str, str]] = []
+
+        def record_duplicate(dup_key: str, context: str) -> None:
+            duplicates.append((dup_key, context))
+
+        record = record_duplicate if self._on_duplicate_key else None
+        member: MemberType
+        try:
+            if self.tltype == "list":
+                member = parse_list_member(state, end, record)
+            else:
+                key = parse_key(state)
+                member = (key, parse_dictionary_member(state, key, end, record))
+                if record is not None:
+                    if key in self._keys:
+                        record(key, "dictionary")
+                    self._keys.add(key)
+        except StructuredFieldError as why:
+            fill_position(why, state)
+            raise why
+        if self._on_duplicate_key is not None:
+            for dup_key, context in duplicates:
+                self._on_duplicate_key(dup_key, context)
+        return member
+
+    def _finish(self, data: bytes, pos: int) -> None:
+        "Check a field value that ends at pos, before a member."
+        if self._members:
+            self._fail(
+                (
+                    "Trailing comma at end of list"
+                    if self.tltype == "list"
+                    else "Dictionary has trailing comma"
+                ),
+                pos,
+            )
+        if self.tltype == "dictionary":
+            self._parse_member(data, pos, pos)  # raises, because there's no key
+
+    def _fail(self, message: str, position: int) -> None:
+        self._closed = True
+        raise StructuredFieldError(message, position=position, offending_char=None)
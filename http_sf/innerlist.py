@@ -5,6 +5,7 @@ from .item import parse_item, ser_item
 from .parameters import parse_params, ser_params
 from .state import ParserState
 from .types import (
+    InnerList,
     InnerListType,
     ItemOrInnerListType,
     ItemType,
@@ -29,6 +30,8 @@ def parse_innerlist(
         if state.data[state.cursor] == PAREN_CLOSE:
             state.cursor += 1
             params = parse_params(state, on_duplicate_key)
+            if state.compact:
+                return InnerList(tuple(inner_list), params)  # type: ignore[arg-type]
             return (inner_list, params)
         item = parse_item(state, on_duplicate_key)
         inner_list.append(item)
@@ -47,11 +50,12 @@ def parse_innerlist(
             ) from why
 
 
-def ser_innerlist(inner_list: InnerListType) -> str:
+def ser_innerlist(inner_list: InnerListType, validate: bool = True) -> str:
     if not isinstance(inner_list, tuple):
         inner_list = (inner_list, {})
     return (
-        f"({' '.join([ser_item(i) for i in inner_list[0]])}){ser_params(inner_list[1])}"
+        f"({' '.join([ser_item(i, validate) for i in inner_list[0]])})"
+        f"{ser_params(inner_list[1], validate)}"
     )
 
 
@@ -66,9 +70,9 @@ def parse_item_or_inner_list(
     return parse_item(state, on_duplicate_key)
 
 
-def ser_item_or_inner_list(thing: ItemOrInnerListType) -> str:
+def ser_item_or_inner_list(thing: ItemOrInnerListType, validate: bool = True) -> str:
     if not isinstance(thing, tuple):
         thing = cast(ItemType, (thing, {}))
-    if isinstance(cast(InnerListType, thing)[0], List):
-        return ser_innerlist(cast(InnerListType, thing))
-    return ser_item(cast(ItemType, thing))
+    if isinstance(cast(InnerListType, thing)[0], (list, tuple)):
+        return ser_innerlist(cast(InnerListType, thing), validate)
+    return ser_item(cast(ItemType, thing), validate)
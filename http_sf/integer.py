@@ -1,9 +1,11 @@
+import re
 from decimal import Decimal
 from string import digits
 from typing import Union, cast
 
 from .errors import StructuredFieldError
 from .state import ParserState
+from .types import Milli
 
 MAX_INT = 999999999999999
 MIN_INT = -999999999999999
@@ -12,7 +14,11 @@ DIGITS = set(digits.encode("ascii"))
 NUMBER_START_CHARS = set((digits + "-").encode("ascii"))
 PERIOD = ord(b".")
 MINUS = ord(b"-")
+INTEGER_PATTERN = rb"-?[0-9]{1,15}"
 INTEGER = "integer"
+MILLI_SCALE = [1000, 100, 10, 1]  # by number of fractional digits
+# a valid Integer or Decimal; anything else is left to the scanner in parse_number
+NUMBER_RE = re.compile(rb"-?(?:[0-9]{1,15}(?![0-9.])|[0-9]{1,12}\.[0-9]{1,3}(?![0-9]))")
 DECIMAL = "decimal"
 
 
@@ -30,7 +36,15 @@ def ser_integer(inval: int) -> str:
     return output
 
 
-def parse_number(state: ParserState) -> Union[int, Decimal]:
+def parse_number(state: ParserState) -> Union[int, Decimal, float, Milli]:
+    match = NUMBER_RE.match(state.data, state.cursor)
+    if match is not None:
+        state.cursor = match.end()
+        text = match.group()
+        if PERIOD in text:
+            return make_decimal(text, state)
+        return int(text)
+    start = state.cursor
     _type = INTEGER
     _sign = 1
     num_start = state.cursor
@@ -87,7 +101,7 @@ def parse_number(state: ParserState) -> Union[int, Decimal]:
             raise StructuredFieldError(
                 "Integer too long.", position=state.cursor - 1, offending_char=None
             )
-        output_int = int(state.data[num_start : state.cursor]) * _sign
+        output_int = int(bytes(state.data[num_start : state.cursor])) * _sign
         if not MIN_INT <= output_int <= MAX_INT:
             raise StructuredFieldError(
                 "Integer outside allowed range",
@@ -110,5 +124,14 @@ def parse_number(state: ParserState) -> Union[int, Decimal]:
             position=state.cursor - 1,
             offending_char=None,
         )
-    output_float = Decimal(state.data[num_start : state.cursor].decode("ascii")) * _sign
-    return output_float
+    return make_decimal(bytes(state.data[start : state.cursor]), state)
+
+
+def make_decimal(text: bytes, state: ParserState) -> Union[Decimal, float, Milli]:
+    "Convert the text of a valid Decimal to state.decimal_type."
+    if state.decimal_type is float:
+        return float(text)
+    if state.decimal_type == "milli":
+        whole, _, fraction = text.partition(b".")
+        return Milli(int(whole + fraction) * MILLI_SCALE[len(fraction)])
+    return Decimal(str(text, "ascii"))
@@ -0,0 +1,128 @@
+"""
+Shared instances of commonly-seen keys and Tokens.
+
+Parsing looks up the raw bytes of each key and Token here, so that the
+same str or Token object is returned every time, instead of a new one.
+The tables hold the registered field names and VOCABULARY, plus anything
+passed to add_vocabulary(); other values are returned as new objects, so the
+tables never grow as a result of parsing.
+"""
+
+from typing import Dict, Iterable
+
+from .retrofit import retrofit
+from .types import Token
+
+VOCABULARY = [
+    # Cache-Control, CDN-Cache-Control
+    "max-age",
+    "max-stale",
+    "min-fresh",
+    "must-revalidate",
+    "must-understand",
+    "no-cache",
+    "no-store",
+    "no-transform",
+    "only-if-cached",
+    "private",
+    "proxy-revalidate",
+    "public",
+    "s-maxage",
+    "immutable",
+    "stale-while-revalidate",
+    "stale-if-error",
+    # Cache-Status
+    "hit",
+    "fwd",
+    "fwd-status",
+    "ttl",
+    "stored",
+    "collapsed",
+    "key",
+    "detail",
+    "bypass",
+    "method",
+    "uri-miss",
+    "vary-miss",
+    "miss",
+    "request",
+    "stale",
+    "partial",
+    # Priority, Accept-*
+    "u",
+    "i",
+    "q",
+    "gzip",
+    "br",
+    "zstd",
+    "deflate",
+    "compress",
+    "identity",
+    "*",
+    "bytes",
+    "none",
+    # Alt-Svc, Proxy-Status, Cookies
+    "h2",
+    "h3",
+    "ma",
+    "persist",
+    "error",
+    "next-hop",
+    "received-status",
+    "details",
+    "path",
+    "domain",
+    "expires",
+    "secure",
+    "httponly",
+    "samesite",
+    "Strict",
+    "Lax",
+    "None",
+    # Methods
+    "GET",
+    "HEAD",
+    "POST",
+    "PUT",
+    "DELETE",
+    "OPTIONS",
+    "PATCH",
+]
+
+KEYS: Dict[bytes, str] = {}
+TOKENS: Dict[bytes, Token] = {}
+
+
+def intern_key(raw: bytes) -> str:
+    "Return the key for raw, which is lowercased."
+    key = KEYS.get(raw)
+    if key is None:
+        return str(raw, "ascii").lower()
+    return key
+
+
+def intern_token(raw: bytes) -> Token:
+    "Return the Token for raw."
+    token = TOKENS.get(raw)
+    if token is None:
+        return Token(str(raw, "ascii"))
+    return token
+
+
+def add_vocabulary(names: Iterable[str]) -> None:
+    "Share the keys and Tokens in names as well."
+    for name in names:
+        raw = name.encode("ascii")
+        if name == name.lower():
+            KEYS[raw] = name
+        TOKENS[raw] = Token(name)
+
+
+def reset() -> None:
+    "Return the tables to the registered field names and VOCABULARY."
+    KEYS.clear()
+    TOKENS.clear()
+    add_vocabulary([*retrofit, *VOCABULARY])
+
+
+reset()
@@ -3,7 +3,7 @@ from typing import Optional, Tuple
 from .bare_item import parse_bare_item, ser_bare_item
 from .parameters import parse_params, ser_params
 from .state import ParserState
-from .types import BareItemType, ItemType, OnDuplicateKeyType, ParamsType
+from .types import BareItemType, Item, ItemType, OnDuplicateKeyType, ParamsType
 
 PAREN_OPEN = ord(b"(")
 SEMICOLON = ord(b";")
@@ -15,10 +15,12 @@ def parse_item(
 ) -> Tuple[BareItemType, ParamsType]:
     value = parse_bare_item(state)
     params = parse_params(state, on_duplicate_key)
+    if state.compact:
+        return Item(value, params)  # type: ignore[arg-type]
     return (value, params)
 
 
-def ser_item(item: ItemType) -> str:
+def ser_item(item: ItemType, validate: bool = True) -> str:
     if not isinstance(item, tuple):
         item = (item, {})
-    return f"{ser_bare_item(item[0])}{ser_params(item[1])}"
+    return f"{ser_bare_item(item[0], validate)}{ser_params(item[1], validate)}"
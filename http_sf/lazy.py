@@ -0,0 +1,351 @@
+"""
+Dictionary and List views that only parse members when they are accessed.
+"""
+
+import re
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    overload,
+)
+
+from .byteseq import BYTE_DELIMIT_RE
+from .errors import StructuredFieldError
+from .field import parse_field
+from .innerlist import parse_item_or_inner_list
+from .parameters import parse_params
+from .retrofit import retrofit
+from .state import ParserState, fill_position
+from .types import ItemOrInnerListType, OnDuplicateKeyType, StructuredType
+from .util import discard_http_ows, discard_ows, parse_key
+
+COMMA = ord(b",")
+DQUOTE = ord(b'"')
+PERCENT = ord(b"%")
+COLON = ord(b":")
+EQUALS = ord(b"=")
+ITEM_PRECEDERS = set(b"=( ")
+MEMBER_DELIMS = re.compile(rb'[,":]')
+STRING_DELIMS = re.compile(rb'["\\]')
+DQUOTE_RE = re.compile(rb'"')
+
+
+def find_member_end(data: bytes, start: int) -> int:
+    """
+    Return the position of the comma that ends the top-level member starting
+    at start, or the end of data. Commas inside Strings, Display Strings and
+    Byte Sequences are skipped.
+    """
+    pos, within = scan_member(data, start, start)
+    return len(data) if within is not None else pos
+
+
+def scan_member(
+    data: Union[bytes, bytearray], start: int, pos: int, within: Optional[int] = None
+) -> Tuple[int, Optional[int]]:
+    """
+    Scan the top-level member starting at start for the comma that ends it,
+    from pos; within is the character that starts the String (DQUOTE),
+    Display String (PERCENT) or Byte Sequence (COLON) that pos is inside, if
+    any.
+
+    Return (the position of the comma, None) or, if data ends first, where to
+    resume scanning when there's more of it and what it is then within.
+    """
+    while True:
+        if within is None:
+            match = MEMBER_DELIMS.search(data, pos)
+            if match is None:
+                return len(data), None
+            pos = match.start()
+            char = data[pos]
+            if char == COMMA:
+                return pos, None
+            if char == DQUOTE:
+                within = PERCENT if pos > start and data[pos - 1] == PERCENT else DQUOTE
+            elif pos == start or data[pos - 1] in ITEM_PRECEDERS:
+                within = COLON
+            else:
+                pos += 1
+                continue
+            pos += 1
+        if within == DQUOTE:
+            match = STRING_DELIMS.search(data, pos)
+            while match is not None and data[match.start()] != DQUOTE:
+                pos = match.start() + 2  # skip the escaped character
+                match = STRING_DELIMS.search(data, pos)
+            if match is None:
+                # resume at a trailing backslash, so its escape is still seen
+                return (pos - 2 if pos > len(data) else len(data)), within
+        else:
+            match = (DQUOTE_RE if within == PERCENT else BYTE_DELIMIT_RE).search(
+                data, pos
+            )
+            if match is None:
+                return len(data), within
+        pos = match.start() + 1
+        within = None
+
+
+def parse_list_member(
+    state: ParserState,
+    end: int,
+    on_duplicate_key: Optional[OnDuplicateKeyType],
+) -> ItemOrInnerListType:
+    "Parse the List member from the cursor to end (the comma after it)."
+    try:
+        member = parse_item_or_inner_list(state, on_duplicate_key)
+        discard_http_ows(state)
+        if state.cursor != end:
+            raise StructuredFieldError(
+                "Trailing text after item in list",
+                position=state.cursor,
+                offending_char=state.data[state.cursor] if state.has_data() else None,
+            )
+    except StructuredFieldError as why:
+        fill_position(why, state)
+        raise why
+    return member
+
+
+def parse_dictionary_member(
+    state: ParserState,
+    key: str,
+    end: int,
+    on_duplicate_key: Optional[OnDuplicateKeyType],
+) -> ItemOrInnerListType:
+    """
+    Parse the value of the Dictionary member key, from the cursor (just after
+    the key) to end (the comma after it).
+    """
+    member: ItemOrInnerListType
+    try:
+        is_equals = state.has_data() and state.data[state.cursor] == EQUALS
+        try:
+            if is_equals:
+                state.cursor += 1  # consume the "="
+                member = parse_item_or_inner_list(state, on_duplicate_key)
+            else:
+                member = (True, parse_params(state, on_duplicate_key))
+        except StructuredFieldError as why:
+            why.context = key
+            raise why
+        discard_http_ows(state)
+        if state.cursor != end:
+            offending_char = state.data[state.cursor] if state.has_data() else None
+            if not is_equals and offending_char is not None:
+                raise StructuredFieldError(
+                    f"'{key}' should be followed by '=', not '{chr(offending_char)}'",
+                    position=state.cursor,
+                    offending_char=offending_char,
+                )
+            raise StructuredFieldError(
+                f"'{key}' has trailing characters after the value",
+                position=state.cursor,
+                offending_char=offending_char,
+            )
+    except StructuredFieldError as why:
+        fill_position(why, state)
+        raise why
+    return member
+
+
+def _next_member(state: ParserState, end: int, container: str) -> bool:
+    """
+    Move past the comma at end, returning False if there are no more members.
+    """
+    if end == len(state.data):
+        return False
+    state.cursor = end + 1
+    discard_http_ows(state)
+    if not state.has_data():
+        raise StructuredFieldError(
+            (
+                "Trailing comma at end of list"
+                if container == "list"
+                else "Dictionary has trailing comma"
+            ),
+            position=state.cursor,
+            offending_char=None,
+        )
+    return True
+
+
+class LazyList(Sequence[ItemOrInnerListType]):
+    """
+    A List whose members are parsed the first time they are accessed.
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+        on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+        strict: bool = False,
+    ) -> None:
+        self._data = data
+        self._on_duplicate_key = on_duplicate_key
+        self._bounds: List[Tuple[int, int]] = []
+        self._members: Dict[int, ItemOrInnerListType] = {}
+        state = ParserState(data)
+        discard_ows(state)
+        if not state.has_data():
+            return
+        while True:
+            start = state.cursor
+            end = find_member_end(data, start)
+            self._bounds.append((start, end))
+            if strict or end == start:
+                self._decode(len(self._bounds) - 1)
+            if not _next_member(state, end, "list"):
+                break
+
+    def _decode(self, index: int) -> ItemOrInnerListType:
+        try:
+            return self._members[index]
+        except KeyError:
+            pass
+        start, end = self._bounds[index]
+        state = ParserState(self._data)
+        state.cursor = start
+        member = parse_list_member(state, end, self._on_duplicate_key)
+        self._members[index] = member
+        return member
+
+    @overload
+    def __getitem__(self, index: int) -> ItemOrInnerListType: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[ItemOrInnerListType]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[ItemOrInnerListType, List[ItemOrInnerListType]]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self._bounds)
+        if not 0 <= index < len(self._bounds):
+            raise IndexError("list index out of range")
+        return self._decode(index)
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"<LazyList members={len(self)} decoded={len(self._members)}>"
+
+
+class LazyDictionary(Mapping[str, ItemOrInnerListType]):
+    """
+    A Dictionary whose keys are found up front, and whose members are parsed
+    the first time they are accessed.
+    """
+
+    def __init__(
+        self,
+        data: bytes,
+        on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+        strict: bool = False,
+    ) -> None:
+        self._data = data
+        self._on_duplicate_key = on_duplicate_key
+        self._bounds: Dict[str, Tuple[int, int]] = {}
+        self._members: Dict[str, ItemOrInnerListType] = {}
+        self._overridden: Dict[str, List[Tuple[int, int]]] = {}
+        state = ParserState(data)
+        discard_ows(state)
+        while True:
+            key = parse_key(state)
+            start = state.cursor
+            end = find_member_end(data, start)
+            if key in self._bounds:
+                if on_duplicate_key:
+                    on_duplicate_key(key, "dictionary")
+                if key not in self._members:
+                    # still checked when key is read, as parse() would
+                    self._overridden.setdefault(key, []).append(self._bounds[key])
+            self._bounds[key] = (start, end)
+            self._members.pop(key, None)
+            if strict:
+                self._decode(key)
+            if not _next_member(state, end, "dictionary"):
+                break
+
+    def _decode(self, key: str) -> ItemOrInnerListType:
+        try:
+            return self._members[key]
+        except KeyError:
+            pass
+        for start, end in self._overridden.get(key, []):
+            self._parse_member(key, start, end)
+        self._overridden.pop(key, None)
+        member = self._parse_member(key, *self._bounds[key])
+        self._members[key] = member
+        return member
+
+    def _parse_member(self, key: str, start: int, end: int) -> ItemOrInnerListType:
+        state = ParserState(self._data)
+        state.cursor = start
+        return parse_dictionary_member(state, key, end, self._on_duplicate_key)
+
+    def __getitem__(self, key: str) -> ItemOrInnerListType:
+        if key not in self._bounds:
+            raise KeyError(key)
+        return self._decode(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._bounds)
+
+    def __len__(self) -> int:
+        return len(self._bounds)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._bounds
+
+    def __repr__(self) -> str:
+        return f"<LazyDictionary keys={list(self._bounds)!r}>"
+
+
+def parse_lazy(
+    value: bytes,
+    name: Optional[str] = None,
+    tltype: Optional[str] = None,
+    on_duplicate_key: Optional[OnDuplicateKeyType] = None,
+    strict: bool = False,
+) -> Union[LazyDictionary, LazyList, StructuredType]:
+    """
+    Parse a Dictionary or List field value into a view that parses each
+    member when it is first accessed. Only the keys and the boundaries of
+    members are found up front; errors in a member are raised when it is read.
+
+    If strict is true, every member is parsed (and validated) immediately.
+    Otherwise, Dictionary members overridden by a later duplicate key are
+    validated when that key is first read.
+    Items are always parsed immediately.
+    """
+    if name is not None:
+        tltype = retrofit.get(name.lower(), tltype)
+    try:
+        if tltype in ["dict", "dictionary"]:
+            return LazyDictionary(value, on_duplicate_key, strict)
+        if tltype == "list":
+            return LazyList(value, on_duplicate_key, strict)
+    except StructuredFieldError as why:
+        if why.position is None:
+            why.position = len(value)
+        raise why
+    return parse_field(ParserState(value), tltype, on_duplicate_key)
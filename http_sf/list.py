@@ -1,17 +1,29 @@
+import re
 from typing import Optional
 
 from .errors import StructuredFieldError
 from .innerlist import parse_item_or_inner_list, ser_item_or_inner_list
+from .integer import INTEGER_PATTERN, NUMBER_START_CHARS
+from .intern import intern_token
 from .state import ParserState
-from .types import ListType, OnDuplicateKeyType
+from .token import TOKEN_PATTERN
+from .types import Item, ListType, OnDuplicateKeyType
 from .util import discard_http_ows
 
 COMMA = ord(b",")
+SIMPLE_MEMBER = rb"(?:" + TOKEN_PATTERN + rb"|" + INTEGER_PATTERN + rb")"
+SIMPLE_LIST = re.compile(
+    SIMPLE_MEMBER + rb"(?:[ \t]*,[ \t]*" + SIMPLE_MEMBER + rb")*[ \t]*"
+)
+SIMPLE_LIST_MEMBER = re.compile(rb"[^ \t,]+")
 
 
 def parse_list(
     state: ParserState, on_duplicate_key: Optional[OnDuplicateKeyType] = None
 ) -> ListType:
+    _list = parse_simple_list(state)
+    if _list is not None:
+        return _list
     _list = []
     data_len = len(state.data)
     while state.cursor < data_len:
@@ -37,7 +49,25 @@ def parse_list(
     return _list
 
 
-def ser_list(_list: ListType) -> str:
+def parse_simple_list(state: ParserState) -> Optional[ListType]:
+    """
+    Parse the rest of the input as a List of Tokens and Integers without
+    parameters, if that is all it contains. Otherwise, return None without
+    consuming anything.
+    """
+    if SIMPLE_LIST.fullmatch(state.data, state.cursor) is None:
+        return None
+    values = [
+        (int(member) if member[0] in NUMBER_START_CHARS else intern_token(member))
+        for member in SIMPLE_LIST_MEMBER.findall(state.data, state.cursor)
+    ]
+    state.cursor = len(state.data)
+    if state.compact:
+        return [Item(value) for value in values]
+    return [(value, {}) for value in values]
+
+
+def ser_list(_list: ListType, validate: bool = True) -> str:
     if len(_list) == 0:
         raise ValueError("No contents; field should not be emitted")
-    return ", ".join([ser_item_or_inner_list(m) for m in _list])
+    return ", ".join([ser_item_or_inner_list(m, validate) for m in _list])
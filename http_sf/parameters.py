@@ -1,9 +1,9 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from .bare_item import parse_bare_item, ser_bare_item
 from .errors import StructuredFieldError
 from .state import ParserState
-from .types import BareItemType, OnDuplicateKeyType, ParamsType
+from .types import EMPTY_PARAMS, BareItemType, OnDuplicateKeyType, Params, ParamsType
 from .util import discard_ows, parse_key, ser_key
 
 PAREN_OPEN = ord(b"(")
@@ -14,7 +14,7 @@ EQUALS = ord(b"=")
 def parse_params(
     state: ParserState, on_duplicate_key: Optional[OnDuplicateKeyType] = None
 ) -> ParamsType:
-    params = {}
+    params: Dict[str, BareItemType] = {}
     while True:
         try:
             if state.data[state.cursor] != SEMICOLON:
@@ -38,13 +38,16 @@ def parse_params(
         if on_duplicate_key and param_name in params:
             on_duplicate_key(param_name, "parameter")
         params[param_name] = param_value
+    if state.compact:
+        return Params(params) if params else EMPTY_PARAMS
     return params
 
 
-def ser_params(params: ParamsType) -> str:
+def ser_params(params: ParamsType, validate: bool = True) -> str:
     return "".join(
         [
-            f";{ser_key(k)}{f'={ser_bare_item(v)}' if v is not True else ''}"
+            f";{ser_key(k, validate)}"
+            f"{f'={ser_bare_item(v, validate)}' if v is not True else ''}"
             for k, v in params.items()
         ]
     )
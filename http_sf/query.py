@@ -0,0 +1,203 @@
+"""
+Answer questions about a field value without building the whole structure.
+
+Members that consist only of Tokens, Integers, Decimals, Strings and Booleans
+are validated with a regular expression and skipped; any other member is
+parsed (and discarded) by the normal parser, so the answer is the same as
+that given by a full parse, including errors.
+"""
+
+import re
+from typing import Optional
+
+from .boolean import BOOLEAN_PATTERN
+from .decimal import DECIMAL_PATTERN
+from .errors import StructuredFieldError
+from .innerlist import parse_item_or_inner_list
+from .integer import INTEGER_PATTERN
+from .parameters import parse_params
+from .retrofit import retrofit
+from .state import ParserState, fill_position
+from .string import STRING_PATTERN
+from .token import TOKEN_PATTERN, TOKEN_START_CHARS
+from .types import ItemOrInnerListType
+from .util import KEY_PATTERN, discard_http_ows, discard_ows, parse_key
+
+COMMA = ord(b",")
+EQUALS = ord(b"=")
+
+BARE_ITEM = (
+    rb"(?:"
+    + rb"|".join(
+        [
+            TOKEN_PATTERN,
+            DECIMAL_PATTERN,
+            INTEGER_PATTERN,
+            STRING_PATTERN,
+            BOOLEAN_PATTERN,
+        ]
+    )
+    + rb")"
+)
+PARAMS = rb"(?:;[ ]*" + KEY_PATTERN + rb"(?:=" + BARE_ITEM + rb")?)*"
+ITEM = BARE_ITEM + PARAMS
+INNER_LIST = rb"\([ ]*(?:" + ITEM + rb"(?:[ ]+" + ITEM + rb")*[ ]*)?\)" + PARAMS
+MEMBER_END = rb"(?=[ \t]*(?:,|\Z))"
+SIMPLE_MEMBER = re.compile(rb"(?:" + INNER_LIST + rb"|" + ITEM + rb")" + MEMBER_END)
+SIMPLE_PARAMS = re.compile(PARAMS + MEMBER_END)
+SIMPLE_DICTIONARY_MEMBER = re.compile(
+    rb"("
+    + KEY_PATTERN
+    + rb")(=)?(?(2)(?:"
+    + INNER_LIST
+    + rb"|"
+    + ITEM
+    + rb")|"
+    + PARAMS
+    + rb")"
+    + MEMBER_END
+)
+TOKEN = re.compile(TOKEN_PATTERN)
+
+
+def _skip_member(state: ParserState) -> None:
+    "Validate and move past the Item or Inner List at the cursor."
+    match = SIMPLE_MEMBER.match(state.data, state.cursor)
+    if match is None:
+        parse_item_or_inner_list(state)
+    else:
+        state.cursor = match.end()
+
+
+def _next_member(state: ParserState, message: str, trailing: str) -> bool:
+    """
+    Move past the separator after a member, returning False at end of input.
+    """
+    discard_http_ows(state)
+    if not state.has_data():
+        return False
+    if state.data[state.cursor] != COMMA:
+        raise StructuredFieldError(
+            message,
+            position=state.cursor,
+            offending_char=state.data[state.cursor],
+        )
+    state.cursor += 1
+    discard_http_ows(state)
+    if not state.has_data():
+        raise StructuredFieldError(trailing, position=state.cursor, offending_char=None)
+    return True
+
+
+def _resolve_type(name: Optional[str], tltype: Optional[str], wanted: str) -> None:
+    if name is not None:
+        tltype = retrofit.get(name.lower(), tltype)
+    if tltype == "dict":
+        tltype = "dictionary"
+    if tltype != wanted:
+        raise KeyError(f"field is not a {wanted.capitalize()}")
+
+
+def get_member(
+    value: bytes,
+    key: str,
+    name: Optional[str] = None,
+    tltype: Optional[str] = "dictionary",
+) -> Optional[ItemOrInnerListType]:
+    """
+    Return the member of the Dictionary field value with the given key, or
+    None if it isn't present. Only that member is fully parsed, but the whole
+    value is checked, so invalid fields raise StructuredFieldError.
+    """
+    _resolve_type(name, tltype, "dictionary")
+    wanted = key.encode("ascii", "replace")
+    state = ParserState(value)
+    found: Optional[int] = None
+    try:
+        discard_ows(state)
+        while True:
+            match = SIMPLE_DICTIONARY_MEMBER.match(state.data, state.cursor)
+            if match is not None:
+                if match.group(1) == wanted:
+                    found = match.end(1)
+                state.cursor = match.end()
+                # the match is always followed by a comma or the end of input
+                if not _next_member(state, "", "Dictionary has trailing comma"):
+                    break
+                continue
+            this_key = parse_key(state)
+            if this_key == key:
+                found = state.cursor
+            is_equals = state.has_data() and state.data[state.cursor] == EQUALS
+            try:
+                if is_equals:
+                    state.cursor += 1  # consume the "="
+                    _skip_member(state)
+                else:
+                    match = SIMPLE_PARAMS.match(state.data, state.cursor)
+                    if match is None:
+                        parse_params(state)
+                    else:
+                        state.cursor = match.end()
+            except StructuredFieldError as why:
+                why.context = this_key
+                raise why
+            discard_http_ows(state)
+            if state.has_data() and state.data[state.cursor] != COMMA and not is_equals:
+                offending_char = state.data[state.cursor]
+                raise StructuredFieldError(
+                    f"'{this_key}' should be followed by '=', not '{chr(offending_char)}'",
+                    position=state.cursor,
+                    offending_char=offending_char,
+                )
+            if not _next_member(
+                state,
+                f"'{this_key}' has trailing characters after the value",
+                "Dictionary has trailing comma",
+            ):
+                break
+    except StructuredFieldError as why:
+        fill_position(why, state)
+        raise why
+    if found is None:
+        return None
+    state.cursor = found
+    if state.has_data() and state.data[state.cursor] == EQUALS:
+        state.cursor += 1
+        return parse_item_or_inner_list(state)
+    return (True, parse_params(state))
+
+
+def contains_token(
+    value: bytes,
+    token: str,
+    name: Optional[str] = None,
+    tltype: Optional[str] = "list",
+) -> bool:
+    """
+    Return whether the List field value has an Item that is the given Token
+    (ignoring any parameters). The whole value is checked, so invalid fields
+    raise StructuredFieldError.
+    """
+    _resolve_type(name, tltype, "list")
+    wanted = token.encode("ascii", "replace")
+    found = False
+    state = ParserState(value)
+    try:
+        discard_ows(state)
+        while state.has_data():
+            start = state.cursor
+            _skip_member(state)
+            if not found and state.data[start] in TOKEN_START_CHARS:
+                match = TOKEN.match(state.data, start)
+                found = match is not None and match.group() == wanted
+            if not _next_member(
+                state,
+                "Trailing text after item in list",
+                "Trailing comma at end of list",
+            ):
+                break
+    except StructuredFieldError as why:
+        fill_position(why, state)
+        raise why
+    return found
@@ -0,0 +1,619 @@
+"""
+Declare the members of a structured field, and compile the declaration into a
+parser for that field.
+
+A FieldSchema lists the members (or, for Lists and Items, the member) that a
+field can have, the type and range of their values, and the Parameters they
+can carry. compile_schema() generates the source of a parser specialised to
+the schema, so that the field is parsed and checked in one pass. Compiled
+parsers are cached by schema.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+from keyword import iskeyword
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from . import util
+from .bare_item import parse_bare_item
+from .boolean import QUESTION, parse_boolean
+from .byteseq import BYTE_DELIMIT, parse_byteseq
+from .date import parse_date
+from .display_string import PERCENT, parse_display_string
+from .errors import StructuredFieldError
+from .innerlist import parse_item_or_inner_list
+from .integer import NUMBER_START_CHARS, parse_number
+from .item import parse_item
+from .parameters import parse_params
+from .retrofit import retrofit
+from .state import ParserState, fill_position
+from .string import DQUOTE, parse_string
+from .token import TOKEN_START_CHARS, parse_token
+from .types import BufferType, DisplayString, Token
+from .util import HTTP_OWS, KEY_RE, discard_http_ows, discard_ows, parse_key
+
+EQUALS = ord(b"=")
+COMMA = ord(b",")
+SEMICOLON = ord(b";")
+AT = ord(b"@")
+
+OWS = [
+    "if state.cursor < data_len and data[state.cursor] in HTTP_OWS:",
+    "    discard_http_ows(state)",
+]
+
+# the characters that can start each type, and the function that parses it
+BARE_ITEM_PARSERS: Dict[type, Tuple[Iterable[int], Callable[[ParserState], Any]]] = {
+    int: (NUMBER_START_CHARS, parse_number),
+    Decimal: (NUMBER_START_CHARS, parse_number),
+    bool: ([QUESTION], parse_boolean),
+    str: ([DQUOTE], parse_string),
+    Token: (TOKEN_START_CHARS, parse_token),
+    bytes: ([BYTE_DELIMIT], parse_byteseq),
+    datetime: ([AT], parse_date),
+    DisplayString: ([PERCENT], parse_display_string),
+}
+
+
+class MemberSchema:
+    """
+    The allowed values of a Dictionary member, a List member, an Item or a
+    Parameter.
+
+    type is the type of the Bare Item: int, Decimal, bool, str, Token, bytes,
+    datetime or DisplayString. minimum and maximum are inclusive limits, and
+    values is a collection of the allowed values.
+
+    default is used when the member is missing, or when it isn't valid and
+    the field schema isn't strict. Because it's returned in every such
+    result, it has to be immutable (hashable).
+
+    params maps the names of allowed Parameters to their MemberSchemas. If
+    it's given, the result for the member is a tuple of (value, parameters);
+    otherwise, the result is just the value, and Parameters are ignored.
+    """
+
+    __slots__ = ("type", "minimum", "maximum", "values", "default", "params")
+
+    def __init__(
+        self,
+        type: Type[Any],  # pylint: disable=redefined-builtin
+        minimum: Any = None,
+        maximum: Any = None,
+        values: Optional[Iterable[Any]] = None,
+        default: Any = None,
+        params: Optional[Mapping[str, "MemberSchema"]] = None,
+    ) -> None:
+        if type not in BARE_ITEM_PARSERS:
+            raise ValueError(f"Unsupported member type {type!r}")
+        self.type = type
+        self.minimum = minimum
+        self.maximum = maximum
+        self.values = frozenset(values) if values is not None else None
+        try:
+            hash(default)
+        except TypeError as why:
+            raise ValueError(f"Default {default!r} isn't immutable") from why
+        self.default = default
+        self.params = _check_keys(params) if params is not None else None
+
+    def _key(self) -> Hashable:
+        # values are tagged with their type, so that (for example) 1 and True differ
+        return (
+            self.type,
+            _tag(self.minimum),
+            _tag(self.maximum),
+            None if self.values is None else frozenset(map(_tag, self.values)),
+            _tag(self.default),
+            None if self.params is None else tuple(self.params.items()),
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, MemberSchema):
+            return self._key() == other._key()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"MemberSchema({self.type.__name__})"
+
+
+class FieldSchema:
+    """
+    The members of a field.
+
+    tltype is the field's top-level type. For Dictionaries, members maps the
+    allowed keys to their MemberSchemas; for Lists and Items, member is the
+    MemberSchema for every member (or the Item).
+
+    If strict is true, unknown keys and Parameters and invalid values are
+    errors. Otherwise, they are ignored; invalid Dictionary members and Items
+    take their default, and invalid List members are dropped.
+
+    Dictionaries are returned as a dict with every key in members, unless
+    factory is given; then, it is called with the members as keyword
+    arguments (with "-" in keys replaced by "_"). A NamedTuple or dataclass
+    works well; keys that still aren't identifiers (such as "a.b") need a
+    factory that takes **kwargs.
+    """
+
+    __slots__ = ("tltype", "members", "member", "strict", "factory", "_parser")
+
+    def __init__(
+        self,
+        tltype: str,
+        members: Optional[Mapping[str, MemberSchema]] = None,
+        member: Optional[MemberSchema] = None,
+        strict: bool = False,
+        factory: Optional[Callable[..., Any]] = None,
+    ) -> None:
+        if tltype == "dict":
+            tltype = "dictionary"
+        if tltype == "dictionary":
+            if members is None or member is not None:
+                raise ValueError("Dictionary schemas need members, and no member")
+            self.members: Optional[Dict[str, MemberSchema]] = _check_keys(members)
+        elif tltype in ["list", "item"]:
+            if member is None or members is not None:
+                raise ValueError(f"{tltype.capitalize()} schemas need a member")
+            self.members = None
+        else:
+            raise ValueError(f"Unrecognised top-level type {tltype!r}")
+        self.tltype = tltype
+        self.member = member
+        self.strict = strict
+        self.factory = factory
+        self._parser: Optional[Callable[[BufferType], Any]] = None
+
+    def parse(self, value: BufferType) -> Any:
+        "Parse and check a field value, raising StructuredFieldError if invalid."
+        if self._parser is None:
+            self._parser = compile_schema(self)
+        return self._parser(value)
+
+    def _key(self) -> Hashable:
+        return (
+            self.tltype,
+            None if self.members is None else tuple(self.members.items()),
+            self.member,
+            self.strict,
+            self.factory,
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, FieldSchema):
+            return self._key() == other._key()
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def __repr__(self) -> str:
+        return f"FieldSchema({self.tltype!r})"
+
+
+def schema_for(name: str, **args: Any) -> FieldSchema:
+    "Return a FieldSchema for the field name, using its type from retrofit."
+    return FieldSchema(retrofit[name.lower()], **args)
+
+
+def _check_keys(members: Mapping[str, MemberSchema]) -> Dict[str, MemberSchema]:
+    for key in members:
+        if not KEY_RE.fullmatch(key.encode("ascii", "replace")):
+            raise ValueError(f"Invalid key {key!r}")
+    return dict(members)
+
+
+def _tag(value: Any) -> Tuple[type, Hashable]:
+    return (type(value), value)
+
+
+_compiled: Dict[FieldSchema, Callable[[BufferType], Any]] = {}
+
+
+def compile_schema(schema: FieldSchema) -> Callable[[BufferType], Any]:
+    """
+    Return a function that parses a field value according to schema. The
+    function is generated the first time an equal schema is compiled.
+    """
+    try:
+        return _compiled[schema]
+    except KeyError:
+        pass
+    source, namespace = generate_source(schema)
+    # the source is generated from the schema; field values are only its input
+    exec(  # pylint: disable=exec-used
+        compile(source, f"<schema {schema.tltype}>", "exec"), namespace
+    )
+    parse_structure = namespace["parse_structure"]
+
+    def parse_schema(value: BufferType) -> Any:
+        state = ParserState(value)
+        if state.data[:1] == b" ":
+            discard_ows(state)
+        try:
+            result = parse_structure(state)
+            if state.has_data():
+                discard_ows(state)
+            if state.has_data():
+                raise StructuredFieldError(
+                    "Trailing characters after value (missing comma?)",
+                    position=state.cursor,
+                    offending_char=state.data[state.cursor],
+                )
+        except StructuredFieldError as why:
+            fill_position(why, state)
+            raise why
+        return result
+
+    _compiled[schema] = parse_schema
+    return parse_schema
+
+
+class _Generator:
+    "Generate the source of a parser for a FieldSchema."
+
+    def __init__(self, schema: FieldSchema) -> None:
+        self.schema = schema
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {
+            "StructuredFieldError": StructuredFieldError,
+            "parse_bare_item": parse_bare_item,
+            "parse_item": parse_item,
+            "parse_item_or_inner_list": parse_item_or_inner_list,
+            "parse_params": parse_params,
+            "parse_key": parse_key,
+            "discard_ows": discard_ows,
+            "discard_http_ows": discard_http_ows,
+            "KEY_RE": KEY_RE,
+            "HTTP_OWS": HTTP_OWS,
+            "util": util,
+            "COMMA": COMMA,
+            "EQUALS": EQUALS,
+            "SEMICOLON": SEMICOLON,
+        }
+        self.functions: List[str] = []
+        self._names: Dict[int, str] = {}
+        self._kept: List[Any] = []
+
+    def name(self, value: Any, prefix: str = "c") -> str:
+        "Return the name of value in the generated code's namespace."
+        try:
+            return self._names[id(value)]
+        except KeyError:
+            pass
+        name = f"_{prefix}{len(self._names)}"
+        self._names[id(value)] = name
+        self._kept.append(value)  # so that its id isn't reused
+        self.namespace[name] = value
+        return name
+
+    def emit(self, indent: int, *lines: str) -> None:
+        self.lines.extend(f"{'    ' * indent}{line}" if line else "" for line in lines)
+
+    def check(self, member: MemberSchema, var: str) -> str:
+        "Return an expression that is true when var is valid for member."
+        tests = [f"type({var}) is {self.name(member.type)}"]
+        if member.minimum is not None:
+            tests.append(f"{var} >= {self.name(member.minimum)}")
+        if member.maximum is not None:
+            tests.append(f"{var} <= {self.name(member.maximum)}")
+        if member.values is not None:
+            tests.append(f"{var} in {self.name(member.values)}")
+        return " and ".join(tests)
+
+    def invalid(self, indent: int, message: str, store: Optional[str]) -> None:
+        """
+        Handle an invalid value: raise if the schema is strict, otherwise run
+        store (if given).
+        """
+        if self.schema.strict:
+            self.emit(
+                indent,
+                "raise StructuredFieldError(",
+                f"    {message},",
+                "    position=value_start,",
+                "    offending_char=data[value_start] if value_start < data_len"
+                " else None,",
+                ")",
+            )
+        else:
+            self.emit(indent, store or "pass")
+
+    def params_function(self, params: Dict[str, MemberSchema]) -> str:
+        "Generate a function that parses Parameters, and return its name."
+        if id(params) in self._names:
+            return self._names[id(params)]
+        func = self.name(params, "params")
+        defaults = {
+            name: member.default
+            for name, member in params.items()
+            if member.default is not None
+        }
+        lines, self.lines = self.lines, self.functions
+        self.emit(
+            0,
+            f"def {func}(state):",
+            "    data = state.data",
+            "    data_len = len(data)",
+            f"    params = dict({self.name(defaults)})",
+            "    while state.cursor < data_len and data[state.cursor] == SEMICOLON:",
+            '        state.cursor += 1  # consume the ";"',
+            "        discard_ows(state)",
+            "        value_start = state.cursor",
+            "        name = parse_key(state)",
+        )
+        if self.schema.strict:
+            self.emit(2, f"if name not in {self.name(frozenset(params))}:")
+            self.invalid(3, "f\"Unknown parameter '{name}'\"", None)
+        self.emit(
+            2,
+            "if state.cursor < data_len and data[state.cursor] == EQUALS:",
+            '    state.cursor += 1  # consume the "="',
+            "    value_start = state.cursor",
+            "    try:",
+            "        value = parse_bare_item(state)",
+            "    except StructuredFieldError as why:",
+            "        why.context = name",
+            "        raise why",
+            "else:",
+            "    value = True",
+        )
+        keyword = "if"
+        for name, member in params.items():
+            self.emit(2, f"{keyword} name == {name!r}:")
+            self.emit(3, f"if {self.check(member, 'value')}:")
+            self.emit(4, f"params[{name!r}] = value")
+            self.emit(3, "else:")
+            self.invalid(
+                4,
+                f"\"Invalid value for parameter '{name}'\"",
+                (
+                    f"params[{name!r}] = {self.name(member.default)}"
+                    if member.default is not None
+                    else f"params.pop({name!r}, None)"
+                ),
+            )
+            keyword = "elif"
+        self.emit(1, "return params", "", "")
+        self.lines = lines
+        return func
+
+    def member_value(
+        self,
+        indent: int,
+        member: MemberSchema,
+        fallback: str,
+        message: str,
+        store: str,
+        bare: bool = False,
+        is_list: bool = False,
+    ) -> None:
+        """
+        Parse a member's value with the parser for its type, and check it. If
+        it's valid, it's stored with store (a format string); otherwise, the
+        schema's default is stored, unless the schema is strict. Values that
+        start with a character that can't begin the type are parsed with
+        fallback, and are invalid. If bare is true, the member can be a
+        Dictionary key without a value; if is_list is true, invalid members
+        are skipped rather than given their default.
+        """
+        start_chars, parser = BARE_ITEM_PARSERS[member.type]
+        if member.params is not None:
+            params = [f"params = {self.params_function(member.params)}(state)"]
+            result = "(value, params)"
+        else:
+            params = [
+                "if state.cursor < data_len and data[state.cursor] == SEMICOLON:",
+                "    parse_params(state)",
+            ]
+            result = "value"
+        keyword = "if"
+        if bare:
+            self.emit(indent, "if not is_equals:", "    value = True")
+            self.emit(indent + 1, *params)
+            keyword = "elif"
+        self.emit(
+            indent,
+            f"{keyword} state.cursor < data_len and data[state.cursor] in "
+            f"{self.name(frozenset(start_chars))}:",
+            f"    value = {self.name(parser)}(state)",
+        )
+        self.emit(indent + 1, *params)
+        self.emit(
+            indent,
+            "else:",
+            f"    {fallback}",
+            "    value = None",
+            f"if {self.check(member, 'value')}:",
+            f"    {store.format(result)}",
+            "else:",
+        )
+        self.invalid(
+            indent + 1,
+            message,
+            None if is_list else store.format(self.name(member.default)),
+        )
+
+    def gen_dictionary(self) -> None:
+        members = self.schema.members
+        assert members is not None
+        self.emit(
+            0,
+            "def parse_structure(state):",
+            "    data = state.data",
+            "    data_len = len(data)",
+        )
+        for i, (key, member) in enumerate(members.items()):
+            self.emit(1, f"m{i} = {self.name(member.default)}")
+        self.emit(
+            1,
+            "while True:",
+            "    value_start = state.cursor",
+            "    match = KEY_RE.match(data, value_start)",
+            "    if match is None or util.COMPAT:",
+            "        raw_key = parse_key(state).encode('ascii')",
+            "    else:",
+            "        state.cursor = match.end()",
+            "        raw_key = match.group()",
+            "    is_equals = state.cursor < data_len and data[state.cursor] == EQUALS",
+            "    if is_equals:",
+            '        state.cursor += 1  # consume the "="',
+            "    try:",
+        )
+        keyword = "if"
+        for i, (key, member) in enumerate(members.items()):
+            self.emit(
+                3,
+                f"{keyword} raw_key == {key.encode('ascii')!r}:",
+                "    value_start = state.cursor",
+            )
+            self.member_value(
+                4,
+                member,
+                "parse_item_or_inner_list(state)",
+                f"\"Invalid value for '{key}'\"",
+                f"m{i} = {{}}",
+                bare=True,
+            )
+            keyword = "elif"
+        self.emit(3, "else:")
+        if self.schema.strict:
+            self.invalid(4, "f\"Unknown key '{raw_key.decode()}'\"", None)
+        self.emit(
+            4,
+            "if is_equals:",
+            "    parse_item_or_inner_list(state)",
+            "else:",
+            "    parse_params(state)",
+        )
+        self.emit(
+            1,
+            "    except StructuredFieldError as why:",
+            "        why.context = raw_key.decode()",
+            "        raise why",
+            *[f"    {line}" for line in OWS],
+            "    if state.cursor == data_len:",
+            "        break",
+            "    if data[state.cursor] != COMMA:",
+            "        this_key = raw_key.decode()",
+            "        if not is_equals:",
+            "            offending_char = data[state.cursor]",
+            "            raise StructuredFieldError(",
+            "                f\"'{this_key}' should be followed by '=', not"
+            " '{chr(offending_char)}'\",",
+            "                position=state.cursor,",
+            "                offending_char=offending_char,",
+            "            )",
+            "        raise StructuredFieldError(",
+            "            f\"'{this_key}' has trailing characters after the value\",",
+            "            position=state.cursor,",
+            "            offending_char=data[state.cursor],",
+            "        )",
+            "    state.cursor += 1",
+            *[f"    {line}" for line in OWS],
+            "    if state.cursor == data_len:",
+            "        raise StructuredFieldError(",
+            '            "Dictionary has trailing comma",',
+            "            position=state.cursor,",
+            "            offending_char=None,",
+            "        )",
+        )
+        if self.schema.factory is None:
+            values = ", ".join(f"{key!r}: m{i}" for i, key in enumerate(members))
+            self.emit(1, f"return {{{values}}}")
+        else:
+            args = []
+            others = []
+            for i, key in enumerate(members):
+                name = key.replace("-", "_")
+                if name.isidentifier() and not iskeyword(name):
+                    args.append(f"{name}=m{i}")
+                else:
+                    others.append(f"{name!r}: m{i}")
+            if others:
+                args.append(f"**{{{', '.join(others)}}}")
+            self.emit(1, f"return {self.name(self.schema.factory)}({', '.join(args)})")
+
+    def gen_list(self) -> None:
+        member = self.schema.member
+        assert member is not None
+        self.emit(
+            0,
+            "def parse_structure(state):",
+            "    data = state.data",
+            "    data_len = len(data)",
+            "    result = []",
+            "    while state.cursor < data_len:",
+            "        value_start = state.cursor",
+        )
+        self.member_value(
+            2,
+            member,
+            "parse_item_or_inner_list(state)",
+            '"Invalid list member"',
+            "result.append({})",
+            is_list=True,
+        )
+        self.emit(
+            2,
+            *OWS,
+            "if state.cursor == data_len:",
+            "    break",
+            "if data[state.cursor] != COMMA:",
+            "    raise StructuredFieldError(",
+            '        "Trailing text after item in list",',
+            "        position=state.cursor,",
+            "        offending_char=data[state.cursor],",
+            "    )",
+            "state.cursor += 1",
+            *OWS,
+            "if state.cursor == data_len:",
+            "    raise StructuredFieldError(",
+            '        "Trailing comma at end of list",',
+            "        position=state.cursor,",
+            "        offending_char=None,",
+            "    )",
+        )
+        self.emit(1, "return result")
+
+    def gen_item(self) -> None:
+        member = self.schema.member
+        assert member is not None
+        self.emit(
+            0,
+            "def parse_structure(state):",
+            "    data = state.data",
+            "    data_len = len(data)",
+            "    value_start = state.cursor",
+            "    if value_start == data_len:",
+            "        parse_bare_item(state)  # raises",
+        )
+        self.member_value(
+            1, member, "parse_item(state)", '"Invalid Item"', "result = {}"
+        )
+        self.emit(1, "return result")
+
+
+def generate_source(schema: FieldSchema) -> Tuple[str, Dict[str, Any]]:
+    """
+    Return the source of a module defining parse_structure(state) for schema,
+    and the namespace to run it in.
+    """
+    generator = _Generator(schema)
+    getattr(generator, f"gen_{schema.tltype}")()
+    source = "\n".join(generator.functions + generator.lines) + "\n"
+    return source, generator.namespace
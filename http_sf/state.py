@@ -1,22 +1,88 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, FrozenSet, Optional, Union
+
 from http_sf.errors import StructuredFieldError
+from http_sf.types import BufferType, BytesTypeType, DateTypeType, DecimalTypeType
+
+DECIMAL_TYPES = frozenset([Decimal, float, "milli"])
+DATE_TYPES = frozenset([datetime, "epoch", "lazy"])
+BYTES_TYPES = frozenset([bytes, "lazy"])
+
+
+def _check_option(name: str, value: Any, allowed: FrozenSet[Any]) -> None:
+    try:
+        if value in allowed:
+            return
+    except TypeError:  # unhashable
+        pass
+    raise ValueError(f"Unrecognised {name} {value!r}")
 
 
 class ParserState:
-    def __init__(self, data: bytes):
-        self.data = data
+    """
+    The input and current position of a parse.
+
+    data can be any object supporting the buffer protocol; anything other
+    than a whole bytes object is accessed through a memoryview, so that the
+    input is never copied. start and end select a part of data to parse;
+    positions are relative to start.
+
+    If compact is true, Items and Inner Lists are returned as Item and
+    InnerList objects, with immutable Params.
+
+    decimal_type is the type that Decimals are returned as: Decimal, float,
+    or "milli" for a Milli (an integer number of thousandths).
+
+    date_type is the type that Dates are returned as: datetime, "epoch" for an
+    EpochDate (an integer number of seconds), or "lazy" for a LazyDate.
+
+    bytes_type is the type that Byte Sequences are returned as: bytes, or
+    "lazy" for a LazyBytes that holds a view of the base64 text in data.
+    """
+
+    def __init__(
+        self,
+        data: BufferType,
+        start: int = 0,
+        end: Optional[int] = None,
+        compact: bool = False,
+        decimal_type: DecimalTypeType = Decimal,
+        date_type: DateTypeType = datetime,
+        bytes_type: BytesTypeType = bytes,
+    ):
+        self.data: Union[bytes, memoryview]
+        if isinstance(data, bytes) and not start and end is None:
+            self.data = data
+        else:
+            view = memoryview(data)
+            if view.format != "B" or view.ndim != 1:
+                view = view.cast("B")
+            self.data = view[start:end]
         self.cursor = 0
+        self.compact = compact
+        # the defaults are checked by identity, to keep construction cheap
+        if decimal_type is not Decimal:
+            _check_option("decimal_type", decimal_type, DECIMAL_TYPES)
+        self.decimal_type = decimal_type
+        if date_type is not datetime:
+            _check_option("date_type", date_type, DATE_TYPES)
+        self.date_type = date_type
+        if bytes_type is not bytes:
+            _check_option("bytes_type", bytes_type, BYTES_TYPES)
+        self.bytes_type = bytes_type
 
     def has_data(self) -> bool:
         return self.cursor < len(self.data)
 
-    def peek(self) -> bytes:
+    def peek(self) -> Union[bytes, memoryview]:
         if not self.has_data():
             raise StructuredFieldError(
                 "End of input", position=self.cursor, offending_char=None
             )
         return self.data[self.cursor : self.cursor + 1]
 
-    def consume_char(self) -> bytes:
+    def consume_char(self) -> Union[bytes, memoryview]:
         if not self.has_data():
             raise StructuredFieldError(
                 "End of input", position=self.cursor, offending_char=None
@@ -24,3 +90,13 @@ class ParserState:
         char = self.data[self.cursor : self.cursor + 1]
         self.cursor += 1
         return char
+
+
+def fill_position(why: StructuredFieldError, state: ParserState) -> None:
+    "Give why the position of state's cursor, if it doesn't have one already."
+    if why.position is None:
+        why.position = state.cursor
+        try:
+            why.offending_char = state.data[state.cursor]
+        except IndexError:
+            why.offending_char = None
@@ -1,15 +1,25 @@
+import re
+
+from . import util
 from .errors import StructuredFieldError
 from .state import ParserState
 
 DQUOTE = ord('"')
 BACKSLASH = ord("\\")
 DQUOTEBACKSLASH = set([DQUOTE, BACKSLASH])
+STRING_RUN_RE = re.compile(rb"[\x20\x21\x23-\x5b\x5d-\x7e]*")
+ESCAPED = {DQUOTE: b'"', BACKSLASH: b"\\"}
+STRING_PATTERN = rb'"(?:[\x20\x21\x23-\x5b\x5d-\x7e]|\\["\\])*"'
 
 
 def parse_string(state: ParserState) -> str:
-    output_string = bytearray()
+    chunks = []
     state.cursor += 1  # consume DQUOTE
     while True:
+        start = state.cursor
+        run = STRING_RUN_RE.match(state.data, start)
+        state.cursor = run.end()  # type: ignore[union-attr]
+        chunks.append(state.data[start : state.cursor])
         try:
             char = state.data[state.cursor]
         except IndexError as why:
@@ -19,37 +29,37 @@ def parse_string(state: ParserState) -> str:
                 offending_char=None,
             ) from why
         state.cursor += 1
-        if char == BACKSLASH:
-            try:
-                next_char = state.data[state.cursor]
-            except IndexError as why:
-                raise StructuredFieldError(
-                    "Last character of input was a backslash",
-                    position=state.cursor,
-                    offending_char=None,
-                ) from why
-            state.cursor += 1
-            if next_char not in DQUOTEBACKSLASH:
-                raise StructuredFieldError(
-                    f"Backslash before disallowed character '{chr(next_char)}'",
-                    position=state.cursor - 1,
-                    offending_char=next_char,
-                )
-            output_string.append(next_char)
-        elif char == DQUOTE:
-            return output_string.decode("ascii")
-        elif not 31 < char < 127:
+        if char == DQUOTE:
+            if len(chunks) == 1:
+                return str(chunks[0], "ascii")
+            return b"".join(chunks).decode("ascii")
+        if char != BACKSLASH:
             raise StructuredFieldError(
                 "String contains disallowed character",
                 position=state.cursor - 1,
                 offending_char=char,
             )
-        else:
-            output_string.append(char)
+        try:
+            next_char = state.data[state.cursor]
+        except IndexError as why:
+            raise StructuredFieldError(
+                "Last character of input was a backslash",
+                position=state.cursor,
+                offending_char=None,
+            ) from why
+        state.cursor += 1
+        if next_char not in DQUOTEBACKSLASH:
+            raise StructuredFieldError(
+                f"Backslash before disallowed character '{chr(next_char)}'",
+                position=state.cursor - 1,
+                offending_char=next_char,
+            )
+        chunks.append(ESCAPED[next_char])
 
 
-def ser_string(inval: str) -> str:
-    if not all(31 < ord(char) < 127 for char in inval):
-        raise ValueError("String contains disallowed characters")
+def ser_string(inval: str, validate: bool = True) -> str:
+    if validate or util.FORCE_VALIDATION:
+        if not all(31 < ord(char) < 127 for char in inval):
+            raise ValueError("String contains disallowed characters")
     escaped = inval.replace("\\", "\\\\").replace('"', '\\"')
     return f'"{escaped}"'
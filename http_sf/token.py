@@ -1,26 +1,35 @@
+import re
 from string import ascii_letters, digits
+from typing import Iterable, Set
 
+from http_sf import util
+from http_sf.intern import intern_token
 from http_sf.state import ParserState
 from http_sf.types import Token
 
 TOKEN_START_CHARS = set((ascii_letters + "*").encode("ascii"))
 TOKEN_CHARS = set((ascii_letters + digits + ":/!#$%&'*+-.^_`|~").encode("ascii"))
+TOKEN_PATTERN = rb"[A-Za-z*][A-Za-z0-9:/!#$%&'*+\-.^_`|~]*"
+TOKEN_RE = re.compile(TOKEN_PATTERN)
+VALID_TOKENS: Set[str] = set()
 
 
 def parse_token(state: ParserState) -> Token:
-    start_cursor = state.cursor
-    state.cursor += 1  # consume start char
-    size = len(state.data)
-    while state.cursor < size:
-        if state.data[state.cursor] not in TOKEN_CHARS:
-            return Token(state.data[start_cursor : state.cursor].decode("ascii"))
-        state.cursor += 1
-    return Token(state.data[start_cursor : state.cursor].decode("ascii"))
+    match = TOKEN_RE.match(state.data, state.cursor)
+    state.cursor = match.end()  # type: ignore[union-attr]
+    return intern_token(match.group())  # type: ignore[union-attr]
 
 
-def ser_token(token: Token) -> str:
+def ser_token(token: Token, validate: bool = True) -> str:
+    if (not validate or str(token) in VALID_TOKENS) and not util.FORCE_VALIDATION:
+        return str(token)
     if token and ord(str(token)[0]) not in TOKEN_START_CHARS:
         raise ValueError("Token didn't start with legal character")
     if not all(ord(char) in TOKEN_CHARS for char in str(token)):
         raise ValueError("Token contains disallowed characters")
     return str(token)
+
+
+def register_tokens(tokens: Iterable[str]) -> None:
+    "Validate tokens, so that they aren't checked again when serialised."
+    VALID_TOKENS.update([ser_token(Token(str(token))) for token in tokens])
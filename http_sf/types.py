@@ -1,36 +1,267 @@
-from collections import UserString
-from datetime import datetime
+import base64
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from typing_extensions import TypeAlias
 
 
-class Token(UserString):
-    def __init__(self, seq: str):  # pylint: disable=W0231
-        self.data = seq
+class Token(str):
+    __slots__ = ()
+
+    @property
+    def data(self) -> str:
+        return str.__str__(self)
 
     def __repr__(self) -> str:
         return f'Token("{self.data}")'
 
 
-class DisplayString(UserString):
-    def __init__(self, seq: str):  # pylint: disable=W0231
-        self.data = seq
+class DisplayString(str):
+    __slots__ = ()
+
+    @property
+    def data(self) -> str:
+        return str.__str__(self)
 
     def __repr__(self) -> str:
         return f'Token("{self.data}")'
 
 
+class Milli(int):
+    """
+    A Decimal, represented as an integer number of thousandths.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return f"Milli({int(self)})"
+
+
+class EpochDate(int):
+    """
+    A Date, represented as seconds since the epoch.
+    """
+
+    __slots__ = ()
+
+    @property
+    def datetime(self) -> datetime:
+        return datetime.fromtimestamp(self, tz=timezone.utc)
+
+    def __repr__(self) -> str:
+        return f"EpochDate({int(self)})"
+
+
+class LazyDate:
+    """
+    A Date whose datetime is created when it is first used. Attributes of the
+    datetime are available directly.
+    """
+
+    __slots__ = ("epoch", "_datetime")
+
+    def __init__(self, epoch: int) -> None:
+        self.epoch = epoch
+        self._datetime: Optional[datetime] = None
+
+    @property
+    def datetime(self) -> datetime:
+        if self._datetime is None:
+            self._datetime = datetime.fromtimestamp(self.epoch, tz=timezone.utc)
+        return self._datetime
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.datetime, name)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyDate):
+            return self.epoch == other.epoch
+        if isinstance(other, datetime):
+            return self.datetime == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.datetime)
+
+    def __repr__(self) -> str:
+        return f"LazyDate({self.epoch})"
+
+
+class LazyBytes:
+    """
+    A Byte Sequence that is decoded from its base64 text when it is first
+    used, and serialised from that text without decoding it.
+
+    When parsed, encoded is a view of the field value, so that buffer must not
+    be changed while the LazyBytes is in use.
+    """
+
+    __slots__ = ("encoded", "_value")
+
+    def __init__(self, encoded: "BufferType", value: Optional[bytes] = None) -> None:
+        self.encoded = encoded
+        self._value = value
+
+    @property
+    def value(self) -> bytes:
+        if self._value is None:
+            self._value = base64.b64decode(self.encoded, validate=True)
+        return self._value
+
+    def __bytes__(self) -> bytes:
+        return self.value
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyBytes):
+            return self.value == other.value
+        if isinstance(other, (bytes, bytearray)):
+            return self.value == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self.value)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (LazyBytes, (bytes(self.encoded),))
+
+    def __repr__(self) -> str:
+        return f"LazyBytes({bytes(self.encoded)!r})"
+
+
 BareItemType: TypeAlias = Union[
-    int, float, str, bool, Decimal, bytes, Token, datetime, DisplayString
+    int,
+    float,
+    str,
+    bool,
+    Decimal,
+    bytes,
+    Token,
+    datetime,
+    DisplayString,
+    Milli,
+    EpochDate,
+    LazyDate,
+    LazyBytes,
+]
+DecimalTypeType: TypeAlias = Union[Type[Decimal], Type[float], str]
+DateTypeType: TypeAlias = Union[Type[datetime], str]
+BytesTypeType: TypeAlias = Union[Type[bytes], str]
+
+
+class Params(Mapping[str, BareItemType]):
+    """
+    Immutable Parameters, stored as a flat tuple of keys and values.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, params: Mapping[str, BareItemType]) -> None:
+        self._items: Tuple[Any, ...] = tuple(
+            part for pair in params.items() for part in pair
+        )
+
+    def __getitem__(self, key: str) -> BareItemType:
+        items = self._items
+        for i in range(0, len(items), 2):
+            if items[i] == key:
+                return items[i + 1]  # type: ignore[no-any-return]
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items[::2])
+
+    def __len__(self) -> int:
+        return len(self._items) // 2
+
+    def __hash__(self) -> int:
+        return hash(frozenset(self.items()))
+
+    def __repr__(self) -> str:
+        return f"Params({dict(self)!r})"
+
+
+EMPTY_PARAMS = Params({})
+
+
+class Item(Tuple[BareItemType, Params]):
+    """
+    A compact Item: a (value, params) tuple without a per-instance dict.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: BareItemType, params: Params = EMPTY_PARAMS) -> "Item":
+        return tuple.__new__(cls, (value, params))
+
+    def __getnewargs__(self) -> Tuple[BareItemType, Params]:
+        return (self[0], self[1])
+
+    @property
+    def value(self) -> BareItemType:
+        return self[0]
+
+    @property
+    def params(self) -> Params:
+        return self[1]
+
+    def __repr__(self) -> str:
+        return f"Item({self[0]!r}, {self[1]!r})"
+
+
+class InnerList(Tuple[Tuple[Item, ...], Params]):
+    """
+    A compact Inner List: a (items, params) tuple whose items are a tuple.
+    """
+
+    __slots__ = ()
+
+    def __new__(
+        cls, items: Tuple[Item, ...], params: Params = EMPTY_PARAMS
+    ) -> "InnerList":
+        return tuple.__new__(cls, (items, params))
+
+    def __getnewargs__(self) -> Tuple[Tuple[Item, ...], Params]:
+        return (self[0], self[1])
+
+    @property
+    def value(self) -> Tuple[Item, ...]:
+        return self[0]
+
+    @property
+    def params(self) -> Params:
+        return self[1]
+
+    def __repr__(self) -> str:
+        return f"InnerList({self[0]!r}, {self[1]!r})"
+
+
+ParamsType: TypeAlias = Union[Dict[str, BareItemType], Params]
+ItemType: TypeAlias = Union[BareItemType, Tuple[BareItemType, ParamsType], Item]
+InnerListType: TypeAlias = Union[
+    List[ItemType], Tuple[List[ItemType], ParamsType], InnerList
 ]
-ParamsType: TypeAlias = Dict[str, BareItemType]
-ItemType: TypeAlias = Union[BareItemType, Tuple[BareItemType, ParamsType]]
-InnerListType: TypeAlias = Union[List[ItemType], Tuple[List[ItemType], ParamsType]]
 ItemOrInnerListType: TypeAlias = Union[ItemType, InnerListType]
 ListType: TypeAlias = List[Union[ItemType, InnerListType]]
 DictionaryType: TypeAlias = Dict[str, Union[ItemType, InnerListType]]
 StructuredType: TypeAlias = Union[ItemType, ListType, DictionaryType]
+BufferType: TypeAlias = Union[bytes, bytearray, memoryview]
 OnDuplicateKeyType: TypeAlias = Callable[[str, str], None]
 JsonDict: TypeAlias = Dict[str, Any]
@@ -4,11 +4,22 @@ import re
 from datetime import datetime, timezone
 from decimal import Decimal
 from string import ascii_lowercase, ascii_uppercase, digits
-from typing import Any
+from typing import Any, Iterable, Mapping, Set
 
 from .errors import StructuredFieldError
+from .intern import intern_key
 from .state import ParserState
-from .types import DisplayString, JsonDict, StructuredType, Token
+from .types import (
+    DisplayString,
+    EpochDate,
+    JsonDict,
+    LazyBytes,
+    LazyDate,
+    Milli,
+    Params,
+    StructuredType,
+    Token,
+)
 
 SPACE = ord(b" ")
 HTTP_OWS = set(b" \t")
@@ -28,8 +39,14 @@ def discard_http_ows(state: ParserState) -> None:
 
 KEY_START_CHARS = set((ascii_lowercase + "*").encode("ascii"))
 KEY_CHARS = set((ascii_lowercase + digits + "_-*.").encode("ascii"))
+KEY_PATTERN = rb"[a-z*][a-z0-9_\-*.]*"
+KEY_RE = re.compile(KEY_PATTERN)
+COMPAT_KEY_RE = re.compile(rb"[a-zA-Z*][a-zA-Z0-9_\-*.]*")
 UPPER_CHARS = set((ascii_uppercase).encode("ascii"))
+TRAILING_DELIMS = re.compile(rb"[ \t;,]*")
 COMPAT = False
+FORCE_VALIDATION = False  # validate when serialising, even if asked not to
+VALID_KEYS: Set[str] = set()
 
 
 def parse_key(state: ParserState) -> str:
@@ -37,7 +54,7 @@ def parse_key(state: ParserState) -> str:
         if not state.has_data() or not (
             COMPAT and state.data[state.cursor] in UPPER_CHARS
         ):
-            if re.match(b"^[ \t;,]*$", state.data[state.cursor :]):
+            if TRAILING_DELIMS.fullmatch(state.data, state.cursor):
                 raise StructuredFieldError(
                     "Trailing delimiter",
                     position=state.cursor,
@@ -58,17 +75,14 @@ def parse_key(state: ParserState) -> str:
                 position=state.cursor,
                 offending_char=state.data[state.cursor] if state.has_data() else None,
             )
-    start_cursor = state.cursor
-    state.cursor += 1
-    while state.has_data():
-        if state.data[state.cursor] not in KEY_CHARS:
-            if not (COMPAT and state.data[state.cursor] in UPPER_CHARS):
-                return state.data[start_cursor : state.cursor].decode("ascii").lower()
-        state.cursor += 1
-    return state.data[start_cursor : state.cursor].decode("ascii").lower()
+    match = (COMPAT_KEY_RE if COMPAT else KEY_RE).match(state.data, state.cursor)
+    state.cursor = match.end()  # type: ignore[union-attr]
+    return intern_key(match.group())  # type: ignore[union-attr]
 
 
-def ser_key(key: str) -> str:
+def ser_key(key: str, validate: bool = True) -> str:
+    if (not validate or key in VALID_KEYS) and not FORCE_VALIDATION:
+        return key
     if len(key) == 0:
         raise ValueError("Zero length key")
     if not all(ord(char) in KEY_CHARS for char in key):
@@ -78,8 +92,28 @@ def ser_key(key: str) -> str:
     return key
 
 
+def register_keys(keys: Iterable[str]) -> None:
+    "Validate keys, so that they aren't checked again when serialised."
+    VALID_KEYS.update([ser_key(key) for key in keys])
+
+
 def to_json(structure: StructuredType, **args: Any) -> str:
-    return json.dumps(structure, default=json_dump, **args)
+    return json.dumps(tag_subclasses(structure), default=json_dump, **args)
+
+
+def tag_subclasses(thing: Any) -> Any:
+    """
+    Replace the Tokens, DisplayStrings, Millis and EpochDates in thing with
+    their JSON representations; as subclasses of str and int, json would
+    otherwise encode them as Strings and Integers.
+    """
+    if isinstance(thing, (Token, DisplayString, Milli, EpochDate)):
+        return json_dump(thing)
+    if isinstance(thing, Mapping):
+        return {key: tag_subclasses(value) for key, value in thing.items()}
+    if isinstance(thing, (list, tuple)):
+        return [tag_subclasses(member) for member in thing]
+    return thing
 
 
 def from_json(instr: str) -> StructuredType:
@@ -103,6 +137,21 @@ def json_dump(inobj: Any) -> Any:
         return {"__type": "displaystring", "value": str(inobj)}
     if isinstance(inobj, Decimal):
         return float(inobj)
+    return _json_dump_alternate(inobj)
+
+
+def _json_dump_alternate(inobj: Any) -> Any:
+    "Dump the compact and lazy types that parse() can return."
+    if isinstance(inobj, LazyBytes):
+        return json_dump(inobj.value)
+    if isinstance(inobj, EpochDate):
+        return {"__type": "date", "value": float(inobj)}  # as datetime.timestamp()
+    if isinstance(inobj, LazyDate):
+        return {"__type": "date", "value": float(inobj.epoch)}
+    if isinstance(inobj, Milli):
+        return int(inobj) / 1000
+    if isinstance(inobj, Params):
+        return dict(inobj)
     raise ValueError(f"Unknown object type - {inobj}")
 
 
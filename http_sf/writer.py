@@ -0,0 +1,137 @@
+"""
+Serialise structured fields as ASCII bytes into a caller-supplied buffer.
+"""
+
+from io import BufferedIOBase
+from typing import Any, Callable, Dict, List, Union
+
+from . import util
+from .bare_item import ser_bare_item
+from .integer import MAX_INT, MIN_INT
+from .token import TOKEN_RE, VALID_TOKENS
+from .types import BareItemType, ItemOrInnerListType, ParamsType, StructuredType, Token
+from .util import ser_key
+
+WriteType = Callable[[bytes], Any]
+
+
+def ser_into(
+    structure: StructuredType,
+    out: Union[bytearray, BufferedIOBase],
+    validate: bool = True,
+) -> None:
+    """
+    Append the serialisation of structure to out, which can be a bytearray or
+    a binary stream. If serialisation fails, a bytearray is restored to its
+    original length; a stream may have had some of the output written to it.
+    """
+    if isinstance(out, bytearray):
+        mark = len(out)
+        try:
+            _write_structure(structure, out.extend, validate)
+        except Exception:
+            del out[mark:]
+            raise
+    else:
+        _write_structure(structure, out.write, validate)
+
+
+def ser_bytes(structure: StructuredType, validate: bool = True) -> bytes:
+    "Serialise structure as bytes."
+    parts: List[bytes] = []
+    _write_structure(structure, parts.append, validate)
+    return b"".join(parts)
+
+
+def _write_structure(
+    structure: StructuredType, write: WriteType, validate: bool
+) -> None:
+    if isinstance(structure, Dict):
+        if len(structure) == 0:
+            raise ValueError("No contents; field should not be emitted")
+        first = True
+        for key, member in structure.items():
+            if not first:
+                write(b", ")
+            first = False
+            write(ser_key(key, validate).encode("ascii"))
+            if isinstance(member, tuple) and member[0] is True:
+                _write_params(member[1], write, validate)
+            else:
+                write(b"=")
+                _write_member(member, write, validate)
+    elif isinstance(structure, List):
+        if len(structure) == 0:
+            raise ValueError("No contents; field should not be emitted")
+        first = True
+        for member in structure:
+            if not first:
+                write(b", ")
+            first = False
+            _write_member(member, write, validate)
+    else:
+        _write_member(structure, write, validate)
+
+
+def _write_member(
+    member: ItemOrInnerListType, write: WriteType, validate: bool
+) -> None:
+    if isinstance(member, list):
+        member = (member, {})
+    elif not isinstance(member, tuple):
+        write(_bare_item(member, validate))
+        return
+    value, params = member
+    if isinstance(value, (list, tuple)):
+        write(b"(")
+        first = True
+        for item in value:
+            if not first:
+                write(b" ")
+            first = False
+            if isinstance(item, tuple):
+                write(_bare_item(item[0], validate))
+                _write_params(item[1], write, validate)
+            else:
+                write(_bare_item(item, validate))
+        write(b")")
+    else:
+        write(_bare_item(value, validate))
+    _write_params(params, write, validate)
+
+
+def _write_params(params: ParamsType, write: WriteType, validate: bool) -> None:
+    for key, value in params.items():
+        if value is True:
+            write(b";%s" % ser_key(key, validate).encode("ascii"))
+        else:
+            write(
+                b";%s=%s"
+                % (ser_key(key, validate).encode("ascii"), _bare_item(value, validate))
+            )
+
+
+def _bare_item(item: BareItemType, validate: bool) -> bytes:
+    """
+    Serialise item as ASCII bytes. Integers, Tokens and Strings (but not their
+    subclasses) are written directly, rather than through a str.
+    """
+    # pylint: disable=unidiomatic-typecheck
+    if type(item) is int:
+        if MIN_INT <= item <= MAX_INT:
+            return b"%d" % item
+    elif type(item) is Token:
+        if not util.FORCE_VALIDATION and (not validate or item in VALID_TOKENS):
+            return item.encode("ascii")
+        if item.isascii():
+            encoded = item.encode("ascii")
+            if TOKEN_RE.fullmatch(encoded):
+                return encoded
+    elif type(item) is str:
+        if not (validate or util.FORCE_VALIDATION) or (
+            item.isascii() and item.isprintable()
+        ):
+            escaped = item.replace("\\", "\\\\").replace('"', '\\"')
+            return b'"%s"' % escaped.encode("ascii")
+    # otherwise, ser_bare_item serialises it (or raises the error)
+    return ser_bare_item(item, validate).encode("ascii")
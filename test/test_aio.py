@@ -0,0 +1,71 @@
+import asyncio
+import unittest
+
+from http_sf import StructuredFieldError, Token, aparse_lines
+
+
+def stream(data):
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class CountingReader:
+    def __init__(self, lines):
+        self.lines = list(lines)
+        self.reads = 0
+
+    async def readline(self):
+        self.reads += 1
+        return self.lines.pop(0) if self.lines else b""
+
+
+class TestAparseLines(unittest.IsolatedAsyncioTestCase):
+    async def test_values(self):
+        results = [
+            result
+            async for result in aparse_lines(
+                stream(b"a, b\nc,\r\nd"), tltype="list", batch_size=2
+            )
+        ]
+        self.assertEqual(
+            results[0], (None, b"a, b", [(Token("a"), {}), (Token("b"), {})])
+        )
+        self.assertIsInstance(results[1][2], StructuredFieldError)
+        self.assertEqual(results[2], (None, b"d", [(Token("d"), {})]))
+
+    async def test_named(self):
+        data = b"".join(b"Cache-Control: max-age=%d\n" % i for i in range(250))
+        results = [
+            result
+            async for result in aparse_lines(
+                stream(data + b"no colon\n"), named=True, offload_size=10
+            )
+        ]
+        self.assertEqual(len(results), 251)
+        self.assertEqual(
+            results[249], ("Cache-Control", b"max-age=249", {"max-age": (249, {})})
+        )
+        self.assertIsInstance(results[250][2], StructuredFieldError)
+
+    async def test_backpressure(self):
+        reader = CountingReader([b"a\n"] * 100)
+        results = aparse_lines(reader, tltype="list", batch_size=5, queue_size=2)
+        self.assertEqual(await results.__anext__(), (None, b"a", [(Token("a"), {})]))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertLessEqual(reader.reads, 20)
+        await results.aclose()
+
+    async def test_reader_errors(self):
+        reader = asyncio.StreamReader(limit=10)
+        reader.feed_data(b"a" * 100 + b"\n")
+        reader.feed_eof()
+        with self.assertRaises(ValueError):
+            async for _ in aparse_lines(reader, tltype="list"):
+                pass
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import unittest
+
+from http_sf import StructuredFieldError, Token, parse, parse_many
+from http_sf.batch import parse_lines
+
+
+class TestParseMany(unittest.TestCase):
+    def test_values_with_tltype(self):
+        self.assertEqual(
+            parse_many([b"a, b", b"1"], tltype="list"),
+            [[(Token("a"), {}), (Token("b"), {})], [(1, {})]],
+        )
+
+    def test_name_and_value_pairs(self):
+        results = parse_many(
+            [("Cache-Control", b"max-age=60"), ("Accept-Encoding", b"gzip")]
+        )
+        self.assertEqual(results[0], {"max-age": (60, {})})
+        self.assertEqual(results[1], [(Token("gzip"), {})])
+
+    def test_errors_are_returned(self):
+        results = parse_many([b"a", b"a,", b"b"], tltype="list")
+        self.assertEqual(results[0], [(Token("a"), {})])
+        self.assertIsInstance(results[1], StructuredFieldError)
+        self.assertEqual(results[1].position, 2)
+        self.assertEqual(results[2], [(Token("b"), {})])
+
+    def test_unknown_type_is_returned(self):
+        results = parse_many([("X-Unknown", b"a")])
+        self.assertIsInstance(results[0], KeyError)
+
+    def test_duplicates_are_independent(self):
+        for dedupe in (False, True):
+            results = parse_many([b"a;q=1", b"a;q=1"], tltype="list", dedupe=dedupe)
+            self.assertEqual(results[0], results[1])
+            results[0][0][1]["q"] = 2
+            self.assertEqual(results[1], [(Token("a"), {"q": 1})])
+
+    def test_duplicate_errors_are_separate(self):
+        results = parse_many([b"a,", b"a,"], tltype="list", dedupe=True)
+        self.assertIsInstance(results[0], StructuredFieldError)
+        self.assertIsNot(results[0], results[1])
+        self.assertEqual(str(results[0]), str(results[1]))
+
+    def test_buffers(self):
+        self.assertEqual(
+            parse_many([bytearray(b"a"), memoryview(b"b"), b"c"], tltype="item"),
+            [(Token("a"), {}), (Token("b"), {}), (Token("c"), {})],
+        )
+
+    def test_matches_parse(self):
+        values = [b"u=1, i", b"u=8", b"i=?0"]
+        self.assertEqual(
+            parse_many(values, name="Priority"),
+            [parse(value, name="Priority") for value in values],
+        )
+
+
+class TestParseLines(unittest.TestCase):
+    def test_values(self):
+        results = list(parse_lines([b"a, b\n", b"c,\r\n"], tltype="list", batch_size=1))
+        self.assertEqual(
+            results[0], (None, b"a, b", [(Token("a"), {}), (Token("b"), {})])
+        )
+        self.assertEqual(results[1][1], b"c,")
+        self.assertIsInstance(results[1][2], StructuredFieldError)
+
+    def test_named(self):
+        results = list(
+            parse_lines(
+                [b"Cache-Control: max-age=60\n", b"no colon\n", b"Age:\t5\n"],
+                named=True,
+            )
+        )
+        self.assertEqual(results[0], ("Cache-Control", b"max-age=60", {"max-age": (60, {})}))
+        self.assertIsInstance(results[1][2], StructuredFieldError)
+        self.assertEqual(results[2], ("Age", b"5", (5, {})))
+
+    def test_named_default_type(self):
+        lines = [b"Age: 5\n", b"X-Unknown: a, b\n"]
+        results = list(parse_lines(lines, tltype="list", named=True))
+        self.assertEqual(results[0], ("Age", b"5", (5, {})))
+        self.assertEqual(
+            results[1], ("X-Unknown", b"a, b", [(Token("a"), {}), (Token("b"), {})])
+        )
+        results = list(parse_lines(lines, named=True))
+        self.assertIsInstance(results[1][2], KeyError)
+
+    def test_is_lazy(self):
+        def lines():
+            yield b"1"
+            raise RuntimeError("read too far")
+
+        results = parse_lines(lines(), tltype="item", batch_size=1)
+        self.assertEqual(next(results), (None, b"1", (1, {})))
+
+
+if __name__ == "__main__":
+    unittest.main()
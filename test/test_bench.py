@@ -0,0 +1,56 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from http_sf.bench import cases, compare, main, measure
+
+
+class TestBench(unittest.TestCase):
+    def test_cases(self):
+        found = cases()
+        names = [case.name for case in found]
+        self.assertEqual(len(names), len(set(names)))
+        self.assertEqual(
+            {case.group for case in found},
+            {"parse", "ser", "json", "compat", "batch", "lazy", "incremental"},
+        )
+        for case in found:
+            case.func()
+
+    def test_measure(self):
+        result = measure(lambda: [0] * 1000, 0.01, 2)
+        self.assertGreater(result["ops_per_sec"], 0)
+        self.assertGreaterEqual(result["alloc_bytes"], result["retained_bytes"])
+        self.assertGreaterEqual(result["retained_bytes"], 8000)
+
+    def test_compare(self):
+        changes = compare(
+            {"a": {"ops_per_sec": 90.0}, "b": {"ops_per_sec": 10.0}},
+            {"a": {"ops_per_sec": 100.0}},
+        )
+        self.assertEqual(list(changes), ["a"])
+        self.assertAlmostEqual(changes["a"], -0.1)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "results.json")
+            args = ["-k", "^parse Integer$", "-t", "0.01", "-r", "1"]
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(main(args + ["-o", path]), 0)
+            self.assertIn("parse Integer", output.getvalue())
+            with open(path, encoding="utf-8") as results_file:
+                results = json.load(results_file)
+            self.assertEqual(list(results["results"]), ["parse Integer"])
+            results["results"]["parse Integer"]["ops_per_sec"] *= 1000
+            with open(path, "w", encoding="utf-8") as results_file:
+                json.dump(results, results_file)
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(main(args + ["-b", path]), 1)
+            self.assertIn("REGRESSION", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
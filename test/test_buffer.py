@@ -0,0 +1,53 @@
+import unittest
+
+from http_sf import ParseCache, StructuredFieldError, Token, parse
+
+
+class TestBufferInput(unittest.TestCase):
+    def test_bytearray(self):
+        self.assertEqual(
+            parse(bytearray(b"a=1, b=:AQI=:"), tltype="dictionary"),
+            {"a": (1, {}), "b": (b"\x01\x02", {})},
+        )
+
+    def test_memoryview(self):
+        self.assertEqual(
+            parse(memoryview(b'a;q=0.5, "b", %"c%c3%a9"'), tltype="list"),
+            [
+                (Token("a"), {"q": 0.5}),
+                ("b", {}),
+                (parse(b'%"c%c3%a9"', tltype="item")[0], {}),
+            ],
+        )
+
+    def test_slice(self):
+        block = bytearray(b"Accept: text/html\r\nCache-Control: max-age=60\r\n")
+        start = block.index(b"max-age")
+        end = block.index(b"\r\n", start)
+        self.assertEqual(
+            parse(block, name="Cache-Control", start=start, end=end),
+            {"max-age": (60, {})},
+        )
+
+    def test_slice_positions_are_relative(self):
+        data = b"xxxxa, b,"
+        with self.assertRaises(StructuredFieldError) as cm:
+            parse(data, tltype="list", start=4)
+        self.assertEqual(cm.exception.position, 5)
+
+    def test_byteseq_in_slice(self):
+        data = b":AQI=: :AQI=:"
+        with self.assertRaises(StructuredFieldError) as cm:
+            parse(data, tltype="item", start=0, end=3)
+        self.assertEqual(cm.exception.position, 3)
+        self.assertEqual(parse(data, tltype="item", start=7), (b"\x01\x02", {}))
+
+    def test_cache(self):
+        cache = ParseCache()
+        parse(bytearray(b"xa, b"), tltype="list", cache=cache, start=1)
+        parse(b"a, b", tltype="list", cache=cache)
+        self.assertEqual(cache.hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from http_sf.bulk import INVALID_FILES, INVALID_RECORDS, process_file, run
+
+HAR = {
+    "log": {
+        "entries": [
+            {
+                "request": {
+                    "headers": [
+                        {"name": "Accept-Encoding", "value": "gzip, br"},
+                        {"name": "Cookie", "value": "not structured"},
+                    ]
+                },
+                "response": {
+                    "headers": [
+                        {"name": "Cache-Control", "value": "max-age=60"},
+                        {"name": "cache-control", "value": "public"},
+                        {"name": "Age", "value": "abc def"},
+                    ]
+                },
+            }
+        ]
+    }
+}
+
+
+class TestBulk(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tmpdir.name)
+        (self.path / "capture.har").write_text(json.dumps(HAR), encoding="utf-8")
+        (self.path / "dump.ndjson").write_text(
+            '{"Priority": "u=1, i", "Vary": ["accept", "origin"]}\n'
+            '[["Age", "1"], ["X-Unknown", "?"]]\n',
+            encoding="utf-8",
+        )
+        (self.path / "ignored.txt").write_text("nothing", encoding="utf-8")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_process_har(self):
+        stats, lines = process_file(self.path / "capture.har")
+        self.assertEqual(
+            stats,
+            {
+                "accept-encoding": {"ok": 1, "fail": 0},
+                "cache-control": {"ok": 1, "fail": 0},
+                "age": {"ok": 0, "fail": 1},
+            },
+        )
+        records = [json.loads(line) for line in lines]
+        self.assertEqual(records[1]["value"], "max-age=60, public")
+        self.assertEqual(records[1]["result"], {"max-age": [60, {}], "public": [True, {}]})
+        self.assertIn("error", records[2])
+
+    def test_run(self):
+        output = io.StringIO()
+        stats = run([self.path], jobs=2, output=output)
+        self.assertEqual(stats["age"], {"ok": 1, "fail": 1})
+        self.assertEqual(stats["vary"], {"ok": 1, "fail": 0})
+        self.assertNotIn("x-unknown", stats)
+        self.assertEqual(len(output.getvalue().splitlines()), 6)
+
+    def test_invalid_records(self):
+        path = self.path / "corrupt.ndjson"
+        path.write_text(
+            '{"Age": "1"}\n'
+            '{"Age": \n'
+            '{"Content-Length": 5}\n'
+            '[["Age"]]\n'
+            '"Age"\n'
+            '{"Age": "2"}\n',
+            encoding="utf-8",
+        )
+        stats, lines = process_file(path)
+        self.assertEqual(stats["age"], {"ok": 2, "fail": 0})
+        self.assertEqual(stats[INVALID_RECORDS], {"ok": 0, "fail": 4})
+        self.assertEqual(len(lines), 2)
+
+    def test_invalid_har_entry(self):
+        har = json.loads(json.dumps(HAR))
+        har["log"]["entries"].insert(0, {"request": {}})
+        path = self.path / "capture.har"
+        path.write_text(json.dumps(har), encoding="utf-8")
+        stats, _ = process_file(path)
+        self.assertEqual(stats[INVALID_RECORDS], {"ok": 0, "fail": 1})
+        self.assertEqual(stats["accept-encoding"], {"ok": 1, "fail": 0})
+
+    def test_invalid_file(self):
+        (self.path / "broken.har").write_text("{not json", encoding="utf-8")
+        errors = []
+        stats = run(
+            [self.path], jobs=1, on_error=lambda path, why: errors.append(path.name)
+        )
+        self.assertEqual(errors, ["broken.har"])
+        self.assertEqual(stats[INVALID_FILES], {"ok": 0, "fail": 1})
+        self.assertEqual(stats["age"], {"ok": 1, "fail": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
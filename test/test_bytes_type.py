@@ -0,0 +1,69 @@
+import pickle
+import unittest
+
+from http_sf import LazyBytes, ParseCache, StructuredFieldError, parse, ser, to_json
+
+
+class TestBytesType(unittest.TestCase):
+    def test_default(self):
+        self.assertEqual(parse(b":aGVsbG8=:", tltype="item"), (b"hello", {}))
+
+    def test_lazy(self):
+        data = bytearray(b"a=:aGVsbG8=:, b=:AAEC:;p=:Zm9vYg==:")
+        result = parse(data, tltype="dictionary", bytes_type="lazy")
+        value = result["a"][0]
+        self.assertIs(type(value), LazyBytes)
+        self.assertIsInstance(value.encoded, memoryview)
+        self.assertIsNone(value._value)
+        self.assertEqual(value, b"hello")
+        self.assertEqual(bytes(value), b"hello")
+        self.assertEqual(len(value), 5)
+        self.assertEqual(result["b"][0], LazyBytes(b"AAEC"))
+        self.assertEqual(result["b"][1]["p"], b"foob")
+        self.assertEqual(ser(result), data.decode("ascii"))
+        value = parse(b":AAEC:", tltype="item", bytes_type="lazy")[0]
+        self.assertIsInstance(value.encoded, memoryview)
+
+    def test_non_canonical(self):
+        # valid, but not as it would be serialised; decoded immediately
+        for value, expected in [(b":aGVsbG9=:", ":aGVsbG8=:"), (b":AAAA=:", ":AAAA:")]:
+            result = parse(value, tltype="item", bytes_type="lazy")[0]
+            self.assertIsNotNone(result._value)
+            self.assertEqual(result, parse(value, tltype="item")[0])
+            self.assertEqual(ser(result), expected)
+
+    def test_errors_unchanged(self):
+        for value, message, position in [
+            (b":aGVsbG8=", "Binary Sequence didn't contain ending ':'", 9),
+            (b":aGVs$bG8=:", "Binary Sequence contained disallowed character", 10),
+            (b":aGVsbG8:", "Binary Sequence failed to decode", 8),
+            (b":aG=sbG8=:", "Binary Sequence failed to decode", 9),
+        ]:
+            for bytes_type in (bytes, "lazy"):
+                with self.assertRaises(StructuredFieldError) as cm:
+                    parse(value, tltype="item", bytes_type=bytes_type)
+                self.assertEqual(str(cm.exception), message)
+                self.assertEqual(cm.exception.position, position)
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            parse(b":AAEC:", tltype="item", bytes_type=bytearray)
+
+    def test_cache(self):
+        cache = ParseCache()
+        data = bytearray(b":AAEC:")
+        parse(data, tltype="item", bytes_type="lazy", cache=cache)
+        data[1:5] = b"BBBB"
+        result = parse(b":AAEC:", tltype="item", bytes_type="lazy", cache=cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(result[0], b"\x00\x01\x02")
+        self.assertIs(type(parse(b":AAEC:", tltype="item", cache=cache)[0]), bytes)
+
+    def test_pickle_and_json(self):
+        value = parse(memoryview(b":AAEC:"), tltype="item", bytes_type="lazy")[0]
+        self.assertEqual(pickle.loads(pickle.dumps(value)), value)
+        self.assertEqual(to_json(value), to_json(b"\x00\x01\x02"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,184 @@
+import unittest
+
+from http_sf import (
+    ParseCache,
+    SerCache,
+    SerializedField,
+    Token,
+    parse,
+    ser,
+    ser_cached,
+)
+
+
+class TestParseCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = ParseCache()
+        first = parse(b"gzip, br", tltype="list", cache=cache)
+        second = parse(b"gzip, br", tltype="list", cache=cache)
+        self.assertEqual(first, second)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_key_includes_type(self):
+        cache = ParseCache()
+        parse(b"a", tltype="list", cache=cache)
+        self.assertEqual(parse(b"a", tltype="item", cache=cache), (Token("a"), {}))
+        self.assertEqual(cache.hits, 0)
+
+    def test_name_resolves_type(self):
+        cache = ParseCache()
+        parse(b"max-age=60", name="Cache-Control", cache=cache)
+        parse(b"max-age=60", tltype="dictionary", cache=cache)
+        self.assertEqual(cache.hits, 1)
+
+    def test_results_are_copies(self):
+        cache = ParseCache()
+        result = parse(b"a;q=1, (b c)", tltype="list", cache=cache)
+        result[0][1]["q"] = 2
+        result[1][0].append((Token("d"), {}))
+        result.append("poison")
+        again = parse(b"a;q=1, (b c)", tltype="list", cache=cache)
+        self.assertEqual(
+            again,
+            [(Token("a"), {"q": 1}), ([(Token("b"), {}), (Token("c"), {})], {})],
+        )
+        again[0][1]["q"] = 3
+        self.assertEqual(parse(b"a;q=1, (b c)", tltype="list", cache=cache)[0][1], {"q": 1})
+
+    def test_entry_limit_evicts_lru(self):
+        cache = ParseCache(max_entries=2)
+        parse(b"a", tltype="item", cache=cache)
+        parse(b"b", tltype="item", cache=cache)
+        parse(b"a", tltype="item", cache=cache)
+        parse(b"c", tltype="item", cache=cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        parse(b"a", tltype="item", cache=cache)
+        self.assertEqual(cache.hits, 2)
+        parse(b"b", tltype="item", cache=cache)
+        self.assertEqual(cache.hits, 2)
+
+    def test_byte_limit(self):
+        cache = ParseCache(max_bytes=10)
+        parse(b"abcdef", tltype="item", cache=cache)
+        parse(b"ghijkl", tltype="item", cache=cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size, 6)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_large_values_not_admitted(self):
+        cache = ParseCache(max_value_size=4)
+        parse(b"abcdef", tltype="item", cache=cache)
+        parse(b"abcdef", tltype="item", cache=cache)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.hits + cache.misses, 0)
+
+    def test_duplicates_replayed_on_hit(self):
+        cache = ParseCache()
+        duplicates = []
+
+        def callback(key, context):
+            duplicates.append((key, context))
+
+        parse(b"a=1, a=2", tltype="dictionary", on_duplicate_key=callback, cache=cache)
+        parse(b"a=1, a=2", tltype="dictionary", on_duplicate_key=callback, cache=cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(duplicates, [("a", "dictionary"), ("a", "dictionary")])
+
+    def test_errors_not_cached(self):
+        cache = ParseCache()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                parse(b"a,", tltype="list", cache=cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = ParseCache()
+        parse(b"a", tltype="item", cache=cache)
+        cache.clear()
+        self.assertEqual(cache.stats()["entries"], 0)
+        self.assertEqual(cache.stats()["bytes"], 0)
+
+
+class TestSerCache(unittest.TestCase):
+    def test_hit_and_miss(self):
+        cache = SerCache()
+        structure = {"max-age": (60, {}), "public": (True, {})}
+        self.assertEqual(ser_cached(structure, cache), "max-age=60, public")
+        self.assertEqual(
+            ser_cached({"max-age": (60, {}), "public": (True, {})}, cache),
+            "max-age=60, public",
+        )
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 1)
+
+    def test_types_are_distinct(self):
+        cache = SerCache()
+        structures = [
+            [Token("a")],
+            ["a"],
+            [True],
+            [1],
+            [1.0],
+            [(1, {"a": True})],
+            [(1, {"a": 1})],
+            {"a": True},
+            {"a": (True, {})},
+            [[Token("a")]],
+            [Token("a"), Token("b")],
+        ]
+        for structure in structures:
+            self.assertEqual(ser_cached(structure, cache), ser(structure))
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(len(cache), len(structures))
+
+    def test_compact_and_plain_share_entries(self):
+        cache = SerCache()
+        ser_cached(parse(b"a;q=1, (b c)", tltype="list"), cache)
+        ser_cached(parse(b"a;q=1, (b c)", tltype="list", compact=True), cache)
+        self.assertEqual(cache.hits, 1)
+
+    def test_entry_limit_evicts_lru(self):
+        cache = SerCache(max_entries=2)
+        for structure in ([1], [2], [1], [3], [1]):
+            ser_cached(structure, cache)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(cache.hits, 2)
+
+    def test_byte_limit(self):
+        cache = SerCache(max_bytes=10)
+        ser_cached([Token("abcdef")], cache)
+        ser_cached([Token("ghijkl")], cache)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.size, 6)
+
+    def test_invalidate(self):
+        cache = SerCache()
+        ser_cached([Token("a")], cache)
+        self.assertTrue(cache.invalidate([Token("a")]))
+        self.assertFalse(cache.invalidate([Token("a")]))
+        self.assertEqual(cache.stats()["bytes"], 0)
+        cache.invalidate([bytearray(b"unhashable")])
+
+    def test_errors_not_cached(self):
+        cache = SerCache()
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                ser_cached([Token("a b")], cache)
+        self.assertEqual(len(cache), 0)
+
+    def test_serialized_field(self):
+        cache = SerCache()
+        field = SerializedField({"u": (3, {}), "i": (True, {})})
+        self.assertEqual(field.text, "u=3, i")
+        self.assertEqual(field.data, b"u=3, i")
+        self.assertEqual(ser_cached(field, cache), "u=3, i")
+        self.assertEqual(cache.hits + cache.misses, 0)
+        with self.assertRaises(ValueError):
+            SerializedField([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import pickle
+import tracemalloc
+import unittest
+
+from http_sf import (
+    InnerList,
+    Item,
+    ParseCache,
+    Params,
+    Token,
+    parse,
+    ser,
+    to_json,
+)
+from http_sf.types import EMPTY_PARAMS
+
+
+class TestCompact(unittest.TestCase):
+    def test_item(self):
+        result = parse(b"a;q=0.5;x", tltype="item", compact=True)
+        self.assertIsInstance(result, Item)
+        self.assertEqual(result.value, Token("a"))
+        self.assertEqual(result.params["x"], True)
+        self.assertEqual(result, parse(b"a;q=0.5;x", tltype="item"))
+
+    def test_empty_params_shared(self):
+        result = parse(b"a, 1, (b c), d;x", tltype="list", compact=True)
+        self.assertIs(result[0].params, EMPTY_PARAMS)
+        self.assertIs(result[1].params, EMPTY_PARAMS)
+        self.assertIs(result[2].value[1].params, EMPTY_PARAMS)
+        self.assertIsNot(result[3].params, EMPTY_PARAMS)
+        result = parse(b"a=1, b", tltype="dictionary", compact=True)
+        self.assertIs(result["a"].params, EMPTY_PARAMS)
+        self.assertIs(result["b"].params, EMPTY_PARAMS)
+
+    def test_inner_list(self):
+        result = parse(b"(a b);x=1", tltype="list", compact=True)[0]
+        self.assertIsInstance(result, InnerList)
+        self.assertEqual(result.value, (Item(Token("a")), Item(Token("b"))))
+        self.assertEqual(result.params, {"x": 1})
+
+    def test_params_immutable(self):
+        params = parse(b"a;x=1", tltype="item", compact=True).params
+        with self.assertRaises(TypeError):
+            params["y"] = 2  # type: ignore[index]
+        with self.assertRaises(AttributeError):
+            params.foo = 1  # type: ignore[attr-defined]
+        self.assertEqual(hash(params), hash(Params({"x": 1})))
+
+    def test_duplicate_params(self):
+        result = parse(b"a;x=1;y;x=2", tltype="item", compact=True)
+        self.assertEqual(list(result.params.items()), [("x", 2), ("y", True)])
+
+    def test_ser(self):
+        for value, tltype in [
+            (b"a;q=0.5, (b c);x, 1", "list"),
+            (b"a=1;p, b, c=(x y), d=?0", "dictionary"),
+            (b'"foo";bar=:AQI=:', "item"),
+        ]:
+            self.assertEqual(
+                ser(parse(value, tltype=tltype, compact=True)), value.decode("ascii")
+            )
+        self.assertEqual(ser(Item(Token("a"), Params({"b": 1}))), "a;b=1")
+
+    def test_to_json(self):
+        self.assertEqual(
+            to_json(parse(b"a=1;p", tltype="dictionary", compact=True)),
+            to_json(parse(b"a=1;p", tltype="dictionary")),
+        )
+
+    def test_pickle(self):
+        result = parse(b"(a b);x=1, c", tltype="list", compact=True)
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
+    def test_cache(self):
+        cache = ParseCache()
+        parse(b"a, b", tltype="list", cache=cache)
+        self.assertIsInstance(
+            parse(b"a, b", tltype="list", compact=True, cache=cache)[0], Item
+        )
+        self.assertEqual(cache.hits, 0)
+
+    def test_uses_less_memory(self):
+        values = [f"a;q=0.9, b, c;x, d, e, f{n}".encode("ascii") for n in range(1000)]
+        sizes = []
+        for compact in (False, True):
+            tracemalloc.start()
+            results = [parse(v, tltype="list", compact=compact) for v in values]
+            sizes.append(tracemalloc.get_traced_memory()[0])
+            tracemalloc.stop()
+            del results
+        self.assertLess(sizes[1], sizes[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import pickle
+import unittest
+from datetime import datetime, timezone
+
+from http_sf import EpochDate, LazyDate, StructuredFieldError, parse, ser, to_json
+from http_sf.date import MAX_DATE, MIN_DATE
+
+
+class TestDateType(unittest.TestCase):
+    def test_default(self):
+        self.assertEqual(
+            parse(b"@1659578233", tltype="item"),
+            (datetime(2022, 8, 4, 1, 57, 13, tzinfo=timezone.utc), {}),
+        )
+
+    def test_epoch(self):
+        result = parse(b"@1659578233", tltype="item", date_type="epoch")[0]
+        self.assertIs(type(result), EpochDate)
+        self.assertEqual(result, 1659578233)
+        self.assertEqual(result.datetime, parse(b"@1659578233", tltype="item")[0])
+
+    def test_lazy(self):
+        result = parse(b"@1659578233", tltype="item", date_type="lazy")[0]
+        self.assertIs(type(result), LazyDate)
+        self.assertEqual(result.epoch, 1659578233)
+        self.assertIsNone(result._datetime)
+        self.assertEqual(result.year, 2022)
+        self.assertEqual(result, parse(b"@1659578233", tltype="item")[0])
+        self.assertEqual(result, LazyDate(1659578233))
+        self.assertEqual(pickle.loads(pickle.dumps(result)), result)
+
+    def test_range_unchanged(self):
+        for date_type in (datetime, "epoch", "lazy"):
+            for value in (MIN_DATE, MAX_DATE):
+                result = parse(f"@{value}".encode(), tltype="item", date_type=date_type)
+                self.assertEqual(ser(result), f"@{value}")
+            for value in (MIN_DATE - 1, MAX_DATE + 1):
+                with self.assertRaises(StructuredFieldError) as cm:
+                    parse(f"@{value}".encode(), tltype="item", date_type=date_type)
+                self.assertEqual(str(cm.exception), "Date value out of range")
+        for value in (MIN_DATE - 1, MIN_DATE, MAX_DATE, MAX_DATE + 1):
+            try:
+                datetime.fromtimestamp(value, tz=timezone.utc)
+                valid = True
+            except (ValueError, OSError):
+                valid = False
+            self.assertEqual(valid, MIN_DATE <= value <= MAX_DATE)
+
+    def test_non_integer(self):
+        for decimal_type in (float, "milli"):
+            with self.assertRaises(StructuredFieldError) as cm:
+                parse(b"@1.5", tltype="item", decimal_type=decimal_type)
+            self.assertEqual(str(cm.exception), "Non-integer Date")
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            parse(b"@1", tltype="item", date_type=int)
+
+    def test_ser_and_json(self):
+        self.assertEqual(ser([EpochDate(1), LazyDate(-1)]), "@1, @-1")
+        self.assertEqual(
+            to_json([EpochDate(1), LazyDate(2)]),
+            '[{"__type": "date", "value": 1.0}, {"__type": "date", "value": 2.0}]',
+        )
+
+    def test_json_same_for_all_types(self):
+        value = b"@-62135596800, @1659578233;a=@0"
+        expected = to_json(parse(value, tltype="list"))
+        for date_type in ("epoch", "lazy"):
+            self.assertEqual(
+                to_json(parse(value, tltype="list", date_type=date_type)), expected
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
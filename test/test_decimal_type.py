@@ -0,0 +1,85 @@
+import unittest
+from decimal import Decimal
+
+from http_sf import Milli, ParseCache, StructuredFieldError, parse, ser, to_json
+
+
+class TestDecimalType(unittest.TestCase):
+    def test_default(self):
+        self.assertEqual(parse(b"1.5", tltype="item"), (Decimal("1.5"), {}))
+        self.assertIs(type(parse(b"1.5", tltype="item")[0]), Decimal)
+
+    def test_float(self):
+        result = parse(b"u=3, q=0.875;w=-1.25", tltype="dictionary", decimal_type=float)
+        self.assertEqual(result, {"u": (3, {}), "q": (0.875, {"w": -1.25})})
+        self.assertIs(type(result["q"][0]), float)
+        self.assertIs(type(result["u"][0]), int)
+
+    def test_milli(self):
+        for value, expected in [
+            (b"1.5", 1500),
+            (b"-0.001", -1),
+            (b"0.05", 50),
+            (b"-7.10", -7100),
+            (b"123456789012.345", 123456789012345),
+        ]:
+            result = parse(value, tltype="item", decimal_type="milli")[0]
+            self.assertIs(type(result), Milli)
+            self.assertEqual(result, expected)
+        self.assertIs(type(parse(b"15", tltype="item", decimal_type="milli")[0]), int)
+
+    def test_errors_unchanged(self):
+        for value in [b"1.2345", b"1234567890123.4", b"1.", b"-", b"1234567890123456"]:
+            errors = []
+            for decimal_type in (Decimal, float, "milli"):
+                with self.assertRaises(StructuredFieldError) as cm:
+                    parse(value, tltype="item", decimal_type=decimal_type)
+                errors.append((str(cm.exception), cm.exception.position))
+            self.assertEqual(len(set(errors)), 1)
+
+    def test_unknown_type(self):
+        with self.assertRaises(ValueError):
+            parse(b"1.5", tltype="item", decimal_type=int)
+
+    def test_cache_key(self):
+        cache = ParseCache()
+        parse(b"1.5", tltype="item", cache=cache)
+        self.assertIs(
+            type(parse(b"1.5", tltype="item", decimal_type=float, cache=cache)[0]),
+            float,
+        )
+
+    def test_ser(self):
+        for value in [
+            Decimal("0.875"),
+            0.875,
+            Milli(875),
+            Decimal("-2.5"),
+            -2.5,
+            Milli(-2500),
+        ]:
+            self.assertEqual(ser(value), "0.875" if value > 0 else "-2.5")
+        self.assertEqual(ser(Milli(0)), "0.0")
+        self.assertEqual(ser(-0.0), "0.0")
+        self.assertEqual(ser(-0.0001), "0.0")
+        self.assertEqual(ser(1.0005), "1.0")
+        self.assertEqual(ser(999999999999.999), "999999999999.999")
+        self.assertEqual(ser(Milli(999999999999999)), "999999999999.999")
+        for value in [1e12, Milli(10**15), float("nan"), float("inf")]:
+            with self.assertRaises(ValueError):
+                ser(value)
+
+    def test_round_trip(self):
+        value = b"a=1.5, b=-0.001, c=12.34"
+        for decimal_type in (Decimal, float, "milli"):
+            self.assertEqual(
+                ser(parse(value, tltype="dictionary", decimal_type=decimal_type)),
+                value.decode("ascii"),
+            )
+
+    def test_json(self):
+        self.assertEqual(to_json([(Milli(1500), {})]), "[[1.5, {}]]")
+
+
+if __name__ == "__main__":
+    unittest.main()
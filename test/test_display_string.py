@@ -0,0 +1,46 @@
+import unittest
+
+from http_sf import DisplayString, StructuredFieldError, parse, ser
+
+
+class TestDisplayString(unittest.TestCase):
+    def test_parse(self):
+        for value, expected in [
+            (b'%""', ""),
+            (b'%"plain text"', "plain text"),
+            (b'%"f%c3%bcr 100%25 %22="', 'für 100% "='),
+            (b'%"%e6%97%a5%e6%9c%ac"', "日本"),
+        ]:
+            result = parse(value, tltype="item")[0]
+            self.assertIs(type(result), DisplayString)
+            self.assertEqual(result, expected)
+
+    def test_errors(self):
+        for value, message, position in [
+            (b'%"abc', "Reached end of input without finding a closing DQUOTE", 5),
+            (b'%"a%C3%bc"', "Uppercase percent encoding", 4),
+            (b'%"a%g3"', "Invalid percent encoding", 4),
+            (b'%"a%3', "Incomplete percent encoding", 4),
+            (b'%"a\x7f"', "String contains disallowed character", 3),
+            (b'%"a\x1f"', "String contains disallowed character", 3),
+            (b'%"%c3%28"', "Invalid UTF-8", 8),
+        ]:
+            with self.assertRaises(StructuredFieldError) as cm:
+                parse(value, tltype="item")
+            self.assertEqual(str(cm.exception), message)
+            self.assertEqual(cm.exception.position, position)
+
+    def test_ser(self):
+        self.assertEqual(ser(DisplayString("für 100%")), '%"f%c3%bcr 100%25"')
+        self.assertEqual(ser(DisplayString('say "hi"')), '%"say %22hi%22"')
+        self.assertEqual(ser(DisplayString("a\nb")), '%"a%0ab"')
+        self.assertEqual(ser(DisplayString("\x1f\x7f")), '%"%1f%7f"')
+
+    def test_round_trip(self):
+        text = "".join(chr(char) for char in range(0x300))
+        value = ser(DisplayString(text)).encode("ascii")
+        self.assertEqual(parse(value, tltype="item")[0], text)
+
+
+if __name__ == "__main__":
+    unittest.main()
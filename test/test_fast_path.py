@@ -0,0 +1,62 @@
+import unittest
+
+from http_sf import StructuredFieldError, Token, parse
+from http_sf.dictionary import parse_simple_dictionary
+from http_sf.list import parse_simple_list
+from http_sf.state import ParserState
+
+
+class TestSimpleList(unittest.TestCase):
+    def test_matches_full_parse(self):
+        self.assertEqual(
+            parse(b"gzip, br,zstd ,\t-12, *", tltype="list"),
+            [
+                (Token("gzip"), {}),
+                (Token("br"), {}),
+                (Token("zstd"), {}),
+                (-12, {}),
+                (Token("*"), {}),
+            ],
+        )
+
+    def test_falls_back(self):
+        for value in [b"a;q=1", b"1.5", b'"a"', b"(a)", b"a,", b"", b"1a"]:
+            self.assertIsNone(parse_simple_list(ParserState(value)), value)
+
+    def test_errors_unchanged(self):
+        with self.assertRaises(StructuredFieldError) as ctx:
+            parse(b"a, b,", tltype="list")
+        self.assertEqual(ctx.exception.position, 5)
+
+
+class TestSimpleDictionary(unittest.TestCase):
+    def test_matches_full_parse(self):
+        self.assertEqual(
+            parse(b"max-age=60, public, a=?0, b=?1,c=tok", tltype="dictionary"),
+            {
+                "max-age": (60, {}),
+                "public": (True, {}),
+                "a": (False, {}),
+                "b": (True, {}),
+                "c": (Token("tok"), {}),
+            },
+        )
+
+    def test_falls_back(self):
+        for value in [b"a;p", b"a=1;p", b"a=(1)", b"A=1", b"a=1.0", b"a=?2", b"a="]:
+            self.assertIsNone(parse_simple_dictionary(ParserState(value)), value)
+
+    def test_duplicate_keys(self):
+        duplicates = []
+        result = parse(
+            b"a=1, b, a=2",
+            tltype="dictionary",
+            on_duplicate_key=lambda key, context: duplicates.append((key, context)),
+        )
+        self.assertEqual(result, {"a": (2, {}), "b": (True, {})})
+        self.assertEqual(list(result), ["a", "b"])
+        self.assertEqual(duplicates, [("a", "dictionary")])
+
+
+if __name__ == "__main__":
+    unittest.main()
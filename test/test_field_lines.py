@@ -0,0 +1,77 @@
+import unittest
+
+from http_sf import StructuredFieldError, StructuredHeaders, Token, parse
+
+
+class TestFieldLines(unittest.TestCase):
+    def test_list(self):
+        self.assertEqual(
+            parse([b"a, b", b" c;x=1 "], tltype="list"),
+            [(Token("a"), {}), (Token("b"), {}), (Token("c"), {"x": 1})],
+        )
+        self.assertEqual(parse((b"a",), tltype="list"), [(Token("a"), {})])
+
+    def test_dictionary(self):
+        duplicates = []
+
+        def callback(key, context):
+            duplicates.append((key, context))
+
+        self.assertEqual(
+            parse(
+                [b"a=1, b;a;a", b"c, a=2"],
+                tltype="dictionary",
+                on_duplicate_key=callback,
+            ),
+            {"a": (2, {}), "b": (True, {"a": True}), "c": (True, {})},
+        )
+        self.assertEqual(duplicates, [("a", "parameter"), ("a", "dictionary")])
+
+    def test_matches_combined(self):
+        for lines in [
+            [b'"a', b'b"'],
+            [b"a", b"\tb"],
+            [bytearray(b"a=1"), memoryview(b"b=(1 2)")],
+            [b"a;q=1", b"b", b"c"],
+        ]:
+            for tltype in ["list", "dictionary"]:
+                try:
+                    expected = parse(b", ".join(lines), tltype=tltype)
+                except StructuredFieldError:
+                    with self.assertRaises(StructuredFieldError):
+                        parse(lines, tltype=tltype)
+                else:
+                    self.assertEqual(parse(lines, tltype=tltype), expected)
+
+    def test_error_line(self):
+        for lines, line, position in [
+            ([b"a", b"b c"], 1, 2),
+            ([b"a", b""], 1, 0),
+            ([b"a,", b"b"], 0, 2),
+            ([b"a", b"b", b"(c"], 2, 2),
+        ]:
+            with self.assertRaises(StructuredFieldError) as cm:
+                parse(lines, tltype="list")
+            self.assertEqual(cm.exception.line, line, lines)
+            self.assertEqual(cm.exception.position, position, lines)
+        with self.assertRaises(StructuredFieldError) as cm:
+            parse(b"a b", tltype="list")
+        self.assertIsNone(cm.exception.line)
+
+    def test_bad_arguments(self):
+        with self.assertRaises(ValueError):
+            parse([], tltype="list")
+        with self.assertRaises(ValueError):
+            parse([b"a"], tltype="list", start=1)
+
+    def test_headers(self):
+        headers = StructuredHeaders(
+            [(b"accept-encoding", b"gzip"), (b"Accept-Encoding", b"br")]
+        )
+        self.assertEqual(
+            headers["accept-encoding"], [(Token("gzip"), {}), (Token("br"), {})]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+from http_sf import Item, StructuredFieldError, StructuredHeaders, Token
+
+RAW = [
+    (b"Cache-Control", b"max-age=60"),
+    (b"content-type", b"text/html"),
+    (b"cache-control", b"private"),
+    (b"X-Custom", b"a, b"),
+    (b"Priority", b"u=1,"),
+]
+
+
+class TestStructuredHeaders(unittest.TestCase):
+    def test_lazy(self):
+        headers = StructuredHeaders(RAW)
+        self.assertEqual(headers._results, {})
+        self.assertEqual(headers["content-type"], (Token("text/html"), {}))
+        self.assertEqual(list(headers._results), ["content-type"])
+        self.assertIs(headers["Content-Type"], headers["content-type"])
+
+    def test_combines_lines(self):
+        headers = StructuredHeaders(RAW)
+        self.assertEqual(headers.raw("cache-control"), b"max-age=60, private")
+        self.assertEqual(
+            headers["cache-control"], {"max-age": (60, {}), "private": (True, {})}
+        )
+
+    def test_known_types_only(self):
+        headers = StructuredHeaders(RAW)
+        self.assertEqual(list(headers), ["cache-control", "content-type", "priority"])
+        self.assertEqual(len(headers), 3)
+        self.assertNotIn("x-custom", headers)
+        self.assertNotIn("accept", headers)
+        with self.assertRaises(KeyError):
+            headers["x-custom"]
+        self.assertIsNone(headers.get("accept"))
+        self.assertEqual(headers.raw("x-custom"), b"a, b")
+
+    def test_types_override(self):
+        headers = StructuredHeaders(RAW, types={"x-custom": "list"})
+        self.assertEqual(headers["x-custom"], [(Token("a"), {}), (Token("b"), {})])
+        self.assertEqual(headers.field_type("X-Custom"), "list")
+
+    def test_errors_cached(self):
+        headers = StructuredHeaders(RAW)
+        with self.assertRaises(StructuredFieldError) as cm:
+            headers["priority"]
+        first = cm.exception
+        with self.assertRaises(StructuredFieldError) as cm:
+            headers["priority"]
+        self.assertIs(cm.exception, first)
+        self.assertEqual(first.position, 4)
+        self.assertIn("priority", headers)
+
+    def test_mapping_and_str(self):
+        headers = StructuredHeaders({"Content-Type": "text/plain"}, compact=True)
+        self.assertIs(type(headers["content-type"]), Item)
+        with self.assertRaises(ValueError):
+            StructuredHeaders(RAW, decimal_type=int)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import unittest
+
+from http_sf import IncrementalParser, StructuredFieldError, Token, parse
+
+
+def feed_all(parser, value, size):
+    members = []
+    for i in range(0, len(value), size):
+        members.extend(parser.feed(value[i : i + size]))
+    members.extend(parser.close())
+    return members
+
+
+class TestIncrementalParser(unittest.TestCase):
+    def test_members_as_they_complete(self):
+        parser = IncrementalParser("list")
+        self.assertEqual(parser.feed(b'a, "b,'), [(Token("a"), {})])
+        self.assertEqual(parser.feed(b' c"'), [])
+        self.assertEqual(parser.feed(b";q=1, (d"), [("b, c", {"q": 1})])
+        self.assertEqual(parser.feed(b")"), [])
+        self.assertEqual(parser.close(), [([(Token("d"), {})], {})])
+
+    def test_matches_parse(self):
+        for tltype, value in [
+            ("list", b' a;q=0.5, "x, y", :AAA=:, (b c);d, %"x, y" , 1'),
+            ("list", b""),
+            ("list", b'"a\\", b\\\\", c, "\\\\", (":" d);e=":,"'),
+            ("dictionary", b"a=1, b;x=?0, c=(1 2), a=:AA==:, d"),
+        ]:
+            expected = parse(value, tltype=tltype)
+            for size in [1, 2, 5, len(value) or 1]:
+                members = feed_all(IncrementalParser(tltype), value, size)
+                if tltype == "dictionary":
+                    members = dict(members)
+                self.assertEqual(members, expected, (value, size))
+
+    def test_errors_match_parse(self):
+        for tltype, value in [
+            ("list", b"a, b c"),
+            ("list", b"a,"),
+            ("list", b"a, ,b"),
+            ("list", b'a, "b'),
+            ("dictionary", b""),
+            ("dictionary", b"a=1, ;"),
+            ("dictionary", b"a=1, ;x"),
+            ("dictionary", b"a=1;, b"),
+        ]:
+            with self.assertRaises(StructuredFieldError) as cm:
+                parse(value, tltype=tltype)
+            expected = cm.exception
+            for size in [1, 3]:
+                with self.assertRaises(StructuredFieldError) as cm:
+                    feed_all(IncrementalParser(tltype), value, size)
+                self.assertEqual(str(cm.exception), str(expected), value)
+                self.assertEqual(cm.exception.position, expected.position, value)
+
+    def test_duplicates(self):
+        duplicates = []
+
+        def callback(key, context):
+            duplicates.append((key, context))
+
+        parser = IncrementalParser("dictionary", on_duplicate_key=callback)
+        feed_all(parser, b"a;x;x, b, a", 1)
+        self.assertEqual(duplicates, [("x", "parameter"), ("a", "dictionary")])
+
+    def test_limits(self):
+        parser = IncrementalParser("list", max_size=10)
+        parser.feed(b"a, b, ")
+        with self.assertRaises(StructuredFieldError) as cm:
+            parser.feed(b"c, d, ")
+        self.assertEqual(cm.exception.position, 10)
+        with self.assertRaises(ValueError):
+            parser.feed(b"e")
+        parser = IncrementalParser("list", max_member_size=4)
+        self.assertEqual(parser.feed(b"abcd, "), [(Token("abcd"), {})])
+        with self.assertRaises(StructuredFieldError) as cm:
+            parser.feed(b'"abcd')
+        self.assertEqual(cm.exception.position, 10)
+
+    def test_options(self):
+        parser = IncrementalParser("list", compact=True, decimal_type=float)
+        self.assertEqual(feed_all(parser, b"1.5;a", 2)[0].value, 1.5)
+        with self.assertRaises(ValueError):
+            IncrementalParser("item")
+        with self.assertRaises(ValueError):
+            IncrementalParser("list", decimal_type=int)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+
+import http_sf.intern
+import http_sf.util
+from http_sf import Token, parse
+
+
+class TestIntern(unittest.TestCase):
+    def test_vocabulary_shared(self):
+        first = parse(b"max-age=60, public", tltype="dictionary")
+        second = parse(bytearray(b"max-age=30"), tltype="dictionary")
+        self.assertIs(list(first)[0], list(second)[0])
+        self.assertIs(list(first)[0], http_sf.intern.KEYS[b"max-age"])
+        first = parse(b"gzip;q=1, br", tltype="list")
+        second = parse(b"br, gzip", tltype="list")
+        self.assertIs(first[0][0], second[1][0])
+        self.assertIs(first[1][0], second[0][0])
+        self.assertIs(list(first[0][1])[0], http_sf.intern.KEYS[b"q"])
+
+    def test_field_names_shared(self):
+        result = parse(b'accept-encoding, "x";a', tltype="list")
+        self.assertIs(result[0][0], http_sf.intern.TOKENS[b"accept-encoding"])
+
+    def test_other_values_not_interned(self):
+        first = parse(b"xyzzy;plugh", tltype="item")
+        second = parse(b"xyzzy;plugh=1", tltype="item")
+        self.assertEqual(first[0], second[0])
+        self.assertIsNot(first[0], second[0])
+        self.assertNotIn(b"xyzzy", http_sf.intern.TOKENS)
+        self.assertNotIn(b"plugh", http_sf.intern.KEYS)
+
+    def test_add_vocabulary(self):
+        try:
+            http_sf.intern.add_vocabulary(["frobozz", "Zork"])
+            first = parse(b"frobozz;zork, Zork", tltype="list")
+            second = parse(b"Zork;frobozz, frobozz", tltype="list")
+            self.assertIs(first[0][0], second[1][0])
+            self.assertIs(first[1][0], second[0][0])
+            self.assertIs(list(second[0][1])[0], http_sf.intern.KEYS[b"frobozz"])
+            self.assertNotIn(b"Zork", http_sf.intern.KEYS)
+        finally:
+            http_sf.intern.reset()
+        self.assertNotIn(b"frobozz", http_sf.intern.TOKENS)
+        self.assertIn(b"max-age", http_sf.intern.KEYS)
+
+    def test_compat_keys_lowercased(self):
+        http_sf.util.COMPAT = True
+        try:
+            self.assertEqual(
+                parse(b"Max-Age=1", tltype="dictionary"), {"max-age": (1, {})}
+            )
+        finally:
+            http_sf.util.COMPAT = False
+
+
+if __name__ == "__main__":
+    unittest.main()
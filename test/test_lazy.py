@@ -0,0 +1,110 @@
+import unittest
+
+from http_sf import StructuredFieldError, Token, parse, parse_lazy
+from http_sf.lazy import find_member_end
+
+
+class TestFindMemberEnd(unittest.TestCase):
+    def test_boundaries(self):
+        cases = [
+            (b"a, b", 1),
+            (b'"a,b", c', 5),
+            (b'"a\\",b", c', 7),
+            (b'%"a,\\", c', 6),
+            (b":YSxi:, c", 6),
+            (b"a:b,c", 3),
+            (b'(a "b,c" d);e="f,g", h', 19),
+            (b"a", 1),
+            (b'"unterminated, a', 16),
+        ]
+        for value, end in cases:
+            self.assertEqual(find_member_end(value, 0), end, value)
+
+
+class TestLazyDictionary(unittest.TestCase):
+    def test_access(self):
+        value = b'max-age=60, private="a, b", no-store, x=(1 2);p'
+        lazy = parse_lazy(value, name="Cache-Control")
+        self.assertEqual(list(lazy), ["max-age", "private", "no-store", "x"])
+        self.assertEqual(lazy["max-age"], (60, {}))
+        self.assertEqual(lazy["private"], ("a, b", {}))
+        self.assertIn("no-store", lazy)
+        self.assertNotIn("public", lazy)
+        self.assertEqual(dict(lazy), parse(value, tltype="dictionary"))
+
+    def test_error_on_access(self):
+        lazy = parse_lazy(b"a=1, b=?2, c=3", tltype="dictionary")
+        self.assertEqual(lazy["a"], (1, {}))
+        self.assertEqual(lazy["c"], (3, {}))
+        with self.assertRaises(StructuredFieldError) as ctx:
+            lazy["b"]
+        self.assertEqual(ctx.exception.position, 7)
+        self.assertEqual(ctx.exception.context, "b")
+
+    def test_key_errors_up_front(self):
+        with self.assertRaises(StructuredFieldError) as ctx:
+            parse_lazy(b"a=1, B=2", tltype="dictionary")
+        self.assertEqual(ctx.exception.position, 5)
+        with self.assertRaises(StructuredFieldError):
+            parse_lazy(b"a=1,", tltype="dictionary")
+
+    def test_strict(self):
+        with self.assertRaises(StructuredFieldError) as ctx:
+            parse_lazy(b"a=1, b=?2, c=3", tltype="dictionary", strict=True)
+        self.assertEqual(ctx.exception.position, 7)
+
+    def test_duplicates(self):
+        duplicates = []
+        lazy = parse_lazy(
+            b"a=1, b, a=2",
+            tltype="dictionary",
+            on_duplicate_key=lambda key, context: duplicates.append((key, context)),
+        )
+        self.assertEqual(duplicates, [("a", "dictionary")])
+        self.assertEqual(list(lazy.items()), [("a", (2, {})), ("b", (True, {}))])
+
+    def test_overridden_member_is_checked(self):
+        lazy = parse_lazy(b"a=?x, b=2, a=1", tltype="dictionary")
+        self.assertEqual(lazy["b"], (2, {}))
+        with self.assertRaises(StructuredFieldError) as ctx:
+            lazy["a"]
+        self.assertEqual(ctx.exception.position, 2)
+        with self.assertRaises(StructuredFieldError):
+            dict(lazy)
+        with self.assertRaises(StructuredFieldError):
+            parse_lazy(b"a=?x, a=1", tltype="dictionary", strict=True)
+        lazy = parse_lazy(b"a=?0, a=1", tltype="dictionary")
+        self.assertEqual(lazy["a"], (1, {}))
+
+
+class TestLazyList(unittest.TestCase):
+    def test_access(self):
+        value = b'a, "b,c";q=1, (d e), :ZA==:'
+        lazy = parse_lazy(value, tltype="list")
+        self.assertEqual(len(lazy), 4)
+        self.assertEqual(lazy[1], ("b,c", {"q": 1}))
+        self.assertEqual(lazy[-1], (b"d", {}))
+        self.assertEqual(lazy[:1], [(Token("a"), {})])
+        self.assertEqual(lazy, parse(value, tltype="list"))
+
+    def test_empty(self):
+        self.assertEqual(len(parse_lazy(b"", tltype="list")), 0)
+
+    def test_error_on_access(self):
+        lazy = parse_lazy(b"a, b c, d", tltype="list")
+        self.assertEqual(lazy[2], (Token("d"), {}))
+        with self.assertRaises(StructuredFieldError) as ctx:
+            lazy[1]
+        self.assertEqual(ctx.exception.position, 5)
+
+    def test_structural_errors_up_front(self):
+        for value in [b"a,", b"a,,b"]:
+            with self.assertRaises(StructuredFieldError):
+                parse_lazy(value, tltype="list")
+
+    def test_item_is_parsed(self):
+        self.assertEqual(parse_lazy(b"a;b", tltype="item"), (Token("a"), {"b": True}))
+
+
+if __name__ == "__main__":
+    unittest.main()
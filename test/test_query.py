@@ -0,0 +1,66 @@
+import unittest
+
+from http_sf import StructuredFieldError, Token, contains_token, get_member, parse
+
+
+class TestGetMember(unittest.TestCase):
+    value = b'max-age=60, private="set-cookie", no-store, x=:ZA==:;p=@0, y=(1 2)'
+
+    def test_found(self):
+        self.assertEqual(get_member(self.value, "max-age"), (60, {}))
+        self.assertEqual(get_member(self.value, "private"), ("set-cookie", {}))
+        self.assertEqual(get_member(self.value, "no-store"), (True, {}))
+        self.assertEqual(get_member(self.value, "y"), ([(1, {}), (2, {})], {}))
+        self.assertEqual(
+            get_member(self.value, "x"), parse(self.value, tltype="dictionary")["x"]
+        )
+
+    def test_missing(self):
+        self.assertIsNone(get_member(self.value, "public"))
+
+    def test_last_duplicate_wins(self):
+        self.assertEqual(get_member(b"a=1, b, a=2;p", "a"), (2, {"p": True}))
+
+    def test_name(self):
+        self.assertEqual(get_member(b"u=1, i", "i", name="Priority"), (True, {}))
+        with self.assertRaises(KeyError):
+            get_member(b"a", "a", name="Accept")
+
+    def test_invalid_elsewhere(self):
+        for value, position in [
+            (b"max-age=60, x=?2", 14),
+            (b"max-age=60, x=1,", 16),
+            (b"max-age=60, x=@1.5", 18),
+            (b"max-age=60 public", 11),
+            (b"max-age=60, X=1", 12),
+        ]:
+            with self.assertRaises(StructuredFieldError) as ctx:
+                get_member(value, "max-age")
+            with self.assertRaises(StructuredFieldError) as full:
+                parse(value, tltype="dictionary")
+            self.assertEqual(ctx.exception.position, position, value)
+            self.assertEqual(str(ctx.exception), str(full.exception))
+
+
+class TestContainsToken(unittest.TestCase):
+    def test_found(self):
+        value = b'gzip;q=1.0, "br", (br), zstd, :YnI=:'
+        self.assertTrue(contains_token(value, "gzip"))
+        self.assertTrue(contains_token(value, "zstd"))
+        self.assertFalse(contains_token(value, "br"))
+        self.assertFalse(contains_token(value, "gz"))
+        self.assertFalse(contains_token(b"", "gzip"))
+
+    def test_name(self):
+        self.assertTrue(contains_token(b"gzip, br", "br", name="Accept-Encoding"))
+
+    def test_invalid_elsewhere(self):
+        with self.assertRaises(StructuredFieldError) as ctx:
+            contains_token(b"gzip, br,", "gzip")
+        self.assertEqual(ctx.exception.position, 9)
+        with self.assertRaises(StructuredFieldError):
+            contains_token(b"gzip, %\"%A9\"", "gzip")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+import unittest
+from decimal import Decimal
+from typing import NamedTuple
+
+from http_sf import (
+    FieldSchema,
+    MemberSchema,
+    StructuredFieldError,
+    Token,
+    compile_schema,
+    parse,
+)
+from http_sf.schema import schema_for
+
+
+class Priority(NamedTuple):
+    u: int
+    i: bool
+
+
+PRIORITY = FieldSchema(
+    "dictionary",
+    {
+        "u": MemberSchema(int, minimum=0, maximum=7, default=3),
+        "i": MemberSchema(bool, default=False),
+    },
+    factory=Priority,
+)
+
+
+class TestSchema(unittest.TestCase):
+    def test_priority(self):
+        for value, expected in [
+            (b"u=1, i", Priority(1, True)),
+            (b"i=?0", Priority(3, False)),
+            (b"u=5;x=1, other=(a b), i", Priority(5, True)),
+            (b"u=9", Priority(3, False)),
+            (b"u=1.0", Priority(3, False)),
+            (b"u=(1), i=1", Priority(3, False)),
+            (b"u=1, u=8", Priority(3, False)),
+            (bytearray(b" u=7 "), Priority(7, False)),
+        ]:
+            self.assertEqual(PRIORITY.parse(value), expected, value)
+
+    def test_syntax_errors_unchanged(self):
+        for value in [b"u=1,", b"u=1 i", b"u=?2", b"U=1", b"", b"u=1, i;", b"u=1;"]:
+            with self.assertRaises(StructuredFieldError) as cm:
+                parse(value, tltype="dictionary")
+            expected = cm.exception
+            with self.assertRaises(StructuredFieldError) as cm:
+                PRIORITY.parse(value)
+            self.assertEqual(str(cm.exception), str(expected))
+            self.assertEqual(cm.exception.position, expected.position)
+            self.assertEqual(cm.exception.context, expected.context)
+
+    def test_strict(self):
+        schema = FieldSchema(
+            "dictionary",
+            {"u": MemberSchema(int, minimum=0, maximum=7)},
+            strict=True,
+        )
+        self.assertEqual(schema.parse(b"u=2"), {"u": 2})
+        self.assertEqual(schema.parse(b"u=2;a"), {"u": 2})
+        for value, message, position in [
+            (b"u=8", "Invalid value for 'u'", 2),
+            (b"u=2, x=1", "Unknown key 'x'", 5),
+            (b"u", "Invalid value for 'u'", 1),
+        ]:
+            with self.assertRaises(StructuredFieldError) as cm:
+                schema.parse(value)
+            self.assertEqual(str(cm.exception), message)
+            self.assertEqual(cm.exception.position, position)
+
+    def test_params(self):
+        schema = FieldSchema(
+            "list",
+            member=MemberSchema(
+                Token,
+                values=["gzip", "br"],
+                params={"q": MemberSchema(Decimal, minimum=0, maximum=1, default=1)},
+            ),
+        )
+        self.assertEqual(
+            schema.parse(b"gzip;q=0.5;x, deflate, br;q=2, (a), 1"),
+            [(Token("gzip"), {"q": Decimal("0.5")}), (Token("br"), {"q": 1})],
+        )
+        strict = FieldSchema("list", member=schema.member, strict=True)
+        for value, message in [
+            (b"gzip;x", "Unknown parameter 'x'"),
+            (b"gzip;q=?1", "Invalid value for parameter 'q'"),
+            (b"gzip, deflate", "Invalid list member"),
+        ]:
+            with self.assertRaises(StructuredFieldError) as cm:
+                strict.parse(value)
+            self.assertEqual(str(cm.exception), message)
+
+    def test_item(self):
+        schema = FieldSchema("item", member=MemberSchema(int, minimum=0))
+        self.assertEqual(schema.parse(b"60"), 60)
+        self.assertIsNone(schema.parse(b"-1"))
+        self.assertIsNone(schema.parse(b"a;b"))
+        for value in [b"", b"(1)", b"1, 2"]:
+            with self.assertRaises(StructuredFieldError):
+                schema.parse(value)
+
+    def test_dict_result(self):
+        schema = schema_for(
+            "Cache-Control",
+            members={
+                "max-age": MemberSchema(int, minimum=0),
+                "no-store": MemberSchema(bool, default=False),
+            },
+        )
+        self.assertEqual(
+            schema.parse(b"max-age=60, private"), {"max-age": 60, "no-store": False}
+        )
+
+    def test_factory_keys(self):
+        schema = FieldSchema(
+            "dictionary",
+            {
+                "a.b": MemberSchema(int),
+                "*k": MemberSchema(bool),
+                "in": MemberSchema(int),
+                "max-age": MemberSchema(int),
+            },
+            factory=dict,
+        )
+        self.assertEqual(
+            schema.parse(b"a.b=1, *k, in=2, max-age=3"),
+            {"a.b": 1, "*k": True, "in": 2, "max_age": 3},
+        )
+
+    def test_compiled_once(self):
+        other = FieldSchema(
+            "dictionary",
+            {
+                "u": MemberSchema(int, minimum=0, maximum=7, default=3),
+                "i": MemberSchema(bool, default=False),
+            },
+            factory=Priority,
+        )
+        self.assertIs(compile_schema(PRIORITY), compile_schema(other))
+
+    def test_defaults_of_different_types(self):
+        one = FieldSchema("dictionary", {"u": MemberSchema(int, default=1)})
+        true = FieldSchema("dictionary", {"u": MemberSchema(int, default=True)})
+        self.assertNotEqual(one, true)
+        self.assertEqual(one.parse(b"x"), {"u": 1})
+        self.assertIs(true.parse(b"x")["u"], True)
+        self.assertNotEqual(
+            MemberSchema(str, default="()"), MemberSchema(str, default=())
+        )
+
+    def test_bad_schemas(self):
+        with self.assertRaises(ValueError):
+            MemberSchema(list)
+        with self.assertRaises(ValueError):
+            MemberSchema(int, default=[])
+        with self.assertRaises(ValueError):
+            FieldSchema("dictionary", {"U": MemberSchema(int)})
+        with self.assertRaises(ValueError):
+            FieldSchema("list", {"u": MemberSchema(int)})
+        with self.assertRaises(ValueError):
+            FieldSchema("header", member=MemberSchema(int))
+
+
+if __name__ == "__main__":
+    unittest.main()
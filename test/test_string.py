@@ -0,0 +1,34 @@
+import unittest
+
+from http_sf import StructuredFieldError, parse
+
+
+class TestString(unittest.TestCase):
+    def test_parse(self):
+        for value, expected in [
+            (b'""', ""),
+            (b'"' + b"a" * 1000 + b'"', "a" * 1000),
+            (b'"a \\"b\\" \\\\c\\\\"', 'a "b" \\c\\'),
+            (b'"\\"\\""', '""'),
+        ]:
+            self.assertEqual(parse(value, tltype="item")[0], expected)
+            self.assertEqual(parse(bytearray(value), tltype="item")[0], expected)
+
+    def test_errors(self):
+        for value, message, position, offending_char in [
+            (b'"abc', "Reached end of input without finding a closing DQUOTE", 4, None),
+            (b'"ab\\', "Last character of input was a backslash", 4, None),
+            (b'"ab\\n"', "Backslash before disallowed character 'n'", 4, ord("n")),
+            (b'"ab\\"c\x7f"', "String contains disallowed character", 6, 0x7F),
+            (b'"ab\x1f"', "String contains disallowed character", 3, 0x1F),
+            (b'"ab\xc3"', "String contains disallowed character", 3, 0xC3),
+        ]:
+            with self.assertRaises(StructuredFieldError) as cm:
+                parse(value, tltype="item")
+            self.assertEqual(str(cm.exception), message)
+            self.assertEqual(cm.exception.position, position)
+            self.assertEqual(cm.exception.offending_char, offending_char)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+import http_sf.util
+from http_sf import Token, register_keys, register_tokens, ser, ser_bytes
+from http_sf.token import VALID_TOKENS
+from http_sf.util import VALID_KEYS
+
+
+class TestTrustedSerialisation(unittest.TestCase):
+    def tearDown(self):
+        http_sf.util.FORCE_VALIDATION = False
+        VALID_KEYS.clear()
+        VALID_TOKENS.clear()
+
+    def test_same_output(self):
+        structure = {
+            "a": (Token("b"), {"c": "d \\ \"e\""}),
+            "f": ([Token("g"), (1, {"h": True})], {}),
+            "i": (True, {"j": 2.5}),
+        }
+        self.assertEqual(ser(structure, validate=False), ser(structure))
+        self.assertEqual(ser_bytes(structure, validate=False), ser_bytes(structure))
+
+    def test_skips_checks(self):
+        self.assertEqual(ser({"A": Token("b c")}, validate=False), "A=b c")
+        self.assertEqual(ser(["\n"], validate=False), '"\n"')
+
+    def test_other_types_still_checked(self):
+        with self.assertRaises(ValueError):
+            ser([10**16], validate=False)
+
+    def test_force_validation(self):
+        http_sf.util.FORCE_VALIDATION = True
+        with self.assertRaises(ValueError):
+            ser({"A": 1}, validate=False)
+        with self.assertRaises(ValueError):
+            ser([Token("b c")], validate=False)
+        with self.assertRaises(ValueError):
+            ser(["\n"], validate=False)
+
+    def test_register_keys(self):
+        register_keys(["max-age", "public"])
+        self.assertIn("max-age", VALID_KEYS)
+        self.assertEqual(ser({"max-age": 60, "public": (True, {})}), "max-age=60, public")
+        with self.assertRaises(ValueError):
+            register_keys(["ok", "Not-OK"])
+        self.assertNotIn("ok", VALID_KEYS)
+
+    def test_register_tokens(self):
+        register_tokens(["gzip", Token("br")])
+        self.assertEqual(VALID_TOKENS, {"gzip", "br"})
+        self.assertEqual(ser([Token("gzip"), Token("br")]), "gzip, br")
+        with self.assertRaises(ValueError):
+            register_tokens(["not a token"])
+
+
+if __name__ == "__main__":
+    unittest.main()
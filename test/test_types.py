@@ -0,0 +1,70 @@
+import pickle
+import unittest
+
+from http_sf import DisplayString, Token, from_json, parse, ser, to_json
+from http_sf.bare_item import _ser_map
+
+
+class TestStringTypes(unittest.TestCase):
+    """
+    Token and DisplayString behave as they did when they were UserStrings.
+    """
+
+    def test_repr(self):
+        self.assertEqual(repr(Token("abc")), 'Token("abc")')
+        self.assertEqual(repr(DisplayString("abc")), 'Token("abc")')
+
+    def test_str_and_data(self):
+        for cls in (Token, DisplayString):
+            value = cls("abc")
+            self.assertIs(type(str(value)), str)
+            self.assertEqual(str(value), "abc")
+            self.assertIs(type(value.data), str)
+            self.assertEqual(value.data, "abc")
+            self.assertFalse(hasattr(value, "__dict__"))
+
+    def test_comparison_and_hashing(self):
+        self.assertEqual(Token("abc"), Token("abc"))
+        self.assertEqual(Token("abc"), "abc")
+        self.assertNotEqual(Token("abc"), Token("abd"))
+        self.assertLess(Token("abc"), Token("abd"))
+        self.assertEqual(len(Token("abc")), 3)
+        self.assertIn("b", Token("abc"))
+        self.assertEqual({Token("abc"): 1}[Token("abc")], 1)
+        self.assertEqual({Token("abc"): 1}["abc"], 1)
+
+    def test_ser_distinguishes_types(self):
+        self.assertIn(Token, _ser_map)
+        self.assertIn(DisplayString, _ser_map)
+        self.assertEqual(ser([Token("a"), "a", DisplayString("a")]), 'a, "a", %"a"')
+        with self.assertRaises(ValueError):
+            ser(Token("a b"))
+
+    def test_parse_types(self):
+        result = parse(b'a, "a", %"a"', tltype="list")
+        self.assertEqual(
+            [type(member[0]) for member in result], [Token, str, DisplayString]
+        )
+
+    def test_json(self):
+        structure = [(Token("a"), {"b": DisplayString("c")}), ("d", {})]
+        self.assertEqual(
+            to_json(structure),
+            '[[{"__type": "token", "value": "a"}, '
+            '{"b": {"__type": "displaystring", "value": "c"}}], ["d", {}]]',
+        )
+        result = from_json(
+            f'[{{"expected": {to_json(structure)}, "header_type": "list"}}]'
+        )
+        self.assertEqual(type(result[0]["expected"][0][0]), Token)
+        self.assertEqual(type(result[0]["expected"][0][1]["b"]), DisplayString)
+
+    def test_pickle(self):
+        for value in (Token("abc"), DisplayString("abc")):
+            copy = pickle.loads(pickle.dumps(value))
+            self.assertIs(type(copy), type(value))
+            self.assertEqual(copy, value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import io
+import unittest
+
+from http_sf import Token, parse, ser, ser_bytes, ser_into
+
+
+class TestWriter(unittest.TestCase):
+    cases = [
+        (b"a, b;q=5, c", "list"),
+        (b"(a b);x, (), 1.5", "list"),
+        (b'a=1, b;p=?0, c=(x y);z, d=%"caf%c3%a9"', "dictionary"),
+        (b'"foo";bar=:AQI=:;baz=@1659578233', "item"),
+    ]
+
+    def test_matches_ser(self):
+        for value, tltype in self.cases:
+            for compact in (False, True):
+                structure = parse(value, tltype=tltype, compact=compact)
+                self.assertEqual(ser_bytes(structure), ser(structure).encode("ascii"))
+
+    def test_bare_items(self):
+        self.assertEqual(
+            ser_bytes([5, 6, (7, {"with": "param"})]), b'5, 6, 7;with="param"'
+        )
+        self.assertEqual(ser_bytes({"a": (True, {}), "b": False}), b"a, b=?0")
+        self.assertEqual(ser_bytes(Token("x")), b"x")
+
+    def test_bare_inner_lists(self):
+        for structure in ([[1, 2], 3], {"a": [1, 2]}, [[1, (2, {"p": 3})], []]):
+            self.assertEqual(ser_bytes(structure), ser(structure).encode("ascii"))
+
+    def test_direct_items(self):
+        for structure in (
+            ['a"b\\c', Token("a:b/c*"), -999_999_999_999_999, Token("unregistered")],
+            [(Token("x"), {"k": Token("y*"), "s": ""})],
+        ):
+            for validate in (True, False):
+                self.assertEqual(
+                    ser_bytes(structure, validate=validate),
+                    ser(structure, validate=validate).encode("ascii"),
+                )
+        for invalid in ("caf\u00e9", "\n", Token("1a"), Token("caf\u00e9"), 10**15):
+            with self.assertRaises(ValueError):
+                ser_bytes([invalid])
+
+    def test_appends_to_bytearray(self):
+        out = bytearray(b"Accept: ")
+        ser_into([Token("text/html")], out)
+        self.assertEqual(out, b"Accept: text/html")
+
+    def test_stream(self):
+        out = io.BytesIO()
+        writer = io.BufferedWriter(out)
+        ser_into({"a": 1}, writer)
+        writer.flush()
+        self.assertEqual(out.getvalue(), b"a=1")
+
+    def test_error_restores_bytearray(self):
+        out = bytearray(b"X: ")
+        with self.assertRaises(ValueError):
+            ser_into([Token("a"), "\n"], out)
+        self.assertEqual(out, b"X: ")
+
+    def test_empty(self):
+        with self.assertRaises(ValueError):
+            ser_bytes([])
+        with self.assertRaises(ValueError):
+            ser_bytes({})
+
+
+if __name__ == "__main__":
+    unittest.main()